@@ -1,34 +1,254 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from flask import Flask
 from flask_cors import CORS
+from sqlalchemy.engine import Engine
+from werkzeug.middleware.proxy_fix import ProxyFix
 from app.config import Config, get_settings
 from app.models.base import db
+from app.models.routing import ReplicaRouter
 from app.repositories.rental_partner_repository import RentalPartnerRepository
+from app.repositories.cached_rental_partner_repository import (
+    CachedRentalPartnerRepository,
+)
+from app.repositories.revoked_token_repository import RevokedTokenRepository
 from app.services.auth_service import AuthService
+from app.services.token_revocation_service import TokenRevocationService
+from app.services.registered_email_index import RegisteredEmailIndex
+from app.services.partner_import_service import PartnerImportService
+from app.services.partner_export_service import PartnerExportService
+from app.services.partner_listing_service import PartnerListingService
+from app.services.partner_search_index import PartnerSearchIndex
+from app.commands.token_commands import create_token_commands
+from app.commands.partner_commands import create_partner_commands
 from app.routes.auth_routes import create_auth_routes
+from app.routes.jwks_routes import create_jwks_routes
+from app.routes.introspection_routes import create_introspection_routes
+from app.routes.admin_routes import create_admin_routes
+from app.routes.metrics_routes import create_metrics_routes
+from app.utils.compression import register_compression
 from app.utils.errors import register_error_handlers
 from app.utils.logging import setup_request_logging
+from app.utils.hashing_executor import HashingExecutor
+from app.utils.json_provider import create_json_provider
+from app.utils.hashing import create_hasher_registry
+from app.utils.security import configure_hashing_executor, configure_password_hashers
+from app.utils.signing_keys import KeyRing, load_key_ring
+from app.utils.pool_metrics import PoolMetrics
+from app.utils.rate_limit import SlidingWindowLimiter, create_rate_limit_backend
+from app.utils.tokens import TokenMinter, TokenVerifier
 from flask_migrate import Migrate
 
 
+def register_http_handling(app: Flask, config: Config) -> None:
+    """Set up proxy headers, CORS, error bodies, request ids and compression."""
+    if config.PROXY_FIX_X_FOR > 0:
+        app.wsgi_app = ProxyFix(  # type: ignore[method-assign]
+            app.wsgi_app, x_for=config.PROXY_FIX_X_FOR
+        )
+    CORS(app, resources={r"/api/*": {"origins": "http://localhost:8081"}})
+    register_error_handlers(app)
+    setup_request_logging(app)
+    if config.COMPRESSION_ENABLED:
+        register_compression(
+            app, config.COMPRESSION_ENCODINGS.split(","), config.COMPRESSION_MIN_BYTES
+        )
+
+
+def create_sign_in_rate_limiters(
+    config: Config,
+) -> Tuple[Optional[SlidingWindowLimiter], Optional[SlidingWindowLimiter]]:
+    """Create the per-client and per-account sign-in limiters, if enabled."""
+    if not config.RATE_LIMIT_ENABLED:
+        return None, None
+    backend = create_rate_limit_backend(
+        config.RATE_LIMIT_BACKEND, config.RATE_LIMIT_SHARED_SLOTS
+    )
+    ip_rate_limiter = SlidingWindowLimiter(
+        backend,
+        limit=config.SIGNIN_IP_LIMIT,
+        window_seconds=config.SIGNIN_IP_WINDOW_SECONDS,
+        prefix="signin:ip:",
+    )
+    email_rate_limiter = SlidingWindowLimiter(
+        backend,
+        limit=config.SIGNIN_EMAIL_LIMIT,
+        window_seconds=config.SIGNIN_EMAIL_WINDOW_SECONDS,
+        prefix="signin:email:",
+    )
+    return ip_rate_limiter, email_rate_limiter
+
+
+def register_token_routes(
+    app: Flask,
+    config: Config,
+    auth_service: AuthService,
+    token_verifier: TokenVerifier,
+    key_ring: KeyRing,
+) -> None:
+    """Register the auth routes, the JWKS and, if enabled, introspection."""
+    ip_rate_limiter, email_rate_limiter = create_sign_in_rate_limiters(config)
+    auth_bp = create_auth_routes(
+        auth_service,
+        token_verifier,
+        ip_rate_limiter=ip_rate_limiter,
+        email_rate_limiter=email_rate_limiter,
+    )
+    app.register_blueprint(auth_bp, url_prefix="/api/auth")
+    app.register_blueprint(
+        create_jwks_routes(key_ring, max_age=config.JWKS_MAX_AGE_SECONDS)
+    )
+    if config.INTROSPECTION_API_KEY:
+        app.register_blueprint(
+            create_introspection_routes(token_verifier, config.INTROSPECTION_API_KEY),
+            url_prefix="/api/auth",
+        )
+
+
+def create_replica_router(
+    config: Config, replica_engines: Dict[str, Engine]
+) -> Optional[ReplicaRouter]:
+    """Create the read replica router, if replicas are configured."""
+    if not replica_engines:
+        return None
+    router = ReplicaRouter(
+        list(replica_engines),
+        stickiness_seconds=config.READ_YOUR_WRITES_SECONDS,
+        retry_seconds=config.REPLICA_RETRY_SECONDS,
+    )
+    for name, engine in replica_engines.items():
+        router.watch(name, engine)
+    return router
+
+
+def create_rental_partner_repository(config: Config) -> RentalPartnerRepository:
+    """Create the rental partner repository, cached if enabled."""
+    if not config.PARTNER_CACHE_ENABLED:
+        return RentalPartnerRepository()
+    return CachedRentalPartnerRepository(
+        max_bytes=config.PARTNER_CACHE_MAX_BYTES,
+        ttl_seconds=config.PARTNER_CACHE_TTL_SECONDS,
+    )
+
+
+def register_metrics_routes(app: Flask, engine: Engine, api_key: str) -> None:
+    """Expose the metrics of every component that keeps them."""
+    extensions = app.extensions
+    sources = {
+        "database_pool": lambda: extensions["pool_metrics"].snapshot(engine),
+    }
+    for name, extension in (
+        ("token_cache", "token_verifier"),
+        ("revocation_filter", "revocation_service"),
+        ("hashing_pool", "hashing_executor"),
+        ("email_index", "email_index"),
+        ("replicas", "replica_router"),
+        ("partner_cache", "partner_cache"),
+        ("search_index", "search_index"),
+    ):
+        if extensions.get(extension) is not None:
+            sources[name] = extensions[extension].metrics
+    app.register_blueprint(create_metrics_routes(sources, api_key))
+
+
 def create_app(config: Optional[Config] = None) -> Flask:
     app = Flask(__name__)
 
     if config is None:
         config = get_settings()
+    app.json = create_json_provider(app, config.JSON_PROVIDER)
 
     app.config["SQLALCHEMY_DATABASE_URI"] = config.DATABASE_URL
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = config.DATABASE_ENGINE_OPTIONS
+    app.config["SQLALCHEMY_BINDS"] = config.DATABASE_BINDS
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
     app.config["SECRET_KEY"] = config.SECRET_KEY
 
     db.init_app(app)
     Migrate(app, db)
-    CORS(app, resources={r"/api/*": {"origins": "http://localhost:8081"}})
 
-    register_error_handlers(app)
-    setup_request_logging(app)
+    pool_metrics = PoolMetrics()
+    with app.app_context():
+        engine = db.engine
+        replica_engines = {name: db.engines[name] for name in config.DATABASE_BINDS}
+    pool_metrics.instrument(engine)
+    app.extensions["pool_metrics"] = pool_metrics
+
+    app.extensions["replica_router"] = create_replica_router(config, replica_engines)
+    register_http_handling(app, config)
+
+    configure_password_hashers(
+        create_hasher_registry(
+            algorithm=config.PASSWORD_HASHER,
+            bcrypt_rounds=config.BCRYPT_ROUNDS,
+            argon2_time_cost=config.ARGON2_TIME_COST,
+            argon2_memory_cost=config.ARGON2_MEMORY_COST,
+            argon2_parallelism=config.ARGON2_PARALLELISM,
+            target_ms=config.PASSWORD_HASH_TARGET_MS,
+        )
+    )
+
+    hashing_executor = None
+    if config.HASHING_WORKERS > 0:
+        hashing_executor = HashingExecutor(
+            max_workers=config.HASHING_WORKERS,
+            pool_type=config.HASHING_POOL_TYPE,
+            max_queue_size=config.HASHING_QUEUE_SIZE,
+            timeout=config.HASHING_TIMEOUT_SECONDS,
+        )
+    configure_hashing_executor(hashing_executor)
+    app.extensions["hashing_executor"] = hashing_executor
+
+    key_ring = load_key_ring(
+        secret_key=config.JWT_SECRET_KEY,
+        private_keys=config.JWT_PRIVATE_KEYS,
+        active_kid=config.JWT_ACTIVE_KEY_ID,
+        accept_hmac=config.JWT_ACCEPT_HS256,
+    )
+    token_minter = TokenMinter(
+        signing_key=key_ring,
+        refresh_expiration_hours=config.REFRESH_TOKEN_EXPIRATION_HOURS,
+    )
+    token_verifier = TokenVerifier(
+        key_ring=key_ring, cache_size=config.TOKEN_CACHE_SIZE
+    )
+    app.extensions["token_verifier"] = token_verifier
+
+    revocation_service = TokenRevocationService(
+        repository=RevokedTokenRepository(),
+        capacity=config.REVOCATION_FILTER_CAPACITY,
+        error_rate=config.REVOCATION_FILTER_ERROR_RATE,
+        sync_interval=config.REVOCATION_SYNC_SECONDS,
+        batch_size=config.REVOCATION_SWEEP_BATCH_SIZE,
+        sync_overlap=config.REVOCATION_SYNC_OVERLAP_SECONDS,
+    )
+    app.extensions["revocation_service"] = revocation_service
+
+    rental_partner_repo = create_rental_partner_repository(config)
+    if isinstance(rental_partner_repo, CachedRentalPartnerRepository):
+        app.extensions["partner_cache"] = rental_partner_repo
+
+    email_index = None
+    if config.EMAIL_INDEX_ENABLED:
+        email_index = RegisteredEmailIndex(
+            repository=rental_partner_repo,
+            capacity=config.EMAIL_INDEX_CAPACITY,
+            error_rate=config.EMAIL_INDEX_ERROR_RATE,
+            sync_interval=config.EMAIL_INDEX_SYNC_SECONDS,
+            sync_overlap=config.EMAIL_INDEX_SYNC_OVERLAP_SECONDS,
+        )
+    app.extensions["email_index"] = email_index
+
+    search_index = (
+        PartnerSearchIndex(
+            rental_partner_repo,
+            sync_interval=config.SEARCH_INDEX_SYNC_SECONDS,
+            sync_overlap=config.SEARCH_INDEX_SYNC_OVERLAP_SECONDS,
+        )
+        if config.SEARCH_INDEX_ENABLED
+        else None
+    )
+    app.extensions["search_index"] = search_index
 
-    rental_partner_repo = RentalPartnerRepository()
     auth_service = AuthService(
         repository=rental_partner_repo,
         jwt_secret=config.JWT_SECRET_KEY,
@@ -36,10 +256,48 @@ def create_app(config: Optional[Config] = None) -> Flask:
         refresh_expiration=config.REFRESH_TOKEN_EXPIRATION_HOURS,
         min_password_length=config.MIN_PASSWORD_LENGTH,
         remember_me_multiplier=config.REMEMBER_ME_MULTIPLIER,
+        token_minter=token_minter,
+        token_verifier=token_verifier,
+        revocation_service=revocation_service,
+        email_index=email_index,
+        optimistic_signup=config.SIGNUP_OPTIMISTIC,
+        search_index=search_index,
     )
 
-    auth_bp = create_auth_routes(auth_service)
-    app.register_blueprint(auth_bp, url_prefix="/api/auth")
+    import_service = PartnerImportService(
+        repository=rental_partner_repo,
+        hashing_executor=HashingExecutor(
+            max_workers=max(config.IMPORT_HASHING_WORKERS, 1),
+            max_queue_size=config.IMPORT_BATCH_SIZE,
+            timeout=config.HASHING_TIMEOUT_SECONDS,
+        ),
+        min_password_length=config.MIN_PASSWORD_LENGTH,
+        batch_size=config.IMPORT_BATCH_SIZE,
+        email_index=email_index,
+        search_index=search_index,
+    )
+
+    app.cli.add_command(create_token_commands(revocation_service))
+    export_service = PartnerExportService(
+        repository=rental_partner_repo, batch_size=config.EXPORT_BATCH_SIZE
+    )
+    app.cli.add_command(create_partner_commands(import_service, export_service))
+
+    register_token_routes(app, config, auth_service, token_verifier, key_ring)
+    if config.ADMIN_API_KEY:
+        app.register_blueprint(
+            create_admin_routes(
+                import_service,
+                export_service,
+                PartnerListingService(rental_partner_repo),
+                config.ADMIN_API_KEY,
+                search_index=search_index,
+            ),
+            url_prefix="/api/admin",
+        )
+
+    if config.METRICS_ENABLED:
+        register_metrics_routes(app, engine, config.METRICS_API_KEY)
 
     @app.route("/")
     def index() -> Dict[str, Any]:
@@ -0,0 +1 @@
+"""CLI commands package."""
@@ -0,0 +1,110 @@
+"""Rental partner maintenance commands."""
+
+import json
+from typing import Any, Dict, IO, Optional
+
+import click
+from flask.cli import AppGroup
+from app.services.partner_export_service import (
+    EXPORT_FORMATS,
+    PartnerExportService,
+)
+from app.services.partner_import_service import (
+    IMPORT_FORMATS,
+    ImportStats,
+    PartnerImportService,
+    read_rows,
+)
+
+
+def create_partner_commands(
+    import_service: PartnerImportService, export_service: PartnerExportService
+) -> AppGroup:
+    """Create the ``flask partners`` command group."""
+    partners_cli = AppGroup("partners", help="Rental partner commands.")
+
+    @click.command("import")
+    @click.argument("source", type=click.File("r", encoding="utf-8"))
+    @click.option(
+        "--format",
+        "input_format",
+        type=click.Choice(IMPORT_FORMATS),
+        default=None,
+        help="Input format; defaults to the file extension.",
+    )
+    @click.option(
+        "--batch-size", type=int, default=None, help="Rows inserted per commit."
+    )
+    @click.option(
+        "--rejects",
+        type=click.File("w", encoding="utf-8"),
+        default="-",
+        help="NDJSON file receiving rejected rows (default: stdout).",
+    )
+    def import_partners(
+        source: IO[str],
+        input_format: Optional[str],
+        batch_size: Optional[int],
+        rejects: IO[str],
+    ) -> None:
+        """Import rental partners from a CSV or NDJSON file ('-' for stdin)."""
+        if input_format is None:
+            input_format = "csv" if source.name.endswith(".csv") else "ndjson"
+
+        def reject(line: int, row: Optional[Dict[str, Any]], reason: str) -> None:
+            email = row.get("email") if row else None
+            rejects.write(
+                json.dumps({"line": line, "email": email, "reason": reason}) + "\n"
+            )
+
+        def progress(stats: ImportStats) -> None:
+            click.echo(
+                f"{stats.processed} rows: {stats.imported} imported, "
+                f"{stats.rejected} rejected ({stats.rows_per_second:,.0f} rows/s)",
+                err=True,
+            )
+
+        stats = import_service.import_rows(
+            read_rows(source, input_format), reject, progress, batch_size
+        )
+        click.echo(
+            f"Imported {stats.imported} of {stats.processed} rows, "
+            f"rejected {stats.rejected}",
+            err=True,
+        )
+
+    @click.command("export")
+    @click.option(
+        "--format",
+        "output_format",
+        type=click.Choice(EXPORT_FORMATS),
+        default="ndjson",
+        help="Output format.",
+    )
+    @click.option(
+        "--output",
+        type=click.File("w", encoding="utf-8"),
+        default="-",
+        help="Destination file (default: stdout).",
+    )
+    @click.option("--after", default=None, help="Resume after this partner id.")
+    @click.option(
+        "--batch-size", type=int, default=None, help="Rows fetched per round trip."
+    )
+    def export_partners(
+        output_format: str,
+        output: IO[str],
+        after: Optional[str],
+        batch_size: Optional[int],
+    ) -> None:
+        """Export rental partners without password hashes."""
+        lines = 0
+        for line in export_service.iter_lines(output_format, after, batch_size):
+            output.write(line)
+            lines += 1
+        click.echo(f"Exported {lines} lines", err=True)
+
+    partners_cli.add_command(import_partners)
+    partners_cli.add_command(export_partners)
+
+    return partners_cli
@@ -0,0 +1,23 @@
+"""Token maintenance commands."""
+
+import click
+from flask.cli import AppGroup
+from app.services.token_revocation_service import TokenRevocationService
+
+
+def create_token_commands(revocation_service: TokenRevocationService) -> AppGroup:
+    """Create the ``flask tokens`` command group."""
+    tokens_cli = AppGroup("tokens", help="Token maintenance commands.")
+
+    @click.command("sweep")
+    @click.option(
+        "--batch-size", type=int, default=None, help="Rows deleted per batch."
+    )
+    def sweep(batch_size: int) -> None:
+        """Delete expired refresh token revocations."""
+        deleted = revocation_service.sweep_expired(batch_size)
+        click.echo(f"Deleted {deleted} expired revocations")
+
+    tokens_cli.add_command(sweep)
+
+    return tokens_cli
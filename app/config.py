@@ -1,10 +1,24 @@
 import os
 from dataclasses import dataclass
+from typing import Any, Dict
 from dotenv import load_dotenv
+from app.utils.cpu import cpu_allotment
+from app.utils.pool_metrics import InstrumentedQueuePool
 
 load_dotenv()
 
 
+def cpus_per_web_worker() -> int:
+    """Share of the container's CPU quota available to each web worker.
+
+    Every worker runs its own hashing pools, so sizing each pool to the
+    whole machine would oversubscribe the CPUs by the number of workers.
+    """
+    cpus = cpu_allotment()
+    workers = int(os.getenv("WEB_CONCURRENCY", "0")) or cpus
+    return max(cpus // workers, 1)
+
+
 @dataclass
 class Config:
     DATABASE_HOST: str = os.getenv("DATABASE_HOST", "localhost")
@@ -13,24 +27,152 @@ class Config:
     DATABASE_PASSWORD: str = os.getenv("DATABASE_PASSWORD", "")
     DATABASE_NAME: str = os.getenv("DATABASE_NAME", "ceremo_db")
 
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_TIMEOUT_SECONDS: float = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "10"))
+    DB_POOL_RECYCLE_SECONDS: int = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "280"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+    DATABASE_REPLICA_URLS: str = os.getenv("DATABASE_REPLICA_URLS", "")
+    READ_YOUR_WRITES_SECONDS: float = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+    REPLICA_RETRY_SECONDS: float = float(os.getenv("REPLICA_RETRY_SECONDS", "30"))
+
+    JSON_PROVIDER: str = os.getenv("JSON_PROVIDER", "orjson")
+    COMPRESSION_ENABLED: bool = (
+        os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    )
+    COMPRESSION_ENCODINGS: str = os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip")
+    COMPRESSION_MIN_BYTES: int = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+
+    PORT: int = int(os.getenv("PORT", "5000"))
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "0"))
+    WEB_THREADS: int = int(os.getenv("WEB_THREADS", "4"))
+    WEB_WORKER_CLASS: str = os.getenv("WEB_WORKER_CLASS", "gthread")
+    WEB_MAX_REQUESTS: int = int(os.getenv("WEB_MAX_REQUESTS", "10000"))
+    WEB_MAX_REQUESTS_JITTER: int = int(os.getenv("WEB_MAX_REQUESTS_JITTER", "1000"))
+    WEB_TIMEOUT_SECONDS: int = int(os.getenv("WEB_TIMEOUT_SECONDS", "30"))
+    WEB_GRACEFUL_TIMEOUT_SECONDS: int = int(
+        os.getenv("WEB_GRACEFUL_TIMEOUT_SECONDS", "30")
+    )
+    WEB_KEEPALIVE_SECONDS: int = int(os.getenv("WEB_KEEPALIVE_SECONDS", "5"))
+
     ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
     DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
     SECRET_KEY: str = os.getenv("SECRET_KEY", "dev-secret-key")
+    ADMIN_API_KEY: str = os.getenv("ADMIN_API_KEY", "")
+    INTROSPECTION_API_KEY: str = os.getenv("INTROSPECTION_API_KEY", "")
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+    METRICS_API_KEY: str = os.getenv("METRICS_API_KEY", "")
 
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "jwt-secret-key")
     JWT_EXPIRATION_HOURS: int = int(os.getenv("JWT_EXPIRATION_HOURS", "24"))
     REFRESH_TOKEN_EXPIRATION_HOURS: int = int(
         os.getenv("REFRESH_TOKEN_EXPIRATION_HOURS", "720")
     )
+    JWT_PRIVATE_KEYS: str = os.getenv("JWT_PRIVATE_KEYS", "")
+    JWT_ACTIVE_KEY_ID: str = os.getenv("JWT_ACTIVE_KEY_ID", "")
+    JWT_ACCEPT_HS256: bool = os.getenv("JWT_ACCEPT_HS256", "true").lower() == "true"
+    JWKS_MAX_AGE_SECONDS: int = int(os.getenv("JWKS_MAX_AGE_SECONDS", "86400"))
+    TOKEN_CACHE_SIZE: int = int(os.getenv("TOKEN_CACHE_SIZE", "4096"))
+    REVOCATION_FILTER_CAPACITY: int = int(
+        os.getenv("REVOCATION_FILTER_CAPACITY", "1000000")
+    )
+    REVOCATION_FILTER_ERROR_RATE: float = float(
+        os.getenv("REVOCATION_FILTER_ERROR_RATE", "0.001")
+    )
+    REVOCATION_SYNC_SECONDS: float = float(os.getenv("REVOCATION_SYNC_SECONDS", "30"))
+    REVOCATION_SYNC_OVERLAP_SECONDS: float = float(
+        os.getenv("REVOCATION_SYNC_OVERLAP_SECONDS", "60")
+    )
+    REVOCATION_SWEEP_BATCH_SIZE: int = int(
+        os.getenv("REVOCATION_SWEEP_BATCH_SIZE", "1000")
+    )
+    EMAIL_INDEX_ENABLED: bool = (
+        os.getenv("EMAIL_INDEX_ENABLED", "true").lower() == "true"
+    )
+    EMAIL_INDEX_CAPACITY: int = int(os.getenv("EMAIL_INDEX_CAPACITY", "1000000"))
+    EMAIL_INDEX_ERROR_RATE: float = float(os.getenv("EMAIL_INDEX_ERROR_RATE", "0.001"))
+    EMAIL_INDEX_SYNC_SECONDS: float = float(os.getenv("EMAIL_INDEX_SYNC_SECONDS", "10"))
+    EMAIL_INDEX_SYNC_OVERLAP_SECONDS: float = float(
+        os.getenv("EMAIL_INDEX_SYNC_OVERLAP_SECONDS", "60")
+    )
+    SEARCH_INDEX_ENABLED: bool = (
+        os.getenv("SEARCH_INDEX_ENABLED", "true").lower() == "true"
+    )
+    SEARCH_INDEX_SYNC_SECONDS: float = float(
+        os.getenv("SEARCH_INDEX_SYNC_SECONDS", "10")
+    )
+    SEARCH_INDEX_SYNC_OVERLAP_SECONDS: float = float(
+        os.getenv("SEARCH_INDEX_SYNC_OVERLAP_SECONDS", "60")
+    )
+    PARTNER_CACHE_ENABLED: bool = (
+        os.getenv("PARTNER_CACHE_ENABLED", "true").lower() == "true"
+    )
+    PARTNER_CACHE_MAX_BYTES: int = int(os.getenv("PARTNER_CACHE_MAX_BYTES", "8388608"))
+    PARTNER_CACHE_TTL_SECONDS: float = float(
+        os.getenv("PARTNER_CACHE_TTL_SECONDS", "30")
+    )
+
+    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_BACKEND: str = os.getenv("RATE_LIMIT_BACKEND", "memory")
+    RATE_LIMIT_SHARED_SLOTS: int = int(os.getenv("RATE_LIMIT_SHARED_SLOTS", "65536"))
+    SIGNIN_IP_LIMIT: int = int(os.getenv("SIGNIN_IP_LIMIT", "20"))
+    SIGNIN_IP_WINDOW_SECONDS: int = int(os.getenv("SIGNIN_IP_WINDOW_SECONDS", "60"))
+    SIGNIN_EMAIL_LIMIT: int = int(os.getenv("SIGNIN_EMAIL_LIMIT", "5"))
+    SIGNIN_EMAIL_WINDOW_SECONDS: int = int(
+        os.getenv("SIGNIN_EMAIL_WINDOW_SECONDS", "300")
+    )
+    PROXY_FIX_X_FOR: int = int(os.getenv("PROXY_FIX_X_FOR", "0"))
+
+    SIGNUP_OPTIMISTIC: bool = os.getenv("SIGNUP_OPTIMISTIC", "false").lower() == "true"
 
     MIN_PASSWORD_LENGTH: int = int(os.getenv("MIN_PASSWORD_LENGTH", "8"))
     REMEMBER_ME_MULTIPLIER: int = int(os.getenv("REMEMBER_ME_MULTIPLIER", "24"))
 
+    PASSWORD_HASHER: str = os.getenv("PASSWORD_HASHER", "bcrypt")
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    ARGON2_TIME_COST: int = int(os.getenv("ARGON2_TIME_COST", "3"))
+    ARGON2_MEMORY_COST: int = int(os.getenv("ARGON2_MEMORY_COST", "65536"))
+    ARGON2_PARALLELISM: int = int(os.getenv("ARGON2_PARALLELISM", "4"))
+    PASSWORD_HASH_TARGET_MS: float = float(os.getenv("PASSWORD_HASH_TARGET_MS", "0"))
+
+    HASHING_POOL_TYPE: str = os.getenv("HASHING_POOL_TYPE", "thread")
+    HASHING_WORKERS: int = int(os.getenv("HASHING_WORKERS", str(cpus_per_web_worker())))
+    HASHING_QUEUE_SIZE: int = int(os.getenv("HASHING_QUEUE_SIZE", "32"))
+    HASHING_TIMEOUT_SECONDS: float = float(os.getenv("HASHING_TIMEOUT_SECONDS", "5"))
+
+    IMPORT_BATCH_SIZE: int = int(os.getenv("IMPORT_BATCH_SIZE", "500"))
+    IMPORT_HASHING_WORKERS: int = int(
+        os.getenv("IMPORT_HASHING_WORKERS", str(cpu_allotment()))
+    )
+    EXPORT_BATCH_SIZE: int = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
     @property
     def DATABASE_URL(self) -> str:
         """Construct database URL."""
         return f"mysql+pymysql://{self.DATABASE_USER}:{self.DATABASE_PASSWORD}@{self.DATABASE_HOST}:{self.DATABASE_PORT}/{self.DATABASE_NAME}"
 
+    @property
+    def DATABASE_ENGINE_OPTIONS(self) -> Dict[str, Any]:
+        """Connection pool settings passed to the SQLAlchemy engine."""
+        return {
+            "poolclass": InstrumentedQueuePool,
+            "pool_size": self.DB_POOL_SIZE,
+            "max_overflow": self.DB_MAX_OVERFLOW,
+            "pool_timeout": self.DB_POOL_TIMEOUT_SECONDS,
+            "pool_recycle": self.DB_POOL_RECYCLE_SECONDS,
+            "pool_pre_ping": self.DB_POOL_PRE_PING,
+        }
+
+    @property
+    def DATABASE_BINDS(self) -> Dict[str, Dict[str, Any]]:
+        """Engine settings for each read replica, keyed by bind name."""
+        urls = [u.strip() for u in self.DATABASE_REPLICA_URLS.split(",") if u.strip()]
+        return {
+            f"replica_{index}": {"url": url, **self.DATABASE_ENGINE_OPTIONS}
+            for index, url in enumerate(urls)
+        }
+
 
 def get_settings() -> Config:
     return Config()
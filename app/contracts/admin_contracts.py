@@ -0,0 +1,95 @@
+"""Admin contracts."""
+
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+MAX_PAGE_SIZE = 100
+MAX_SEARCH_RESULTS = 50
+
+
+class ImportReject(BaseModel):
+    """A row the import skipped."""
+
+    line: int
+    email: Optional[str] = None
+    reason: str
+
+
+class ImportSummary(BaseModel):
+    """Import totals and the first rejected rows."""
+
+    processed: int
+    imported: int
+    rejected: int
+    rejects: List[ImportReject]
+
+
+class ImportResponse(BaseModel):
+    """Import response schema."""
+
+    success: bool = True
+    data: ImportSummary
+    message: str
+
+
+class PartnerListQuery(BaseModel):
+    """Partner listing query parameters."""
+
+    createdFrom: Optional[datetime] = None
+    createdTo: Optional[datetime] = None
+    firstName: Optional[str] = None
+    lastName: Optional[str] = None
+    phone: Optional[str] = None
+    limit: int = Field(default=50, ge=1, le=MAX_PAGE_SIZE)
+    cursor: Optional[str] = None
+
+
+class PartnerSummary(BaseModel):
+    """A listed rental partner."""
+
+    id: str
+    email: str
+    firstName: str
+    lastName: str
+    phone: str
+    createdAt: datetime
+
+
+class PartnerPage(BaseModel):
+    """A page of partners and the cursor of the next one."""
+
+    partners: List[PartnerSummary]
+    nextCursor: Optional[str] = None
+
+
+class PartnerListResponse(BaseModel):
+    """Partner listing response schema."""
+
+    success: bool = True
+    data: PartnerPage
+    message: str
+
+
+class PartnerSearchQuery(BaseModel):
+    """Partner search query parameters."""
+
+    q: str = Field(min_length=1, max_length=100)
+    limit: int = Field(default=10, ge=1, le=MAX_SEARCH_RESULTS)
+
+
+class PartnerMatch(BaseModel):
+    """A partner matching a search."""
+
+    id: str
+    email: str
+    firstName: str
+    lastName: str
+
+
+class PartnerSearchResponse(BaseModel):
+    """Partner search response schema."""
+
+    success: bool = True
+    data: List[PartnerMatch]
+    message: str
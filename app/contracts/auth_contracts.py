@@ -1,6 +1,10 @@
 """Authentication contracts."""
 
-from pydantic import BaseModel, EmailStr
+from typing import List, Optional
+
+from pydantic import BaseModel, EmailStr, Field
+
+MAX_INTROSPECTION_TOKENS = 100
 
 
 class SignInRequest(BaseModel):
@@ -23,6 +27,12 @@ class SignUpRequest(BaseModel):
     agreeToTerms: bool
 
 
+class RefreshRequest(BaseModel):
+    """Refresh token request schema."""
+
+    refreshToken: str
+
+
 class UserData(BaseModel):
     """User data schema."""
 
@@ -47,3 +57,51 @@ class AuthResponse(BaseModel):
     success: bool = True
     data: AuthData
     message: str
+
+
+class ProfileResponse(BaseModel):
+    """Profile response schema."""
+
+    success: bool = True
+    data: UserData
+    message: str
+
+
+class TokenData(BaseModel):
+    """Token pair schema."""
+
+    token: str
+    refreshToken: str
+
+
+class RefreshResponse(BaseModel):
+    """Refresh response schema."""
+
+    success: bool = True
+    data: TokenData
+    message: str
+
+
+class IntrospectionRequest(BaseModel):
+    """Token introspection request schema."""
+
+    tokens: List[str] = Field(min_length=1, max_length=MAX_INTROSPECTION_TOKENS)
+
+
+class TokenIntrospection(BaseModel):
+    """Introspection result for one token; claims are set when active."""
+
+    active: bool
+    userId: Optional[str] = None
+    tokenType: Optional[str] = None
+    jti: Optional[str] = None
+    issuedAt: Optional[int] = None
+    expiresAt: Optional[int] = None
+
+
+class IntrospectionResponse(BaseModel):
+    """Token introspection response schema, in request order."""
+
+    success: bool = True
+    data: List[TokenIntrospection]
+    message: str
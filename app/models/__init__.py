@@ -1,6 +1,15 @@
 """Models package."""
 
 from app.models.base import db, BaseModel, TimestampMixin
-from app.models.rental_partner import RentalPartner
+from app.models.rental_partner import Partner, RentalPartner, RentalPartnerRecord
+from app.models.revoked_token import RevokedToken
 
-__all__ = ["db", "BaseModel", "TimestampMixin", "RentalPartner"]
+__all__ = [
+    "db",
+    "BaseModel",
+    "TimestampMixin",
+    "Partner",
+    "RentalPartner",
+    "RentalPartnerRecord",
+    "RevokedToken",
+]
@@ -2,6 +2,7 @@
 
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy.orm import DeclarativeBase
+from app.models.routing import RoutingSession
 from app.utils.timezone import now_ist
 
 
@@ -13,7 +14,7 @@ class BaseModel(Base):
     __abstract__ = True
 
 
-db = SQLAlchemy(model_class=Base)
+db = SQLAlchemy(model_class=Base, session_options={"class_": RoutingSession})
 
 
 class TimestampMixin:
@@ -1,17 +1,62 @@
 """Rental Partner domain model."""
 
-import uuid
+from typing import NamedTuple, Union
+from sqlalchemy.engine.default import DefaultExecutionContext
 from app.models.base import db, BaseModel, TimestampMixin
+from app.models.types import BinaryUUID
+from app.utils.ids import uuid7
+
+
+def _same_id(context: DefaultExecutionContext) -> str:
+    partner_id: str = context.get_current_parameters()["id"]  # type: ignore[no-untyped-call]
+    return partner_id
 
 
 class RentalPartner(BaseModel, TimestampMixin):
     __tablename__ = "rental_partners"
 
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    # The BINARY(16) key lives in the binary_id column. The string id column
+    # is still written for instances of the previous release, which look
+    # partners up by it, until a later release drops it.
+    id = db.Column("binary_id", BinaryUUID(), key="id", primary_key=True, default=uuid7)
+    legacy_id = db.Column(
+        "id",
+        db.String(36),
+        key="legacy_id",
+        nullable=False,
+        default=_same_id,
+    )
     email = db.Column(db.String(255), unique=True, nullable=False, index=True)
     password_hash = db.Column(db.String(255), nullable=False)
     first_name = db.Column(db.String(100), nullable=False)
     last_name = db.Column(db.String(100), nullable=False)
     phone = db.Column(db.String(20), nullable=False)
 
-    __table_args__ = (db.Index("idx_rental_partners_email", "email"),)
+    __table_args__ = (
+        db.Index("idx_rental_partners_email", "email"),
+        db.Index("uq_rental_partners_id", "legacy_id", unique=True),
+        db.Index("idx_rental_partners_created_at_id", "created_at", "id"),
+        db.Index("idx_rental_partners_first_name", "first_name", "created_at", "id"),
+        db.Index("idx_rental_partners_last_name", "last_name", "created_at", "id"),
+        db.Index("idx_rental_partners_phone", "phone", "created_at", "id"),
+    )
+
+
+class RentalPartnerRecord(NamedTuple):
+    """Immutable snapshot of a rental partner row, detached from the session.
+
+    A tuple with empty ``__slots__``: no per-instance ``__dict__`` and no
+    ORM state, for read-only use on hot paths.
+    """
+
+    id: str
+    email: str
+    password_hash: str
+    first_name: str
+    last_name: str
+    phone: str
+
+
+# A partner as returned by the repositories: a session-bound instance or a
+# detached record. Both expose the same attributes.
+Partner = Union[RentalPartner, RentalPartnerRecord]
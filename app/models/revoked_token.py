@@ -0,0 +1,21 @@
+"""Revoked token domain model."""
+
+from app.models.base import db, BaseModel, TimestampMixin
+
+TOKEN = "token"
+FAMILY = "family"
+
+
+class RevokedToken(BaseModel, TimestampMixin):
+    """A revoked refresh token id (jti) or refresh token family."""
+
+    __tablename__ = "revoked_tokens"
+
+    jti = db.Column(db.String(64), primary_key=True)
+    kind = db.Column(db.String(16), nullable=False, default=TOKEN)
+    expires_at = db.Column(db.DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        db.Index("idx_revoked_tokens_expires_at", "expires_at"),
+        db.Index("idx_revoked_tokens_created_at", "created_at"),
+    )
@@ -0,0 +1,193 @@
+"""Read replica routing for the database session."""
+
+import contextvars
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Sequence, TypeVar
+
+from flask import current_app, has_app_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy import UpdateBase, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.interfaces import ExceptionContext
+from sqlalchemy.exc import OperationalError
+
+from app.utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+T = TypeVar("T")
+
+WROTE_KEY = "wrote"
+
+_replica_reads: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "replica_reads", default=False
+)
+
+
+class ReplicaRouter:
+    """Pick a healthy read replica and remember recent writes.
+
+    A replica whose connections fail is skipped for ``retry_seconds``. Keys
+    written within the last ``stickiness_seconds`` (an email, a partner id)
+    are read from the primary, so a client sees its own writes regardless
+    of replication lag. Keys are compared case-insensitively.
+    """
+
+    def __init__(
+        self,
+        replicas: Sequence[str],
+        stickiness_seconds: float = 5.0,
+        retry_seconds: float = 30.0,
+        max_keys: int = 100_000,
+    ):
+        self.replicas = list(replicas)
+        self.stickiness_seconds = stickiness_seconds
+        self.retry_seconds = retry_seconds
+        self.max_keys = max_keys
+        self._next = itertools.count()
+        self._unhealthy_until: Dict[str, float] = {}
+        self._written: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._replica_reads = 0
+        self._primary_reads = 0
+
+    def choose(self) -> Optional[str]:
+        """Return the next healthy replica, or None to use the primary."""
+        now = time.monotonic()
+        healthy = [
+            name
+            for name in self.replicas
+            if self._unhealthy_until.get(name, 0.0) <= now
+        ]
+        if not healthy:
+            return None
+        return healthy[next(self._next) % len(healthy)]
+
+    def mark_unhealthy(self, name: str) -> None:
+        """Stop reading from a replica for ``retry_seconds``."""
+        self._unhealthy_until[name] = time.monotonic() + self.retry_seconds
+        logger.warning(f"Read replica {name} marked unhealthy")
+
+    def watch(self, name: str, engine: Engine) -> None:
+        """Mark the replica unhealthy when its engine reports a connection error."""
+
+        @event.listens_for(engine, "handle_error")
+        def on_error(context: ExceptionContext) -> None:
+            if context.is_disconnect or isinstance(
+                context.sqlalchemy_exception, OperationalError
+            ):
+                self.mark_unhealthy(name)
+
+    def record_write(self, *keys: str) -> None:
+        """Send reads for these keys to the primary for a while."""
+        expires_at = time.monotonic() + self.stickiness_seconds
+        with self._lock:
+            for key in keys:
+                self._written[key.lower()] = expires_at
+                self._written.move_to_end(key.lower())
+            while len(self._written) > self.max_keys:
+                self._written.popitem(last=False)
+
+    def recently_written(self, key: str) -> bool:
+        with self._lock:
+            expires_at = self._written.get(key.lower())
+            if expires_at is None:
+                return False
+            if expires_at <= time.monotonic():
+                del self._written[key.lower()]
+                return False
+            return True
+
+    def count_read(self, replica: bool) -> None:
+        with self._lock:
+            if replica:
+                self._replica_reads += 1
+            else:
+                self._primary_reads += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return replica health and read routing counters."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "replicas": len(self.replicas),
+                "unhealthy": sorted(
+                    name for name, until in self._unhealthy_until.items() if until > now
+                ),
+                "replica_reads": self._replica_reads,
+                "primary_reads": self._primary_reads,
+                "sticky_keys": len(self._written),
+            }
+
+
+def get_replica_router() -> Optional[ReplicaRouter]:
+    """Return the current app's replica router, if replicas are configured."""
+    if not has_app_context():
+        return None
+    router: Optional[ReplicaRouter] = current_app.extensions.get("replica_router")
+    return router
+
+
+class RoutingSession(Session):
+    """Session that sends opted-in reads to a replica and everything else to
+    the primary.
+
+    Once the session has written, later reads in the same session go to the
+    primary as well.
+    """
+
+    def get_bind(
+        self,
+        mapper: Any = None,
+        clause: Any = None,
+        bind: Any = None,
+        **kwargs: Any,
+    ) -> Any:
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info[WROTE_KEY] = True
+        elif bind is None and _replica_reads.get() and not self.info.get(WROTE_KEY):
+            router = get_replica_router()
+            name = router.choose() if router else None
+            if name is not None:
+                return self._db.engines[name]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def read_from_replica(
+    session: Any,
+    query: Callable[[], T],
+    key: Optional[str] = None,
+    retry_on_miss: bool = False,
+) -> T:
+    """Run a read query on a replica, falling back to the primary.
+
+    The primary is used when no replica is healthy, when ``key`` was written
+    recently, or when the replica fails. With ``retry_on_miss`` a None
+    result is confirmed on the primary, covering rows that have not
+    replicated yet.
+    """
+    router = get_replica_router()
+    if router is None or (key is not None and router.recently_written(key)):
+        if router is not None:
+            router.count_read(replica=False)
+        return query()
+
+    token = _replica_reads.set(True)
+    try:
+        result = query()
+    except OperationalError as e:
+        logger.warning(f"Replica read failed, retrying on primary: {str(e)}")
+        session.rollback()
+        result = None
+        retry_on_miss = True
+    finally:
+        _replica_reads.reset(token)
+
+    if result is None and retry_on_miss:
+        router.count_read(replica=False)
+        return query()
+    router.count_read(replica=True)
+    return result  # type: ignore[return-value]
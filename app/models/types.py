@@ -0,0 +1,29 @@
+"""Custom column types."""
+
+import uuid
+from typing import Any, Optional
+
+from sqlalchemy import BINARY
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+
+class BinaryUUID(TypeDecorator[str]):
+    """UUID stored as BINARY(16) and handled as its canonical string.
+
+    Application code, records and tokens keep the familiar string form;
+    only the database sees the 16 packed bytes.
+    """
+
+    impl = BINARY(16)
+    cache_ok = True
+
+    def process_bind_param(
+        self, value: Optional[str], dialect: Dialect
+    ) -> Optional[bytes]:
+        return None if value is None else uuid.UUID(value).bytes
+
+    def process_result_value(
+        self, value: Optional[Any], dialect: Dialect
+    ) -> Optional[str]:
+        return None if value is None else str(uuid.UUID(bytes=bytes(value)))
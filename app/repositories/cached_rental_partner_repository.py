@@ -0,0 +1,79 @@
+"""Cached rental partner repository."""
+
+from typing import Any, Dict, Optional, Sequence
+
+from app.models.rental_partner import RentalPartnerRecord
+from app.repositories.rental_partner_repository import RentalPartnerRepository
+from app.utils.ttl_cache import TTLCache
+
+
+def _email_key(email: str) -> str:
+    return "email:" + email.strip().lower()
+
+
+def _id_key(partner_id: str) -> str:
+    return "id:" + partner_id
+
+
+class CachedRentalPartnerRepository(RentalPartnerRepository):
+    """Rental partner repository with a read-through cache of partner records.
+
+    Lookups by id and by normalized email are answered from an in-process
+    cache of immutable records. Writes made through this repository
+    invalidate both keys; writes made by other workers show up once the
+    entry expires after ``ttl_seconds``.
+    """
+
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024, ttl_seconds: float = 60.0):
+        self.cache: TTLCache[RentalPartnerRecord] = TTLCache(max_bytes, ttl_seconds)
+
+    def find_by_email(self, email: str) -> Optional[RentalPartnerRecord]:
+        cached = self.cache.get(_email_key(email))
+        if cached is not None:
+            return cached
+        return self._remember(super().find_by_email(email))
+
+    def find_by_id(self, partner_id: str) -> Optional[RentalPartnerRecord]:
+        cached = self.cache.get(_id_key(partner_id))
+        if cached is not None:
+            return cached
+        return self._remember(super().find_by_id(partner_id))
+
+    def create(
+        self,
+        email: str,
+        password_hash: str,
+        first_name: str,
+        last_name: str,
+        phone: str,
+    ) -> RentalPartnerRecord:
+        record = super().create(email, password_hash, first_name, last_name, phone)
+        self._remember(record)
+        return record
+
+    def create_many(self, records: Sequence[RentalPartnerRecord]) -> None:
+        super().create_many(records)
+        for record in records:
+            self._invalidate(record)
+
+    def update_password_hash(
+        self, partner_id: str, email: str, password_hash: str
+    ) -> None:
+        super().update_password_hash(partner_id, email, password_hash)
+        self.cache.delete(_id_key(partner_id), _email_key(email))
+
+    def _remember(
+        self, record: Optional[RentalPartnerRecord]
+    ) -> Optional[RentalPartnerRecord]:
+        if record is None:
+            return None
+        self.cache.set(_id_key(record.id), record)
+        self.cache.set(_email_key(record.email), record)
+        return record
+
+    def _invalidate(self, record: RentalPartnerRecord) -> None:
+        self.cache.delete(_id_key(record.id), _email_key(record.email))
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return cache size and hit/miss counters."""
+        return self.cache.metrics()
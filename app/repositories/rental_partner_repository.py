@@ -1,17 +1,183 @@
 """Rental Partner repository."""
 
-from typing import Optional
+from datetime import datetime
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from sqlalchemy import Row, insert, or_, select
 from sqlalchemy.exc import IntegrityError
-from app.models.rental_partner import RentalPartner
+from app.utils.ids import is_uuid, uuid7
+from app.models.rental_partner import RentalPartner, RentalPartnerRecord
 from app.models.base import db
+from app.models.routing import get_replica_router, read_from_replica
+
+RECORD_COLUMNS = tuple(
+    getattr(RentalPartner, field) for field in RentalPartnerRecord._fields
+)
+LISTING_COLUMNS = (
+    RentalPartner.id,
+    RentalPartner.email,
+    RentalPartner.first_name,
+    RentalPartner.last_name,
+    RentalPartner.phone,
+    RentalPartner.created_at,
+)
+
+MYSQL_DUPLICATE_ENTRY = 1062
+# Unique keys on rental_partners.email: the column constraint and its index.
+EMAIL_UNIQUE_KEYS = ("email", "idx_rental_partners_email")
+
+
+def is_duplicate_email(error: IntegrityError) -> bool:
+    """Check whether an insert failed because the email is already taken."""
+    args: Tuple[Any, ...] = getattr(error.orig, "args", ())
+    if len(args) == 2 and args[0] == MYSQL_DUPLICATE_ENTRY:
+        # "Duplicate entry '...' for key 'rental_partners.email'"
+        key = str(args[1]).rsplit(" for key ", 1)[-1].strip("'")
+        return key.rsplit(".", 1)[-1] in EMAIL_UNIQUE_KEYS
+    return "UNIQUE constraint failed: rental_partners.email" in str(error.orig)
 
 
 class RentalPartnerRepository:
     """Repository for rental partner data access."""
 
-    def find_by_email(self, email: str) -> Optional[RentalPartner]:
-        """Find rental partner by email."""
-        return db.session.query(RentalPartner).filter_by(email=email).first()
+    def find_by_email(self, email: str) -> Optional[RentalPartnerRecord]:
+        """Find rental partner by email, reading from a replica when possible."""
+        query = select(*RECORD_COLUMNS).where(RentalPartner.email == email)
+        return self._find_record(query, email)
+
+    def find_by_id(self, partner_id: str) -> Optional[RentalPartnerRecord]:
+        """Find rental partner by id, reading from a replica when possible."""
+        if not is_uuid(partner_id):
+            return None
+        query = select(*RECORD_COLUMNS).where(RentalPartner.id == partner_id)
+        return self._find_record(query, partner_id)
+
+    def _find_record(self, query: Any, key: str) -> Optional[RentalPartnerRecord]:
+        """Run a projection of the record columns and wrap the row.
+
+        Only the needed columns are selected and no ORM instance is built, so
+        the lookup skips identity-map bookkeeping and timestamp columns.
+        """
+        row = read_from_replica(
+            db.session,
+            lambda: db.session.execute(query).first(),
+            key=key,
+            retry_on_miss=True,
+        )
+        return RentalPartnerRecord._make(row) if row is not None else None
+
+    def iter_emails(
+        self, since: Optional[datetime] = None, batch_size: int = 1000
+    ) -> Iterator[Tuple[str, datetime]]:
+        """Stream (email, created_at) of registered partners."""
+        query = db.session.query(RentalPartner.email, RentalPartner.created_at)
+        if since is not None:
+            query = query.filter(RentalPartner.created_at >= since)
+        for email, created_at in query.yield_per(batch_size):
+            yield email, created_at
+
+    def iter_search_fields(
+        self, since: Optional[datetime] = None, batch_size: int = 1000
+    ) -> Iterator[Tuple[str, str, str, str, datetime]]:
+        """Stream (id, email, first_name, last_name, created_at) of partners."""
+        query = select(
+            RentalPartner.id,
+            RentalPartner.email,
+            RentalPartner.first_name,
+            RentalPartner.last_name,
+            RentalPartner.created_at,
+        )
+        if since is not None:
+            query = query.where(RentalPartner.created_at >= since)
+        query = query.execution_options(stream_results=True, yield_per=batch_size)
+        for partner_id, email, first_name, last_name, created_at in db.session.execute(
+            query
+        ):
+            yield partner_id, email, first_name, last_name, created_at
+
+    def search_like(self, term: str, limit: int) -> List[Row[Any]]:
+        """Find partners whose email or names contain ``term``.
+
+        Scans the table; used only until the search index is built.
+        """
+        query = (
+            select(
+                RentalPartner.id,
+                RentalPartner.email,
+                RentalPartner.first_name,
+                RentalPartner.last_name,
+            )
+            .where(
+                or_(
+                    RentalPartner.email.contains(term, autoescape=True),
+                    RentalPartner.first_name.contains(term, autoescape=True),
+                    RentalPartner.last_name.contains(term, autoescape=True),
+                )
+            )
+            .order_by(RentalPartner.last_name, RentalPartner.first_name)
+            .limit(limit)
+        )
+        return list(read_from_replica(db.session, lambda: db.session.execute(query)))
+
+    def iter_export(
+        self,
+        columns: Sequence[str],
+        after_id: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Row[Any]]:
+        """Stream the given columns of all partners in id order.
+
+        Rows come from a server-side cursor ``batch_size`` at a time, on a
+        replica when one is configured, so memory stays flat. Pass the last
+        id seen as ``after_id`` to resume.
+        """
+        query = select(*(getattr(RentalPartner, column) for column in columns))
+        if after_id is not None:
+            query = query.where(RentalPartner.id > after_id)
+        query = query.order_by(RentalPartner.id).execution_options(
+            stream_results=True, yield_per=batch_size
+        )
+        yield from read_from_replica(db.session, lambda: db.session.execute(query))
+
+    def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, str]] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        first_name: Optional[str] = None,
+        last_name: Optional[str] = None,
+        phone: Optional[str] = None,
+    ) -> List[Row[Any]]:
+        """Return up to ``limit`` partners, newest first, after a keyset position.
+
+        Rows are ordered by (created_at, id) descending. Passing the last
+        row's pair as ``after`` seeks straight to the next page through the
+        (created_at, id) indexes, so a deep page costs the same as the first.
+        """
+        query = select(*LISTING_COLUMNS)
+        if after is not None:
+            created_at, partner_id = after
+            query = query.where(RentalPartner.created_at <= created_at).where(
+                or_(
+                    RentalPartner.created_at < created_at,
+                    RentalPartner.id < partner_id,
+                )
+            )
+        if created_from is not None:
+            query = query.where(RentalPartner.created_at >= created_from)
+        if created_to is not None:
+            query = query.where(RentalPartner.created_at < created_to)
+        for column, value in (
+            (RentalPartner.first_name, first_name),
+            (RentalPartner.last_name, last_name),
+            (RentalPartner.phone, phone),
+        ):
+            if value is not None:
+                query = query.where(column == value)
+        query = query.order_by(
+            RentalPartner.created_at.desc(), RentalPartner.id.desc()
+        ).limit(limit)
+        return list(read_from_replica(db.session, lambda: db.session.execute(query)))
 
     def create(
         self,
@@ -20,15 +186,71 @@ class RentalPartnerRepository:
         first_name: str,
         last_name: str,
         phone: str,
-    ) -> RentalPartner:
-        """Create new rental partner."""
-        partner = RentalPartner(
+    ) -> RentalPartnerRecord:
+        """Create new rental partner.
+
+        Returns a record built from the inserted values, so reading it does
+        not reload the row the commit expired. Raises IntegrityError, after
+        rolling back, if the email is taken.
+        """
+        record = RentalPartnerRecord(
+            id=uuid7(),
             email=email,
             password_hash=password_hash,
             first_name=first_name,
             last_name=last_name,
             phone=phone,
         )
-        db.session.add(partner)
+        db.session.add(RentalPartner(**record._asdict()))
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            raise
+        self._record_write(record.email, record.id)
+        return record
+
+    def find_existing_emails(self, emails: Iterable[str]) -> Set[str]:
+        """Return which of the given emails are already registered."""
+        emails = list(emails)
+        if not emails:
+            return set()
+        query = db.session.query(RentalPartner.email).filter(
+            RentalPartner.email.in_(emails)
+        )
+        return {email for (email,) in query}
+
+    def create_many(self, records: Sequence[RentalPartnerRecord]) -> None:
+        """Insert partners with one executemany and commit them together.
+
+        Raises IntegrityError, after rolling back, if any email is taken.
+        """
+        if not records:
+            return
+        try:
+            db.session.execute(
+                insert(RentalPartner), [record._asdict() for record in records]
+            )
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            raise
+
+    def update_password_hash(
+        self, partner_id: str, email: str, password_hash: str
+    ) -> None:
+        """Replace the stored password hash of a rental partner.
+
+        ``email`` is the partner's current email, so caching repositories
+        can drop both of its entries.
+        """
+        db.session.query(RentalPartner).filter_by(id=partner_id).update(
+            {"password_hash": password_hash}
+        )
         db.session.commit()
-        return partner
+        self._record_write(partner_id)
+
+    def _record_write(self, *keys: str) -> None:
+        router = get_replica_router()
+        if router is not None:
+            router.record_write(*keys)
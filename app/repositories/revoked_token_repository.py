@@ -0,0 +1,65 @@
+"""Revoked token repository."""
+
+from datetime import datetime
+from typing import Iterator, Optional, Tuple
+from sqlalchemy.exc import IntegrityError
+from app.models.revoked_token import RevokedToken
+from app.models.base import db
+
+
+class RevokedTokenRepository:
+    """Repository for revoked token ids and token families."""
+
+    def add(self, jti: str, kind: str, expires_at: datetime) -> bool:
+        """Record a revocation; return False if it was already recorded."""
+        db.session.add(RevokedToken(jti=jti, kind=kind, expires_at=expires_at))
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            return False
+        return True
+
+    def exists(self, jti: str) -> bool:
+        """Check whether a token id or family has been revoked."""
+        query = db.session.query(RevokedToken.jti).filter_by(jti=jti)
+        return query.first() is not None
+
+    def iter_active(
+        self,
+        now: datetime,
+        since: Optional[datetime] = None,
+        batch_size: int = 1000,
+        kind: Optional[str] = None,
+    ) -> Iterator[Tuple[str, datetime]]:
+        """Stream (jti, created_at) of revocations that have not expired."""
+        query = db.session.query(RevokedToken.jti, RevokedToken.created_at).filter(
+            RevokedToken.expires_at > now
+        )
+        if kind is not None:
+            query = query.filter(RevokedToken.kind == kind)
+        if since is not None:
+            query = query.filter(RevokedToken.created_at >= since)
+        for jti, created_at in query.yield_per(batch_size):
+            yield jti, created_at
+
+    def delete_expired(self, now: datetime, batch_size: int = 1000) -> int:
+        """Delete expired revocations in batches; return how many were removed."""
+        deleted = 0
+        while True:
+            jtis = [
+                jti
+                for (jti,) in db.session.query(RevokedToken.jti)
+                .filter(RevokedToken.expires_at <= now)
+                .limit(batch_size)
+            ]
+            if not jtis:
+                break
+            db.session.query(RevokedToken).filter(RevokedToken.jti.in_(jtis)).delete(
+                synchronize_session=False
+            )
+            db.session.commit()
+            deleted += len(jtis)
+            if len(jtis) < batch_size:
+                break
+        return deleted
@@ -0,0 +1,162 @@
+"""Admin routes."""
+
+import io
+from typing import Any, Dict, List, Optional
+from flask import Blueprint, Response, g, request, stream_with_context
+from app.contracts.admin_contracts import (
+    ImportReject,
+    ImportResponse,
+    ImportSummary,
+    PartnerListQuery,
+    PartnerListResponse,
+    PartnerMatch,
+    PartnerSearchQuery,
+    PartnerSearchResponse,
+)
+from app.services.partner_export_service import EXPORT_FORMATS, PartnerExportService
+from app.services.partner_import_service import PartnerImportService, read_rows
+from app.services.partner_listing_service import PartnerListingService
+from app.services.partner_search_index import PartnerSearchIndex
+from app.utils.errors import ValidationError, handle_controller_errors
+from app.utils.ids import is_uuid
+from app.utils.json_provider import contract_response
+from app.utils.logging import setup_logger
+from app.utils.validators import require_api_key, validate_query_params
+
+logger = setup_logger(__name__)
+
+IMPORT_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+}
+
+EXPORT_MIMETYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+MAX_REPORTED_REJECTS = 1000
+
+
+def create_admin_routes(
+    import_service: PartnerImportService,
+    export_service: PartnerExportService,
+    listing_service: PartnerListingService,
+    api_key: str,
+    search_index: Optional[PartnerSearchIndex] = None,
+) -> Blueprint:
+    """Create admin routes blueprint, guarded by an API key."""
+    admin_bp = Blueprint("admin", __name__)
+
+    @admin_bp.route("/partners", methods=["GET"])
+    @require_api_key(api_key)
+    @validate_query_params(PartnerListQuery)
+    @handle_controller_errors
+    def list_partners() -> Response:
+        """List rental partners, newest first.
+
+        Pass the returned ``nextCursor`` as ``cursor`` to fetch the next page.
+        """
+        params = g.validated_params
+        page = listing_service.list_partners(
+            limit=params["limit"],
+            cursor=params["cursor"],
+            created_from=params["createdFrom"],
+            created_to=params["createdTo"],
+            first_name=params["firstName"],
+            last_name=params["lastName"],
+            phone=params["phone"],
+        )
+        response = PartnerListResponse(data=page, message="Partners retrieved")
+        return contract_response(response)
+
+    if search_index is not None:
+        _register_search_route(admin_bp, search_index, api_key)
+
+    @admin_bp.route("/partners/import", methods=["POST"])
+    @require_api_key(api_key)
+    @handle_controller_errors
+    def import_partners() -> Response:
+        """Import rental partners from a streamed CSV or NDJSON body."""
+        input_format = IMPORT_CONTENT_TYPES.get(request.mimetype)
+        if input_format is None:
+            raise ValidationError(
+                "Content-Type must be one of " + ", ".join(IMPORT_CONTENT_TYPES)
+            )
+
+        rejects: List[ImportReject] = []
+
+        def reject(line: int, row: Optional[Dict[str, Any]], reason: str) -> None:
+            if len(rejects) < MAX_REPORTED_REJECTS:
+                email = row.get("email") if row else None
+                rejects.append(
+                    ImportReject(
+                        line=line,
+                        email=email if isinstance(email, str) else None,
+                        reason=reason,
+                    )
+                )
+
+        lines = io.TextIOWrapper(request.stream, encoding="utf-8", newline="")
+        stats = import_service.import_rows(read_rows(lines, input_format), reject)
+
+        logger.info(f"Admin import finished: {stats.imported} imported")
+        response = ImportResponse(
+            data=ImportSummary(
+                processed=stats.processed,
+                imported=stats.imported,
+                rejected=stats.rejected,
+                rejects=rejects,
+            ),
+            message="Import completed",
+        )
+        return contract_response(response)
+
+    @admin_bp.route("/partners/export", methods=["GET"])
+    @require_api_key(api_key)
+    @handle_controller_errors
+    def export_partners() -> Response:
+        """Stream rental partners as a chunked NDJSON or CSV response.
+
+        Pass ``after`` with the last id received to resume an export.
+        """
+        output_format = request.args.get("format", "ndjson")
+        if output_format not in EXPORT_FORMATS:
+            raise ValidationError("format must be one of " + ", ".join(EXPORT_FORMATS))
+
+        after_id = request.args.get("after")
+        if after_id is not None and not is_uuid(after_id):
+            raise ValidationError("after must be a partner id")
+
+        lines = export_service.iter_lines(output_format, after_id)
+        return Response(
+            stream_with_context(lines), mimetype=EXPORT_MIMETYPES[output_format]
+        )
+
+    return admin_bp
+
+
+def _register_search_route(
+    admin_bp: Blueprint, search_index: PartnerSearchIndex, api_key: str
+) -> None:
+    @admin_bp.route("/partners/search", methods=["GET"])
+    @require_api_key(api_key)
+    @validate_query_params(PartnerSearchQuery)
+    @handle_controller_errors
+    def search_partners() -> Response:
+        """Find partners by partial name or email, best matches first."""
+        params = g.validated_params
+        hits = search_index.search(params["q"], params["limit"])
+        response = PartnerSearchResponse(
+            data=[
+                PartnerMatch(
+                    id=hit.id,
+                    email=hit.email,
+                    firstName=hit.first_name,
+                    lastName=hit.last_name,
+                )
+                for hit in hits
+            ],
+            message="Search completed",
+        )
+        return contract_response(response)
@@ -1,56 +1,90 @@
 """Authentication routes."""
 
-from typing import Any, Tuple
-from flask import Blueprint, jsonify, g
+from typing import Optional
+from flask import Blueprint, Response, g
 from app.services.auth_service import AuthService
-from app.contracts.auth_contracts import SignInRequest, SignUpRequest
-from app.utils.validators import validate_json
+from app.contracts.auth_contracts import SignInRequest, SignUpRequest, RefreshRequest
+from app.utils.tokens import TokenVerifier
+from app.utils.validators import validate_json, require_auth
+from app.utils.rate_limit import (
+    SlidingWindowLimiter,
+    rate_limit,
+    client_ip,
+    validated_email,
+)
 from app.utils.errors import handle_controller_errors
+from app.utils.json_provider import contract_response
 from app.utils.logging import setup_logger
 
 logger = setup_logger(__name__)
 
 
-def create_auth_routes(auth_service: AuthService) -> Blueprint:
-    """Create auth routes blueprint."""
+def create_auth_routes(
+    auth_service: AuthService,
+    token_verifier: Optional[TokenVerifier] = None,
+    ip_rate_limiter: Optional[SlidingWindowLimiter] = None,
+    email_rate_limiter: Optional[SlidingWindowLimiter] = None,
+) -> Blueprint:
+    """Create auth routes blueprint.
+
+    Sign-in attempts are throttled per client address before the body is
+    parsed and per email before any account lookup or password check.
+    """
     auth_bp = Blueprint("auth", __name__)
 
     @auth_bp.route("/partner/signin", methods=["POST"])
+    @rate_limit(ip_rate_limiter, client_ip)
     @validate_json(SignInRequest)
+    @rate_limit(email_rate_limiter, validated_email)
     @handle_controller_errors
-    def sign_in() -> Tuple[Any, int]:
+    def sign_in() -> Response:
         """Sign in rental partner."""
         logger.info("Received sign in request")
 
-        data = g.validated_json
+        body: SignInRequest = g.validated_body
         response = auth_service.sign_in(
-            email=data["email"],
-            password=data["password"],
-            remember_me=data.get("rememberMe", False),
+            email=body.email, password=body.password, remember_me=body.rememberMe
         )
 
         logger.info("Sign in successful")
-        return jsonify(response.model_dump()), 200
+        return contract_response(response)
 
     @auth_bp.route("/partner/signup", methods=["POST"])
     @validate_json(SignUpRequest)
     @handle_controller_errors
-    def sign_up() -> Tuple[Any, int]:
+    def sign_up() -> Response:
         """Sign up rental partner."""
         logger.info("Received sign up request")
 
-        data = g.validated_json
+        body: SignUpRequest = g.validated_body
         response = auth_service.sign_up(
-            email=data["email"],
-            password=data["password"],
-            confirm_password=data["confirmPassword"],
-            first_name=data["firstName"],
-            last_name=data["lastName"],
-            phone=data["phone"],
-            agree_to_terms=data["agreeToTerms"],
+            email=body.email,
+            password=body.password,
+            confirm_password=body.confirmPassword,
+            first_name=body.firstName,
+            last_name=body.lastName,
+            phone=body.phone,
+            agree_to_terms=body.agreeToTerms,
         )
 
         logger.info("Sign up successful")
-        return jsonify(response.model_dump()), 201
+        return contract_response(response, 201)
+
+    @auth_bp.route("/partner/refresh", methods=["POST"])
+    @validate_json(RefreshRequest)
+    @handle_controller_errors
+    def refresh() -> Response:
+        """Rotate a rental partner's refresh token."""
+        body: RefreshRequest = g.validated_body
+        response = auth_service.refresh(body.refreshToken)
+        return contract_response(response)
+
+    @auth_bp.route("/partner/me", methods=["GET"])
+    @require_auth(token_verifier)
+    @handle_controller_errors
+    def get_profile() -> Response:
+        """Get the authenticated rental partner's profile."""
+        response = auth_service.get_profile(g.user_id)
+        return contract_response(response)
 
     return auth_bp
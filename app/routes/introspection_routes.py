@@ -0,0 +1,57 @@
+"""Token introspection routes."""
+
+from typing import Any, Dict, Optional
+from flask import Blueprint, Response, g
+from app.contracts.auth_contracts import (
+    IntrospectionRequest,
+    IntrospectionResponse,
+    TokenIntrospection,
+)
+from app.utils.errors import handle_controller_errors
+from app.utils.json_provider import contract_response
+from app.utils.tokens import TokenVerifier
+from app.utils.validators import require_api_key, validate_json
+
+
+def create_introspection_routes(
+    token_verifier: TokenVerifier, api_key: str
+) -> Blueprint:
+    """Create the token introspection blueprint, guarded by an API key.
+
+    Gateways and internal services send every access token of a fan-out in
+    one request. Tokens are checked by the verifier that guards the auth
+    routes, so a token verified once is answered from its cache until it
+    expires.
+    """
+    introspection_bp = Blueprint("introspection", __name__)
+
+    @introspection_bp.route("/introspect", methods=["POST"])
+    @require_api_key(api_key)
+    @validate_json(IntrospectionRequest)
+    @handle_controller_errors
+    def introspect() -> Response:
+        """Report whether each access token is active, with its claims."""
+        body: IntrospectionRequest = g.validated_body
+        response = IntrospectionResponse(
+            data=[
+                _introspection(claims)
+                for claims in token_verifier.verify_many(body.tokens)
+            ],
+            message="Tokens introspected",
+        )
+        return contract_response(response)
+
+    return introspection_bp
+
+
+def _introspection(claims: Optional[Dict[str, Any]]) -> TokenIntrospection:
+    if claims is None:
+        return TokenIntrospection(active=False)
+    return TokenIntrospection(
+        active=True,
+        userId=claims["user_id"],
+        tokenType=claims.get("type"),
+        jti=claims.get("jti"),
+        issuedAt=claims["iat"],
+        expiresAt=claims["exp"],
+    )
@@ -0,0 +1,23 @@
+"""JSON Web Key Set routes."""
+
+import json
+from flask import Blueprint, Response, request
+from app.utils.signing_keys import KeyRing
+
+
+def create_jwks_routes(key_ring: KeyRing, max_age: int) -> Blueprint:
+    """Create the blueprint that publishes the token verification keys."""
+    jwks_bp = Blueprint("jwks", __name__)
+    body = json.dumps(key_ring.jwks())
+
+    @jwks_bp.route("/.well-known/jwks.json", methods=["GET"])
+    def jwks() -> Response:
+        """Publish public signing keys for local token verification."""
+        response = Response(body, mimetype="application/json")
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+        response.add_etag()
+        response.make_conditional(request)
+        return response
+
+    return jwks_bp
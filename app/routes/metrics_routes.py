@@ -0,0 +1,31 @@
+"""Internal metrics routes."""
+
+import os
+from typing import Any, Callable, Dict, Mapping
+from flask import Blueprint, jsonify, Response
+from app.utils.validators import require_api_key
+
+MetricsSource = Callable[[], Dict[str, Any]]
+
+
+def create_metrics_routes(
+    sources: Mapping[str, MetricsSource], api_key: str
+) -> Blueprint:
+    """Create the blueprint exposing this worker's runtime metrics.
+
+    Every worker keeps its own counters, so each response describes only the
+    process that served it. Callers must send ``api_key`` as ``X-API-Key``.
+    """
+    metrics_bp = Blueprint("metrics", __name__)
+
+    @metrics_bp.route("/internal/metrics", methods=["GET"])
+    @require_api_key(api_key)
+    def metrics() -> Response:
+        """Report pool, cache and filter metrics for this worker."""
+        body: Dict[str, Any] = {"pid": os.getpid()}
+        body.update({name: source() for name, source in sources.items()})
+        response = jsonify(body)
+        response.cache_control.no_store = True
+        return response
+
+    return metrics_bp
@@ -1,10 +1,62 @@
 """Authentication service."""
 
-from app.repositories.rental_partner_repository import RentalPartnerRepository
-from app.contracts.auth_contracts import AuthResponse, AuthData, UserData
-from app.utils.security import hash_password, verify_password, generate_token
-from app.utils.errors import ValidationError, UnauthorizedError, ConflictError
-from app.models.rental_partner import RentalPartner
+import time
+from typing import Optional
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from app.repositories.rental_partner_repository import (
+    RentalPartnerRepository,
+    is_duplicate_email,
+)
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+from app.services.token_revocation_service import TokenRevocationService
+from app.services.registered_email_index import RegisteredEmailIndex
+from app.services.partner_search_index import PartnerSearchIndex
+from app.contracts.auth_contracts import (
+    AuthResponse,
+    AuthData,
+    UserData,
+    ProfileResponse,
+    RefreshResponse,
+    TokenData,
+)
+from app.utils.security import (
+    hash_password,
+    start_hash_password,
+    verify_password,
+    verify_dummy_password,
+    password_needs_rehash,
+)
+from app.utils.tokens import REFRESH_TOKEN, TokenMinter, TokenVerifier
+from app.utils.errors import (
+    AppError,
+    ValidationError,
+    UnauthorizedError,
+    ConflictError,
+    NotFoundError,
+)
+from app.utils.logging import setup_logger
+from app.models.rental_partner import Partner
+
+logger = setup_logger(__name__)
+
+
+def check_sign_up_rules(
+    password: str,
+    confirm_password: str,
+    agree_to_terms: bool,
+    min_password_length: int,
+) -> None:
+    """Apply the sign-up rules beyond the request schema."""
+    if not agree_to_terms:
+        raise ValidationError("You must agree to terms and conditions")
+
+    if password != confirm_password:
+        raise ValidationError("Passwords do not match")
+
+    if len(password) < min_password_length:
+        raise ValidationError(
+            f"Password must be at least {min_password_length} characters"
+        )
 
 
 class AuthService:
@@ -18,6 +70,12 @@ class AuthService:
         refresh_expiration: int,
         min_password_length: int,
         remember_me_multiplier: int,
+        token_minter: Optional[TokenMinter] = None,
+        token_verifier: Optional[TokenVerifier] = None,
+        revocation_service: Optional[TokenRevocationService] = None,
+        email_index: Optional[RegisteredEmailIndex] = None,
+        optimistic_signup: bool = False,
+        search_index: Optional[PartnerSearchIndex] = None,
     ):
         self.repository = repository
         self.jwt_secret = jwt_secret
@@ -25,6 +83,14 @@ class AuthService:
         self.refresh_expiration = refresh_expiration
         self.min_password_length = min_password_length
         self.remember_me_multiplier = remember_me_multiplier
+        self.token_minter = token_minter or TokenMinter(jwt_secret, refresh_expiration)
+        self.token_verifier = token_verifier or TokenVerifier(jwt_secret)
+        self.revocation_service = revocation_service or TokenRevocationService(
+            RevokedTokenRepository()
+        )
+        self.email_index = email_index
+        self.optimistic_signup = optimistic_signup
+        self.search_index = search_index
 
     def sign_up(
         self,
@@ -36,44 +102,61 @@ class AuthService:
         phone: str,
         agree_to_terms: bool,
     ) -> AuthResponse:
-        """Register new rental partner."""
-        if not agree_to_terms:
-            raise ValidationError("You must agree to terms and conditions")
-
-        if password != confirm_password:
-            raise ValidationError("Passwords do not match")
+        """Register new rental partner.
 
-        if len(password) < self.min_password_length:
-            raise ValidationError(
-                f"Password must be at least {self.min_password_length} characters"
-            )
+        The password hash starts on the hashing pool before the duplicate
+        check so the two overlap. With ``optimistic_signup`` the check is
+        skipped and a duplicate is detected by the unique email index on
+        insert, saving a round trip per sign-up.
+        """
+        check_sign_up_rules(
+            password, confirm_password, agree_to_terms, self.min_password_length
+        )
 
-        existing = self.repository.find_by_email(email)
-        if existing:
+        pending_hash = start_hash_password(password)
+        if not self.optimistic_signup and self._find_by_email(email):
+            pending_hash.cancel()
             raise ConflictError("Email already exists", "email")
 
-        password_hash = hash_password(password)
-        partner = self.repository.create(
-            email=email,
-            password_hash=password_hash,
-            first_name=first_name,
-            last_name=last_name,
-            phone=phone,
-        )
+        try:
+            partner = self.repository.create(
+                email=email,
+                password_hash=pending_hash.result(),
+                first_name=first_name,
+                last_name=last_name,
+                phone=phone,
+            )
+        except IntegrityError as e:
+            if not is_duplicate_email(e):
+                raise
+            raise ConflictError("Email already exists", "email")
+        if self.email_index is not None:
+            self.email_index.add(email)
+        if self.search_index is not None:
+            self.search_index.add([partner])
 
         return self._create_auth_response(
             partner, "Registration successful", self.jwt_expiration
         )
 
     def sign_in(self, email: str, password: str, remember_me: bool) -> AuthResponse:
-        """Authenticate rental partner."""
+        """Authenticate rental partner.
+
+        The account is always looked up, even for emails missing from the
+        email index: a partner who just signed up on another pod is not in
+        this pod's filter until its next sync.
+        """
         partner = self.repository.find_by_email(email)
         if not partner:
+            verify_dummy_password(password)
             raise UnauthorizedError("Invalid email or password")
 
         if not verify_password(password, partner.password_hash):
             raise UnauthorizedError("Invalid email or password")
 
+        if password_needs_rehash(partner.password_hash):
+            self._rehash_password(partner, password)
+
         expiration = (
             self.jwt_expiration * self.remember_me_multiplier
             if remember_me
@@ -81,7 +164,67 @@ class AuthService:
         )
         return self._create_auth_response(partner, "Sign in successful", expiration)
 
-    def _create_user_data(self, partner: RentalPartner) -> UserData:
+    def refresh(self, refresh_token: str) -> RefreshResponse:
+        """Exchange a refresh token for a new token pair.
+
+        Each refresh token can be used once. Presenting one that was already
+        used revokes its whole rotation family, logging out both the
+        legitimate client and whoever replayed the token.
+        """
+        claims = self.token_verifier.verify(refresh_token, REFRESH_TOKEN)
+        jti, family_id = claims.get("jti"), claims.get("fam")
+        if not jti or not family_id:
+            raise UnauthorizedError("Invalid or expired token")
+
+        if self.revocation_service.is_revoked(family_id):
+            raise UnauthorizedError("Refresh token has been revoked")
+
+        if not self.revocation_service.consume(jti, claims["exp"]):
+            logger.warning(f"Refresh token reuse detected for family {family_id}")
+            family_expires_at = int(time.time()) + self.refresh_expiration * 3600
+            self.revocation_service.revoke_family(family_id, family_expires_at)
+            raise UnauthorizedError("Refresh token has been revoked")
+
+        token, new_refresh_token = self.token_minter.mint_pair(
+            claims["user_id"], self.jwt_expiration, family_id
+        )
+        return RefreshResponse(
+            data=TokenData(token=token, refreshToken=new_refresh_token),
+            message="Token refreshed",
+        )
+
+    def get_profile(self, partner_id: str) -> ProfileResponse:
+        """Return the profile of an authenticated rental partner."""
+        partner = self.repository.find_by_id(partner_id)
+        if not partner:
+            raise NotFoundError("Rental partner", partner_id)
+
+        return ProfileResponse(
+            data=self._create_user_data(partner), message="Profile retrieved"
+        )
+
+    def _find_by_email(self, email: str) -> Optional[Partner]:
+        """Look up a partner for the sign-up duplicate check.
+
+        Emails missing from the email index skip the database. A miss for an
+        email registered on another pod since the last sync is still caught
+        by the unique email index on insert.
+        """
+        if self.email_index is not None and not self.email_index.might_exist(email):
+            return None
+        return self.repository.find_by_email(email)
+
+    def _rehash_password(self, partner: Partner, password: str) -> None:
+        """Upgrade a stored hash to the current policy after a successful login."""
+        try:
+            password_hash = hash_password(password)
+            self.repository.update_password_hash(
+                partner.id, partner.email, password_hash
+            )
+        except (AppError, SQLAlchemyError) as e:
+            logger.warning(f"Password rehash skipped: {str(e)}")
+
+    def _create_user_data(self, partner: Partner) -> UserData:
         """Create UserData from RentalPartner."""
         return UserData(
             id=partner.id,
@@ -92,13 +235,10 @@ class AuthService:
         )
 
     def _create_auth_response(
-        self, partner: RentalPartner, message: str, token_expiration: int
+        self, partner: Partner, message: str, token_expiration: int
     ) -> AuthResponse:
         """Create AuthResponse with tokens and user data."""
-        token = generate_token(partner.id, self.jwt_secret, token_expiration)
-        refresh_token = generate_token(
-            partner.id, self.jwt_secret, self.refresh_expiration
-        )
+        token, refresh_token = self.token_minter.mint_pair(partner.id, token_expiration)
         user_data = self._create_user_data(partner)
         auth_data = AuthData(user=user_data, token=token, refreshToken=refresh_token)
         return AuthResponse(data=auth_data, message=message)
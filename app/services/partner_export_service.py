@@ -0,0 +1,84 @@
+"""Rental partner export service."""
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+from app.repositories.rental_partner_repository import RentalPartnerRepository
+
+EXPORT_FORMATS = ("ndjson", "csv")
+
+# Everything except password_hash.
+EXPORT_COLUMNS = (
+    "id",
+    "email",
+    "first_name",
+    "last_name",
+    "phone",
+    "created_at",
+    "updated_at",
+)
+
+
+def _serialize(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+class PartnerExportService:
+    """Stream rental partners as NDJSON or CSV lines.
+
+    Only the columns in ``EXPORT_COLUMNS`` are selected, rows are read from
+    a server-side cursor in id order and written one line at a time, so an
+    export of any size runs in constant memory and can resume after the
+    last exported id.
+    """
+
+    def __init__(
+        self,
+        repository: RentalPartnerRepository,
+        batch_size: int = 1000,
+        columns: Sequence[str] = EXPORT_COLUMNS,
+    ):
+        self.repository = repository
+        self.batch_size = batch_size
+        self.columns = tuple(columns)
+
+    def iter_records(
+        self, after_id: Optional[str] = None, batch_size: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream partners as dicts of exported columns."""
+        for row in self.repository.iter_export(
+            self.columns, after_id, batch_size or self.batch_size
+        ):
+            yield {
+                column: _serialize(value) for column, value in zip(self.columns, row)
+            }
+
+    def iter_lines(
+        self,
+        output_format: str,
+        after_id: Optional[str] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[str]:
+        """Stream partners as newline-terminated NDJSON or CSV lines."""
+        records = self.iter_records(after_id, batch_size)
+        if output_format == "ndjson":
+            for record in records:
+                yield json.dumps(record) + "\n"
+        elif output_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=self.columns)
+            writer.writeheader()
+            for record in records:
+                writer.writerow(record)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            if buffer.tell():
+                yield buffer.getvalue()
+        else:
+            raise ValueError(
+                f"Export format must be one of {', '.join(EXPORT_FORMATS)}"
+            )
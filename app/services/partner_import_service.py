@@ -0,0 +1,284 @@
+"""Bulk rental partner import service."""
+
+import csv
+import json
+import time
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy.exc import IntegrityError
+
+from app.contracts.auth_contracts import SignUpRequest
+from app.models.rental_partner import RentalPartnerRecord
+from app.repositories.rental_partner_repository import (
+    RentalPartnerRepository,
+    is_duplicate_email,
+)
+from app.services.auth_service import check_sign_up_rules
+from app.services.partner_search_index import PartnerSearchIndex
+from app.services.registered_email_index import (
+    RegisteredEmailIndex,
+    normalize_email,
+)
+from app.utils.errors import AppError
+from app.utils.hashing_executor import HashingExecutor
+from app.utils.ids import uuid7
+from app.utils.logging import setup_logger
+from app.utils.security import get_password_hashers
+
+logger = setup_logger(__name__)
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+# (line number, row) pairs; a row is None when the line could not be parsed.
+Rows = Iterable[Tuple[int, Optional[Dict[str, Any]]]]
+RejectHandler = Callable[[int, Optional[Dict[str, Any]], str], None]
+
+
+def read_csv_rows(lines: Iterable[str]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Stream CSV rows keyed by the header, numbered by input line."""
+    reader = csv.DictReader(lines)
+    for row in reader:
+        yield reader.line_num, dict(row)
+
+
+def read_ndjson_rows(
+    lines: Iterable[str],
+) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+    """Stream one JSON object per line, skipping blank lines."""
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            row = None
+        yield line_number, row if isinstance(row, dict) else None
+
+
+def read_rows(lines: Iterable[str], input_format: str) -> Rows:
+    """Stream rows of the given format: ``csv`` or ``ndjson``."""
+    if input_format == "csv":
+        return read_csv_rows(lines)
+    if input_format == "ndjson":
+        return read_ndjson_rows(lines)
+    raise ValueError(f"Import format must be one of {', '.join(IMPORT_FORMATS)}")
+
+
+@dataclass
+class ImportStats:
+    """Running totals of an import."""
+
+    processed: int = 0
+    imported: int = 0
+    rejected: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = time.monotonic() - self.started_at
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+
+@dataclass
+class _PendingRow:
+    line_number: int
+    row: Dict[str, Any]
+    request: SignUpRequest
+
+
+class PartnerImportService:
+    """Import rental partners in batches.
+
+    Rows are validated like sign-up requests, passwords of a batch are
+    hashed in parallel on ``hashing_executor``, and each batch is inserted
+    with one executemany and one commit. Emails already registered or
+    repeated in the input are rejected rather than failing the batch.
+    """
+
+    def __init__(
+        self,
+        repository: RentalPartnerRepository,
+        hashing_executor: HashingExecutor,
+        min_password_length: int,
+        batch_size: int = 500,
+        email_index: Optional[RegisteredEmailIndex] = None,
+        search_index: Optional[PartnerSearchIndex] = None,
+    ):
+        self.repository = repository
+        self.hashing_executor = hashing_executor
+        self.min_password_length = min_password_length
+        self.batch_size = batch_size
+        self.email_index = email_index
+        self.search_index = search_index
+
+    def import_rows(
+        self,
+        rows: Rows,
+        reject: RejectHandler,
+        progress: Optional[Callable[[ImportStats], None]] = None,
+        batch_size: Optional[int] = None,
+    ) -> ImportStats:
+        """Validate and insert rows, reporting each rejected row to ``reject``."""
+        batch_size = batch_size or self.batch_size
+        stats = ImportStats()
+        seen: Set[str] = set()
+        batch: List[_PendingRow] = []
+
+        def rejected(
+            line_number: int, row: Optional[Dict[str, Any]], reason: str
+        ) -> None:
+            stats.rejected += 1
+            reject(line_number, row, reason)
+
+        for line_number, row in rows:
+            stats.processed += 1
+            pending = self._accept(line_number, row, seen, rejected)
+            if pending is None:
+                continue
+            batch.append(pending)
+            if len(batch) >= batch_size:
+                stats.imported += self._import_batch(batch, rejected)
+                batch = []
+                if progress is not None:
+                    progress(stats)
+
+        if batch:
+            stats.imported += self._import_batch(batch, rejected)
+        if progress is not None:
+            progress(stats)
+        logger.info(
+            f"Imported {stats.imported} rental partners, rejected {stats.rejected}"
+        )
+        return stats
+
+    def _accept(
+        self,
+        line_number: int,
+        row: Optional[Dict[str, Any]],
+        seen: Set[str],
+        rejected: RejectHandler,
+    ) -> Optional[_PendingRow]:
+        """Validate a row and drop repeats of an email earlier in the input."""
+        if row is None:
+            rejected(line_number, None, "Malformed record")
+            return None
+        try:
+            request = self._validate(row)
+        except AppError as e:
+            rejected(line_number, row, e.message)
+            return None
+
+        email = normalize_email(request.email)
+        if email in seen:
+            rejected(line_number, row, "Duplicate email in input")
+            return None
+        seen.add(email)
+        return _PendingRow(line_number, row, request)
+
+    def _validate(self, row: Dict[str, Any]) -> SignUpRequest:
+        try:
+            request = SignUpRequest(**row)
+        except (PydanticValidationError, TypeError) as e:
+            raise AppError(_describe_validation_error(e))
+        check_sign_up_rules(
+            request.password,
+            request.confirmPassword,
+            request.agreeToTerms,
+            self.min_password_length,
+        )
+        return request
+
+    def _import_batch(self, batch: List[_PendingRow], rejected: RejectHandler) -> int:
+        existing = {
+            normalize_email(email)
+            for email in self.repository.find_existing_emails(
+                pending.request.email for pending in batch
+            )
+        }
+        fresh = []
+        for pending in batch:
+            if normalize_email(pending.request.email) in existing:
+                rejected(pending.line_number, pending.row, "Email already exists")
+            else:
+                fresh.append(pending)
+
+        records = self._hash_records(fresh)
+        try:
+            self.repository.create_many(records)
+        except IntegrityError:
+            # Another writer registered one of the emails since the check.
+            return self._import_one_by_one(fresh, records, rejected)
+
+        self._index(records)
+        return len(records)
+
+    def _import_one_by_one(
+        self,
+        batch: List[_PendingRow],
+        records: List[RentalPartnerRecord],
+        rejected: RejectHandler,
+    ) -> int:
+        imported = []
+        for pending, record in zip(batch, records):
+            try:
+                self.repository.create_many([record])
+            except IntegrityError as e:
+                if not is_duplicate_email(e):
+                    raise
+                rejected(pending.line_number, pending.row, "Email already exists")
+            else:
+                imported.append(record)
+        self._index(imported)
+        return len(imported)
+
+    def _hash_records(self, batch: List[_PendingRow]) -> List[RentalPartnerRecord]:
+        executor = self.hashing_executor
+        hash_password = get_password_hashers().hash
+        # Never submit more than the pool accepts at once.
+        window = executor.max_workers + executor.max_queue_size
+        password_hashes: List[str] = []
+        for start in range(0, len(batch), window):
+            futures = [
+                executor.submit(hash_password, pending.request.password)
+                for pending in batch[start : start + window]
+            ]
+            password_hashes.extend(executor.result(future) for future in futures)
+
+        return [
+            RentalPartnerRecord(
+                id=uuid7(),
+                email=pending.request.email,
+                password_hash=password_hash,
+                first_name=pending.request.firstName,
+                last_name=pending.request.lastName,
+                phone=pending.request.phone,
+            )
+            for pending, password_hash in zip(batch, password_hashes)
+        ]
+
+    def _index(self, records: List[RentalPartnerRecord]) -> None:
+        if self.email_index is not None:
+            for record in records:
+                self.email_index.add(record.email)
+        if self.search_index is not None:
+            self.search_index.add(records)
+
+
+def _describe_validation_error(error: Exception) -> str:
+    if not isinstance(error, PydanticValidationError):
+        return "Malformed record"
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in e['loc'])}: {e['msg']}" for e in error.errors()
+    )
@@ -0,0 +1,83 @@
+"""Rental partner listing service."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+
+from app.contracts.admin_contracts import MAX_PAGE_SIZE, PartnerPage, PartnerSummary
+from app.repositories.rental_partner_repository import RentalPartnerRepository
+from app.utils.errors import ValidationError
+from app.utils.ids import is_uuid
+
+
+def encode_cursor(created_at: datetime, partner_id: str) -> str:
+    """Pack a keyset position into an opaque URL-safe cursor."""
+    payload = json.dumps([created_at.isoformat(), partner_id]).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Unpack a cursor made by ``encode_cursor``."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, partner_id = json.loads(base64.urlsafe_b64decode(padded))
+        position = datetime.fromisoformat(created_at), partner_id
+    except (binascii.Error, ValueError, TypeError):
+        raise ValidationError("Invalid cursor", "cursor")
+    if not is_uuid(partner_id):
+        raise ValidationError("Invalid cursor", "cursor")
+    return position
+
+
+class PartnerListingService:
+    """Page through rental partners, newest first, with keyset cursors.
+
+    Page sizes are capped at ``max_page_size``. One extra row is read to
+    tell whether a next page exists, so the last page has no cursor.
+    """
+
+    def __init__(
+        self, repository: RentalPartnerRepository, max_page_size: int = MAX_PAGE_SIZE
+    ):
+        self.repository = repository
+        self.max_page_size = max_page_size
+
+    def list_partners(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        first_name: Optional[str] = None,
+        last_name: Optional[str] = None,
+        phone: Optional[str] = None,
+    ) -> PartnerPage:
+        """Return one page of partners matching the filters."""
+        limit = max(1, min(limit, self.max_page_size))
+        rows = self.repository.list_page(
+            limit + 1,
+            after=decode_cursor(cursor) if cursor else None,
+            created_from=created_from,
+            created_to=created_to,
+            first_name=first_name,
+            last_name=last_name,
+            phone=phone,
+        )
+        partners = [
+            PartnerSummary(
+                id=row.id,
+                email=row.email,
+                firstName=row.first_name,
+                lastName=row.last_name,
+                phone=row.phone,
+                createdAt=row.created_at,
+            )
+            for row in rows[:limit]
+        ]
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return PartnerPage(partners=partners, nextCursor=next_cursor)
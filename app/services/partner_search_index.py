@@ -0,0 +1,350 @@
+"""Partner search index service."""
+
+import bisect
+import heapq
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from flask import Flask, current_app
+
+from app.repositories.rental_partner_repository import RentalPartnerRepository
+from app.utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+GRAM_SIZE = 3
+MERGE_THRESHOLD = 64
+
+
+class SearchHit(NamedTuple):
+    """A partner matching a search."""
+
+    id: str
+    email: str
+    first_name: str
+    last_name: str
+
+
+def _trigrams(term: str) -> Set[str]:
+    return {term[i : i + GRAM_SIZE] for i in range(len(term) - GRAM_SIZE + 1)}
+
+
+def _rank(query: str, terms: Tuple[str, ...]) -> int:
+    if query in terms:
+        return 0
+    if any(term.startswith(query) for term in terms):
+        return 1
+    return 2
+
+
+class _IndexData:
+    """The index structures, with their memory footprint kept up to date.
+
+    Not thread-safe: ``PartnerSearchIndex`` serializes access.
+    """
+
+    def __init__(self) -> None:
+        self.hits: List[Optional[SearchHit]] = []
+        self.terms: List[Optional[Tuple[str, ...]]] = []
+        self.slots: Dict[str, int] = {}
+        self.postings: Dict[str, Set[int]] = {}
+        self.sorted_terms: List[Tuple[str, int]] = []
+        # Bytes held by the entries; the containers are measured on demand.
+        self.entry_bytes = 0
+
+    def add(self, hits: Iterable[SearchHit]) -> None:
+        pending: List[Tuple[str, int]] = []
+        for hit in hits:
+            slot = self.slots.get(hit.id)
+            if slot is not None and self.hits[slot] == hit:
+                continue
+            if slot is None:
+                slot = len(self.hits)
+                self.slots[hit.id] = slot
+                self.hits.append(None)
+                self.terms.append(None)
+                self.entry_bytes += sys.getsizeof(hit.id)
+            else:
+                self._merge_terms(pending)
+                pending = []
+                self._remove(slot)
+
+            terms = tuple(
+                dict.fromkeys(
+                    term.strip().lower()
+                    for term in (hit.email, hit.first_name, hit.last_name)
+                    if term.strip()
+                )
+            )
+            self.hits[slot] = hit
+            self.terms[slot] = terms
+            self.entry_bytes += sys.getsizeof(hit) + sum(map(sys.getsizeof, hit[1:]))
+            for term in terms:
+                pending.append((term, slot))
+                for gram in _trigrams(term):
+                    self._post(gram, slot)
+        self._merge_terms(pending)
+
+    def _post(self, gram: str, slot: int) -> None:
+        slots = self.postings.get(gram)
+        if slots is None:
+            slots = self.postings[gram] = set()
+            self.entry_bytes += sys.getsizeof(gram)
+        before = sys.getsizeof(slots)
+        slots.add(slot)
+        self.entry_bytes += sys.getsizeof(slots) - before
+
+    def _merge_terms(self, pending: List[Tuple[str, int]]) -> None:
+        """Add terms to the sorted list: one by one if few, else by re-sorting."""
+        if len(pending) < MERGE_THRESHOLD:
+            for entry in pending:
+                bisect.insort(self.sorted_terms, entry)
+        else:
+            self.sorted_terms.extend(pending)
+            self.sorted_terms.sort()
+        self.entry_bytes += sum(map(sys.getsizeof, pending))
+
+    def _remove(self, slot: int) -> None:
+        hit = self.hits[slot]
+        if hit is not None:
+            self.entry_bytes -= sys.getsizeof(hit) + sum(map(sys.getsizeof, hit[1:]))
+        for term in self.terms[slot] or ():
+            position = bisect.bisect_left(self.sorted_terms, (term, slot))
+            self.entry_bytes -= sys.getsizeof(self.sorted_terms[position])
+            del self.sorted_terms[position]
+            for gram in _trigrams(term):
+                self.postings[gram].discard(slot)
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the index structures."""
+        return self.entry_bytes + sum(
+            map(
+                sys.getsizeof,
+                (
+                    self.hits,
+                    self.terms,
+                    self.slots,
+                    self.postings,
+                    self.sorted_terms,
+                ),
+            )
+        )
+
+
+class PartnerSearchIndex:
+    """In-process trigram and prefix index over partner names and emails.
+
+    Queries of three or more characters intersect the posting sets of their
+    trigrams and confirm each candidate by substring, ranking exact matches
+    first, then prefix matches, then other substrings. Shorter queries walk
+    a sorted term list and return exact then prefix matches in term order.
+
+    The index is built by a background scan started with ``warm()`` or the
+    first search; until it is ready, searches fall back to a database
+    ``LIKE`` query. After that it
+    is updated when this worker creates partners and pulls partners created
+    by other workers every ``sync_interval`` seconds. Each sync rereads the
+    last ``sync_overlap`` seconds, because ``created_at`` is set before
+    commit and rows can commit out of order; reread rows that have not
+    changed are skipped.
+
+    Rows are read from the database without holding the index lock: the
+    first build fills a separate index that is swapped in, and later syncs
+    fetch their rows before merging them, so searches and sign-ups only
+    wait for the merge.
+    """
+
+    def __init__(
+        self,
+        repository: RentalPartnerRepository,
+        sync_interval: float = 10.0,
+        batch_size: int = 1000,
+        sync_overlap: float = 60.0,
+    ):
+        self.repository = repository
+        self.sync_interval = sync_interval
+        self.batch_size = batch_size
+        self.sync_overlap = timedelta(seconds=sync_overlap)
+
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._warming: Optional[threading.Thread] = None
+        self._data = _IndexData()
+        self._watermark: Optional[datetime] = None
+        self._synced_at: Optional[float] = None
+        self._index_searches = 0
+        self._database_searches = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._synced_at is not None
+
+    def warm(self, app: Optional[Flask] = None) -> None:
+        """Start building the index in a background thread, once."""
+        with self._lock:
+            if self.ready or self._warming is not None:
+                return
+            flask_app = app or current_app._get_current_object()  # type: ignore
+            self._warming = threading.Thread(
+                target=self._warm, args=(flask_app,), name="search-index", daemon=True
+            )
+            self._warming.start()
+
+    def _warm(self, app: Flask) -> None:
+        started = time.perf_counter()
+        try:
+            with app.app_context():
+                self.sync()
+        except Exception as e:
+            logger.error(f"Search index build failed: {str(e)}")
+            with self._lock:
+                self._warming = None
+            return
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"Search index built: {len(self._data.slots)} partners in {elapsed:.1f}s"
+        )
+
+    def sync(self) -> None:
+        """Load partners created since the last sync into the index."""
+        with self._sync_lock:
+            self._sync_unlocked()
+
+    def _sync_unlocked(self) -> None:
+        # Runs under _sync_lock only; _lock is taken just to merge or swap.
+        if not self.ready:
+            data = _IndexData()
+            data.add(self._fetch())
+            with self._lock:
+                # Keep partners this worker added while the build ran.
+                data.add(hit for hit in self._data.hits if hit is not None)
+                self._data = data
+                self._synced_at = time.monotonic()
+            return
+
+        hits = list(self._fetch())
+        with self._lock:
+            self._data.add(hits)
+            self._synced_at = time.monotonic()
+
+    def _fetch(self) -> Iterator[SearchHit]:
+        """Stream partners created since the watermark, advancing it."""
+        since = None
+        if self._watermark is not None:
+            since = self._watermark - self.sync_overlap
+        for (
+            partner_id,
+            email,
+            first_name,
+            last_name,
+            created_at,
+        ) in self.repository.iter_search_fields(
+            since=since, batch_size=self.batch_size
+        ):
+            yield SearchHit(partner_id, email, first_name, last_name)
+            if self._watermark is None or created_at > self._watermark:
+                self._watermark = created_at
+
+    def _sync_if_stale(self) -> None:
+        synced_at = self._synced_at
+        if synced_at is None or time.monotonic() - synced_at < self.sync_interval:
+            return
+        if self._sync_lock.acquire(blocking=False):
+            try:
+                self._sync_unlocked()
+            finally:
+                self._sync_lock.release()
+
+    def add(self, partners: Iterable[Any]) -> None:
+        """Index newly created partners (records with id, email and names)."""
+        hits = [
+            SearchHit(partner.id, partner.email, partner.first_name, partner.last_name)
+            for partner in partners
+        ]
+        with self._lock:
+            self._data.add(hits)
+
+    def search(self, query: str, limit: int = 10) -> List[SearchHit]:
+        """Return up to ``limit`` ranked matches for a partial name or email."""
+        query = query.strip().lower()
+        if not query:
+            return []
+        if not self.ready:
+            self.warm()
+            self._database_searches += 1
+            rows = self.repository.search_like(query, limit)
+            return [SearchHit._make(row) for row in rows]
+
+        self._sync_if_stale()
+        with self._lock:
+            self._index_searches += 1
+            data = self._data
+            if len(query) < GRAM_SIZE:
+                slots = _prefix_matches(data, query, limit)
+            else:
+                slots = _substring_matches(data, query, limit)
+            return [hit for hit in map(data.hits.__getitem__, slots) if hit]
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the index structures."""
+        with self._lock:
+            return self._data.memory_bytes()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return index size, memory footprint and search counters."""
+        return {
+            "ready": self.ready,
+            "partners": len(self._data.slots),
+            "trigrams": len(self._data.postings),
+            "memory_bytes": self.memory_bytes(),
+            "index_searches": self._index_searches,
+            "database_searches": self._database_searches,
+        }
+
+
+def _prefix_matches(data: _IndexData, query: str, limit: int) -> List[int]:
+    # Walking the sorted terms from the query yields an exact match
+    # first, then longer terms in order, so the scan stops at ``limit``.
+    slots: Dict[int, None] = {}
+    position = bisect.bisect_left(data.sorted_terms, (query, -1))
+    while len(slots) < limit and position < len(data.sorted_terms):
+        term, slot = data.sorted_terms[position]
+        if not term.startswith(query):
+            break
+        slots[slot] = None
+        position += 1
+    return list(slots)
+
+
+def _substring_matches(data: _IndexData, query: str, limit: int) -> List[int]:
+    ranked = []
+    for slot in _substring_candidates(data, query):
+        hit, terms = data.hits[slot], data.terms[slot]
+        if hit is not None and terms is not None:
+            ranked.append((_rank(query, terms), hit.last_name, hit.first_name, slot))
+    return [item[3] for item in heapq.nsmallest(limit, ranked)]
+
+
+def _substring_candidates(data: _IndexData, query: str) -> Set[int]:
+    postings = sorted(
+        (data.postings.get(gram, set()) for gram in _trigrams(query)), key=len
+    )
+    candidates = set(postings[0]).intersection(*postings[1:])
+    return {
+        slot
+        for slot in candidates
+        if any(query in term for term in data.terms[slot] or ())
+    }
@@ -0,0 +1,118 @@
+"""Registered email index service."""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from app.repositories.rental_partner_repository import RentalPartnerRepository
+from app.utils.bloom import BloomFilter
+from app.utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def normalize_email(email: str) -> str:
+    """Normalize an email the way the database compares it."""
+    return email.strip().lower()
+
+
+class RegisteredEmailIndex:
+    """Bloom filter of registered rental partner emails.
+
+    A filter miss means the email was not registered as of the last sync,
+    so callers can skip the database lookup where a stale miss is caught
+    later, as the unique email index does for sign-up; a hit still has to
+    be confirmed against the database. The filter bits are in shared memory: created before the
+    server forks, every worker sees a registration as soon as the worker
+    handling it calls ``add``. The filter is built with a streaming scan
+    on first use and pulls partners written by other processes, such as
+    imports, every ``sync_interval`` seconds. Each sync rereads the last
+    ``sync_overlap`` seconds, because ``created_at`` is set before commit
+    and rows can commit out of order.
+    """
+
+    def __init__(
+        self,
+        repository: RentalPartnerRepository,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        sync_interval: float = 10.0,
+        batch_size: int = 1000,
+        sync_overlap: float = 60.0,
+    ):
+        self.repository = repository
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self.batch_size = batch_size
+        self.sync_overlap = timedelta(seconds=sync_overlap)
+
+        self._filter = BloomFilter(capacity, error_rate, shared=True)
+        self._lock = threading.Lock()
+        self._watermark: Optional[datetime] = None
+        self._synced_at: Optional[float] = None
+        self._database_checks = 0
+        self._filter_skips = 0
+
+    def sync(self, full: bool = False) -> None:
+        """Load emails registered since the last sync into the filter."""
+        with self._lock:
+            self._sync_locked(full)
+
+    def _sync_locked(self, full: bool = False) -> None:
+        if full or self._filter.saturated:
+            # Rebuild off to the side and copy the bits into the shared
+            # filter, then catch up on what was registered meanwhile.
+            rebuilt = BloomFilter(self.capacity, self.error_rate)
+            self._watermark = self._load(rebuilt, None)
+            self._filter.load(rebuilt)
+
+        self._watermark = self._load(self._filter, self._watermark)
+        self._synced_at = time.monotonic()
+
+    def _load(
+        self, bloom: BloomFilter, watermark: Optional[datetime]
+    ) -> Optional[datetime]:
+        since = None if watermark is None else watermark - self.sync_overlap
+        for email, created_at in self.repository.iter_emails(
+            since=since, batch_size=self.batch_size
+        ):
+            bloom.add(normalize_email(email))
+            if watermark is None or created_at > watermark:
+                watermark = created_at
+        return watermark
+
+    def _sync_if_stale(self) -> None:
+        synced_at = self._synced_at
+        if synced_at is not None and time.monotonic() - synced_at < self.sync_interval:
+            return
+        if synced_at is None:
+            self.sync()
+        elif self._lock.acquire(blocking=False):
+            try:
+                self._sync_locked()
+            finally:
+                self._lock.release()
+
+    def might_exist(self, email: str) -> bool:
+        """Return False only if the email was not registered at the last sync."""
+        self._sync_if_stale()
+        if normalize_email(email) not in self._filter:
+            self._filter_skips += 1
+            return False
+        self._database_checks += 1
+        return True
+
+    def add(self, email: str) -> None:
+        """Record a newly registered email."""
+        self._filter.add(normalize_email(email))
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return filter size and lookup counters."""
+        return {
+            "filter_items": self._filter.count,
+            "filter_bytes": self._filter.size_bytes,
+            "filter_skips": self._filter_skips,
+            "database_checks": self._database_checks,
+        }
@@ -0,0 +1,130 @@
+"""Refresh token revocation service."""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from app.models.revoked_token import FAMILY, TOKEN
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+from app.utils.bloom import BloomFilter
+from app.utils.logging import setup_logger
+from app.utils.timezone import from_timestamp_ist, now_ist
+
+logger = setup_logger(__name__)
+
+
+class TokenRevocationService:
+    """Revocation index for refresh token ids and token families.
+
+    Revocations are stored in the database. Revoked families are mirrored
+    into a Bloom filter in shared memory, so a family revoked by one worker
+    forked from the same master is revoked in all of them at once. A filter
+    miss means "not revoked" without a database query; only filter hits are
+    confirmed against the database. Revocations written by other processes
+    are pulled every ``sync_interval`` seconds, rereading the last
+    ``sync_overlap`` seconds because rows can commit out of order. Consumed
+    token ids are not mirrored: consuming a refresh token is a database
+    insert whose uniqueness already enforces one-time use.
+    """
+
+    def __init__(
+        self,
+        repository: RevokedTokenRepository,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        sync_interval: float = 30.0,
+        batch_size: int = 1000,
+        sync_overlap: float = 60.0,
+    ):
+        self.repository = repository
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self.batch_size = batch_size
+        self.sync_overlap = timedelta(seconds=sync_overlap)
+
+        self._filter = BloomFilter(capacity, error_rate, shared=True)
+        self._lock = threading.Lock()
+        self._watermark: Optional[datetime] = None
+        self._synced_at: Optional[float] = None
+        self._database_checks = 0
+        self._filter_skips = 0
+
+    def sync(self, full: bool = False) -> None:
+        """Load revocations recorded since the last sync into the filter."""
+        with self._lock:
+            self._sync_locked(full)
+
+    def _sync_locked(self, full: bool = False) -> None:
+        if full or self._filter.saturated:
+            # Bloom filters cannot forget; rebuilding drops expired entries.
+            # The rebuilt bits are copied into the shared filter, then
+            # revocations recorded meanwhile are caught up on.
+            rebuilt = BloomFilter(self.capacity, self.error_rate)
+            self._watermark = self._load(rebuilt, None)
+            self._filter.load(rebuilt)
+
+        self._watermark = self._load(self._filter, self._watermark)
+        self._synced_at = time.monotonic()
+
+    def _load(
+        self, bloom: BloomFilter, watermark: Optional[datetime]
+    ) -> Optional[datetime]:
+        since = None if watermark is None else watermark - self.sync_overlap
+        for family_id, created_at in self.repository.iter_active(
+            now_ist(), since=since, batch_size=self.batch_size, kind=FAMILY
+        ):
+            bloom.add(family_id)
+            if watermark is None or created_at > watermark:
+                watermark = created_at
+        return watermark
+
+    def _sync_if_stale(self) -> None:
+        synced_at = self._synced_at
+        if synced_at is not None and time.monotonic() - synced_at < self.sync_interval:
+            return
+        if synced_at is None:
+            self.sync()
+        elif self._lock.acquire(blocking=False):
+            # Another thread already refreshing the filter is good enough.
+            try:
+                self._sync_locked()
+            finally:
+                self._lock.release()
+
+    def is_revoked(self, family_id: str) -> bool:
+        """Check whether a token family has been revoked."""
+        self._sync_if_stale()
+        if family_id not in self._filter:
+            self._filter_skips += 1
+            return False
+        self._database_checks += 1
+        return self.repository.exists(family_id)
+
+    def consume(self, jti: str, expires_at: int) -> bool:
+        """Mark a refresh token as used; return False if it was used before."""
+        return self.repository.add(jti, TOKEN, from_timestamp_ist(expires_at))
+
+    def revoke_family(self, family_id: str, expires_at: int) -> None:
+        """Revoke every refresh token issued in a rotation family."""
+        self.repository.add(family_id, FAMILY, from_timestamp_ist(expires_at))
+        self._filter.add(family_id)
+        logger.warning(f"Revoked refresh token family {family_id}")
+
+    def sweep_expired(self, batch_size: Optional[int] = None) -> int:
+        """Delete expired revocations in batches."""
+        deleted = self.repository.delete_expired(
+            now_ist(), batch_size or self.batch_size
+        )
+        logger.info(f"Swept {deleted} expired token revocations")
+        return deleted
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return filter size and lookup counters."""
+        return {
+            "filter_items": self._filter.count,
+            "filter_bytes": self._filter.size_bytes,
+            "filter_skips": self._filter_skips,
+            "database_checks": self._database_checks,
+        }
@@ -0,0 +1,81 @@
+"""Process lifecycle hooks for serving the app under gunicorn."""
+
+import gc
+
+from flask import Flask
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.models.base import db
+from app.utils.errors import AppError
+from app.utils.logging import setup_logger
+from app.utils.security import verify_dummy_password
+
+logger = setup_logger(__name__)
+
+# Extensions holding in-memory filters and indexes built from the database.
+PRELOADED_EXTENSIONS = ("revocation_service", "email_index", "search_index")
+
+
+def prepare_master(app: Flask) -> None:
+    """Build the in-memory indexes once in the master before forking workers.
+
+    Workers inherit them copy-on-write and only sync what changed since.
+    The master's database connections are closed so no worker inherits a
+    socket, and the preloaded heap is frozen out of the garbage collector so
+    collections in workers do not touch, and copy, the shared pages.
+    """
+    with app.app_context():
+        for name in PRELOADED_EXTENSIONS:
+            extension = app.extensions.get(name)
+            if extension is None:
+                continue
+            try:
+                extension.sync()
+            except SQLAlchemyError as e:
+                logger.warning(f"Preloading {name} skipped: {str(e)}")
+        _dispose_engines(close=True)
+    gc.freeze()
+
+
+def warm_worker(app: Flask, connections: int) -> None:
+    """Prepare a freshly forked worker before it accepts requests.
+
+    Opens ``connections`` pooled database connections and runs one dummy
+    password verification, which starts the hashing pool in this process.
+    """
+    with app.app_context():
+        _dispose_engines(close=False)
+        _prime_pool(db.engine, connections)
+    try:
+        verify_dummy_password("warm-up")
+    except AppError as e:
+        logger.warning(f"Hashing warm-up skipped: {e.message}")
+
+
+def drain_worker(app: Flask) -> None:
+    """Release a worker's resources once it has finished in-flight requests."""
+    hashing_executor = app.extensions.get("hashing_executor")
+    if hashing_executor is not None:
+        hashing_executor.shutdown(wait=True)
+    with app.app_context():
+        _dispose_engines(close=True)
+
+
+def _dispose_engines(close: bool) -> None:
+    # With close=False, connections inherited across a fork are dropped
+    # without closing the sockets the parent still owns.
+    for engine in db.engines.values():
+        engine.dispose(close=close)
+
+
+def _prime_pool(engine: Engine, connections: int) -> None:
+    opened = []
+    try:
+        for _ in range(connections):
+            opened.append(engine.connect())
+    except SQLAlchemyError as e:
+        logger.warning(f"Database pool warm-up stopped: {str(e)}")
+    finally:
+        for connection in opened:
+            connection.close()
@@ -0,0 +1,106 @@
+"""Compact probabilistic set membership."""
+
+import hashlib
+import math
+import mmap
+import multiprocessing
+import struct
+import threading
+from typing import Iterable, Iterator, Union
+
+
+class BloomFilter:
+    """A fixed-size Bloom filter over strings.
+
+    ``item in bloom`` is never False for an item that was added, and is True
+    for an item that was not added with probability of about ``error_rate``
+    while no more than ``capacity`` items have been added.
+
+    With ``shared=True`` the bits live in an anonymous shared memory map, so
+    a filter created before the server forks (for example with gunicorn's
+    ``preload_app``) is one filter for every worker: an item added in one
+    worker is a member in all of them.
+    """
+
+    _COUNT = struct.Struct("<q")
+
+    def __init__(self, capacity: int, error_rate: float = 0.001, shared: bool = False):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.shared = shared
+        self.num_bits = max(
+            8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        )
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._size = (self.num_bits + 7) // 8
+        # The item count is stored after the bits so it is shared with them.
+        self._bits: Union[bytearray, mmap.mmap]
+        if shared:
+            self._bits = mmap.mmap(-1, self._size + self._COUNT.size)
+            self._lock = multiprocessing.Lock()
+        else:
+            self._bits = bytearray(self._size + self._COUNT.size)
+            self._lock = threading.Lock()  # type: ignore[assignment]
+
+    def _positions(self, item: str) -> Iterator[int]:
+        # Kirsch-Mitzenmacher double hashing over one 128-bit digest.
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    @property
+    def count(self) -> int:
+        """Number of distinct items added, as far as the filter can tell."""
+        count: int = self._COUNT.unpack_from(self._bits, self._size)[0]
+        return count
+
+    def add(self, item: str) -> None:
+        # Adding an item that is already a member leaves the count alone, so
+        # overlapping syncs do not push the filter towards saturation.
+        positions = list(self._positions(item))
+        bits = self._bits
+        with self._lock:
+            new = False
+            for position in positions:
+                mask = 1 << (position & 7)
+                if not bits[position >> 3] & mask:
+                    bits[position >> 3] |= mask
+                    new = True
+            if new:
+                self._COUNT.pack_into(bits, self._size, self.count + 1)
+
+    def update(self, items: Iterable[str]) -> None:
+        for item in items:
+            self.add(item)
+
+    def load(self, other: "BloomFilter") -> None:
+        """Replace this filter's contents with those of an identically sized one."""
+        if (other.num_bits, other.num_hashes) != (self.num_bits, self.num_hashes):
+            raise ValueError("Bloom filters must have the same size")
+        with self._lock:
+            self._bits[:] = other._bits
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, str):
+            return False
+        bits = self._bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    @property
+    def saturated(self) -> bool:
+        """True once more items were added than the filter was sized for."""
+        return self.count > self.capacity
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
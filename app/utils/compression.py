@@ -0,0 +1,190 @@
+"""Negotiated response compression."""
+
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Type
+
+from flask import Flask, Response, request
+from werkzeug.datastructures import Accept
+
+from app.utils.logging import setup_logger
+
+try:
+    import brotli  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - only without the compression extra
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - only without the compression extra
+    zstandard = None  # type: ignore[assignment]
+
+logger = setup_logger(__name__)
+
+COMPRESSIBLE_MIMETYPES = frozenset({"application/json", "application/x-ndjson"})
+STREAM_FLUSH_BYTES = 64 * 1024
+
+
+class Compressor(ABC):
+    """Incremental compressor for one response body."""
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Feed data, returning whatever output is ready."""
+
+    @abstractmethod
+    def flush(self) -> bytes:
+        """Return all output for the data fed so far, keeping the stream open."""
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        """Return the remaining output and end the stream."""
+
+
+class GzipCompressor(Compressor):
+    """gzip through zlib, at the default level."""
+
+    def __init__(self) -> None:
+        self._compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor(Compressor):
+    """Brotli at quality 4, which suits dynamic responses."""
+
+    def __init__(self) -> None:
+        self._compressor = brotli.Compressor(quality=4)
+
+    def compress(self, data: bytes) -> bytes:
+        return bytes(self._compressor.process(data))
+
+    def flush(self) -> bytes:
+        return bytes(self._compressor.flush())
+
+    def finish(self) -> bytes:
+        return bytes(self._compressor.finish())
+
+
+class ZstdCompressor(Compressor):
+    """Zstandard at level 3."""
+
+    def __init__(self) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=3).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return bytes(self._compressor.compress(data))
+
+    def flush(self) -> bytes:
+        return bytes(self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK))
+
+    def finish(self) -> bytes:
+        return bytes(self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH))
+
+
+ENCODINGS: Dict[str, Optional[Type[Compressor]]] = {
+    "zstd": ZstdCompressor if zstandard is not None else None,
+    "br": BrotliCompressor if brotli is not None else None,
+    "gzip": GzipCompressor,
+}
+
+
+def negotiate_encoding(
+    accept_encodings: Accept, encodings: Sequence[str]
+) -> Optional[str]:
+    """Pick the encoding the client weights highest.
+
+    Ties go to the encoding listed first in ``encodings``.
+    """
+    best, best_quality = None, 0.0
+    for encoding in encodings:
+        quality = accept_encodings.quality(encoding)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def register_compression(app: Flask, encodings: Sequence[str], min_size: int) -> None:
+    """Compress JSON and NDJSON responses with the client's preferred encoding.
+
+    ``encodings`` lists ``zstd``, ``br`` and ``gzip`` in server preference
+    order; those whose library is not installed are skipped. Bodies smaller
+    than ``min_size`` bytes, such as auth responses, are sent as is because
+    compressing them costs more than it saves. Streamed responses are
+    compressed as they are produced.
+    """
+    unknown = [encoding for encoding in encodings if encoding not in ENCODINGS]
+    if unknown:
+        raise ValueError("Compression encodings must be among " + ", ".join(ENCODINGS))
+    compressors: Dict[str, Type[Compressor]] = {}
+    for encoding in encodings:
+        compressor_class = ENCODINGS[encoding]
+        if compressor_class is not None:
+            compressors[encoding] = compressor_class
+    if len(compressors) < len(encodings):
+        logger.warning(f"Compression limited to {', '.join(compressors)}")
+
+    @app.after_request
+    def compress_response(response: Response) -> Response:
+        if response.mimetype not in COMPRESSIBLE_MIMETYPES:
+            return response
+        response.vary.add("Accept-Encoding")
+        encoding = negotiate_encoding(request.accept_encodings, list(compressors))
+        if encoding is None or not _is_compressible(response, min_size):
+            return response
+
+        compressor = compressors[encoding]()
+        if response.is_streamed:
+            response.response = _compress_stream(
+                response.iter_encoded(), response.response, compressor
+            )
+            response.headers.pop("Content-Length", None)
+        else:
+            body = response.get_data()
+            response.set_data(compressor.compress(body) + compressor.finish())
+        response.headers["Content-Encoding"] = encoding
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
+
+
+def _is_compressible(response: Response, min_size: int) -> bool:
+    if request.method == "HEAD" or "Content-Encoding" in response.headers:
+        return False
+    if response.status_code < 200 or response.status_code in (204, 206, 304):
+        return False
+    if response.cache_control.no_transform:
+        return False
+    return response.is_streamed or (response.content_length or 0) >= min_size
+
+
+def _compress_stream(
+    chunks: Iterable[bytes], original: Any, compressor: Compressor
+) -> Iterator[bytes]:
+    """Compress a streamed body, flushing after every ``STREAM_FLUSH_BYTES``.
+
+    Flushing per chunk would cost most of the ratio on line-per-chunk
+    streams such as the NDJSON export.
+    """
+    pending = 0
+    try:
+        for chunk in chunks:
+            data = compressor.compress(chunk)
+            pending += len(chunk)
+            if pending >= STREAM_FLUSH_BYTES:
+                data += compressor.flush()
+                pending = 0
+            if data:
+                yield data
+        yield compressor.finish()
+    finally:
+        if hasattr(original, "close"):
+            original.close()
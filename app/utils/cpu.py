@@ -0,0 +1,37 @@
+"""CPU capacity available to this process."""
+
+import math
+import os
+from typing import Optional
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+
+
+def cpu_allotment(cgroup_root: str = CGROUP_ROOT) -> int:
+    """Return the CPUs this process may use, capped by a container CPU quota."""
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:  # pragma: no cover - platforms without CPU affinity
+        cpus = os.cpu_count() or 1
+    quota = _cgroup_cpu_quota(cgroup_root)
+    if quota is not None:
+        cpus = min(cpus, math.floor(quota))
+    return max(cpus, 1)
+
+
+def _cgroup_cpu_quota(cgroup_root: str) -> Optional[float]:
+    """Read the CFS quota in CPUs from cgroup v2, then v1; None if unlimited."""
+    try:
+        with open(os.path.join(cgroup_root, "cpu.max")) as f:
+            quota, period = f.read().split()
+    except (OSError, ValueError):
+        try:
+            with open(os.path.join(cgroup_root, "cpu", "cpu.cfs_quota_us")) as f:
+                quota = f.read().strip()
+            with open(os.path.join(cgroup_root, "cpu", "cpu.cfs_period_us")) as f:
+                period = f.read().strip()
+        except OSError:
+            return None
+    if quota in ("max", "-1"):
+        return None
+    return int(quota) / int(period)
@@ -19,6 +19,7 @@ class AppError(Exception):
         self.message = message
         self.status_code = status_code
         self.details = details or {}
+        self.headers: Dict[str, str] = {}
 
 
 class ValidationError(AppError):
@@ -49,6 +50,18 @@ class ForbiddenError(AppError):
         super().__init__(message, 403)
 
 
+class TooManyRequestsError(AppError):
+    def __init__(self, retry_after: int, message: str = "Too many requests"):
+        super().__init__(message, 429, {"retryAfter": retry_after})
+        self.retry_after = retry_after
+        self.headers["Retry-After"] = str(retry_after)
+
+
+class ServiceUnavailableError(AppError):
+    def __init__(self, message: str = "Service temporarily unavailable"):
+        super().__init__(message, 503)
+
+
 def error_response(error: AppError) -> Tuple[Response, int]:
     response: Dict[str, Any] = {
         "success": False,
@@ -59,7 +72,9 @@ def error_response(error: AppError) -> Tuple[Response, int]:
     }
     if error.details:
         response["error"]["details"] = error.details
-    return jsonify(response), error.status_code
+    json_response = jsonify(response)
+    json_response.headers.update(error.headers)
+    return json_response, error.status_code
 
 
 def handle_controller_errors(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -76,6 +91,8 @@ def handle_controller_errors(func: Callable[..., Any]) -> Callable[..., Any]:
             ConflictError,
             UnauthorizedError,
             ForbiddenError,
+            TooManyRequestsError,
+            ServiceUnavailableError,
         ):
             raise
         except IntegrityError as e:
@@ -131,6 +148,12 @@ def register_error_handlers(app: Flask) -> None:
     def handle_forbidden_error(error: ForbiddenError) -> Tuple[Response, int]:
         return error_response(error)
 
+    @app.errorhandler(ServiceUnavailableError)
+    def handle_service_unavailable_error(
+        error: ServiceUnavailableError,
+    ) -> Tuple[Response, int]:
+        return error_response(error)
+
     @app.errorhandler(404)
     def handle_404(e: Any) -> Tuple[Response, int]:
         return jsonify({"error": {"message": "Resource not found"}}), 404
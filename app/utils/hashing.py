@@ -0,0 +1,229 @@
+"""Password hasher registry and cost calibration."""
+
+import time
+from abc import ABC, abstractmethod
+from typing import Optional, Sequence, Tuple
+
+import bcrypt
+from argon2 import PasswordHasher as Argon2PasswordHasher, Type as Argon2Type
+from argon2.exceptions import InvalidHashError, VerificationError
+
+from app.utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+HASHER_NAMES = ("bcrypt", "argon2id")
+
+CALIBRATION_PASSWORD = "calibration-password"  # nosec B105
+
+
+class PasswordHasher(ABC):
+    """A password hashing scheme recognised by its hash format prefix."""
+
+    name: str
+    prefixes: Tuple[str, ...]
+
+    def identify(self, password_hash: str) -> bool:
+        """Return True if the hash was produced by this scheme."""
+        return password_hash.startswith(self.prefixes)
+
+    @property
+    @abstractmethod
+    def cost(self) -> int:
+        """Tunable work factor of the current policy."""
+
+    @abstractmethod
+    def with_cost(self, cost: int) -> "PasswordHasher":
+        """Return a copy of this hasher using a different work factor."""
+
+    @abstractmethod
+    def hash(self, password: str) -> str:
+        """Hash password with the current policy."""
+
+    @abstractmethod
+    def verify(self, password: str, password_hash: str) -> bool:
+        """Verify password against a hash produced by this scheme."""
+
+    @abstractmethod
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Return True if the hash parameters differ from the current policy."""
+
+
+class BcryptHasher(PasswordHasher):
+    """bcrypt with a configurable number of log2 rounds."""
+
+    name = "bcrypt"
+    prefixes = ("$2a$", "$2b$", "$2y$")
+
+    def __init__(self, rounds: int = 12):
+        if not 4 <= rounds <= 31:
+            raise ValueError("bcrypt rounds must be between 4 and 31")
+        self.rounds = rounds
+
+    @property
+    def cost(self) -> int:
+        return self.rounds
+
+    def with_cost(self, cost: int) -> "BcryptHasher":
+        return BcryptHasher(rounds=cost)
+
+    def hash(self, password: str) -> str:
+        salt = bcrypt.gensalt(rounds=self.rounds)
+        return str(bcrypt.hashpw(password.encode(), salt).decode())
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        try:
+            return bool(bcrypt.checkpw(password.encode(), password_hash.encode()))
+        except ValueError:
+            return False
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        parts = password_hash.split("$")
+        if len(parts) < 4 or parts[1] != "2b":
+            return True
+        try:
+            return int(parts[2]) != self.rounds
+        except ValueError:
+            return True
+
+
+class Argon2idHasher(PasswordHasher):
+    """argon2id with configurable time cost, memory cost and parallelism."""
+
+    name = "argon2id"
+    prefixes = ("$argon2id$",)
+
+    def __init__(
+        self, time_cost: int = 3, memory_cost: int = 65536, parallelism: int = 4
+    ):
+        self.time_cost = time_cost
+        self.memory_cost = memory_cost
+        self.parallelism = parallelism
+        self._hasher = Argon2PasswordHasher(
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism,
+            type=Argon2Type.ID,
+        )
+
+    @property
+    def cost(self) -> int:
+        return self.time_cost
+
+    def with_cost(self, cost: int) -> "Argon2idHasher":
+        return Argon2idHasher(
+            time_cost=cost,
+            memory_cost=self.memory_cost,
+            parallelism=self.parallelism,
+        )
+
+    def hash(self, password: str) -> str:
+        return str(self._hasher.hash(password))
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        try:
+            return bool(self._hasher.verify(password_hash, password))
+        except (VerificationError, InvalidHashError):
+            return False
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        try:
+            return bool(self._hasher.check_needs_rehash(password_hash))
+        except InvalidHashError:
+            return True
+
+
+class HasherRegistry:
+    """Dispatch hashing to the scheme that matches a stored hash's prefix.
+
+    New hashes always use ``default``; the other hashers are only used to
+    verify hashes written under an earlier policy.
+    """
+
+    def __init__(self, default: PasswordHasher, hashers: Sequence[PasswordHasher] = ()):
+        self.default = default
+        self.hashers = [default] + [h for h in hashers if h.name != default.name]
+
+    def hasher_for(self, password_hash: str) -> Optional[PasswordHasher]:
+        """Return the hasher that understands the given hash, if any."""
+        for hasher in self.hashers:
+            if hasher.identify(password_hash):
+                return hasher
+        return None
+
+    def hash(self, password: str) -> str:
+        return self.default.hash(password)
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        hasher = self.hasher_for(password_hash)
+        if hasher is None:
+            return False
+        return hasher.verify(password, password_hash)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        if not self.default.identify(password_hash):
+            return True
+        return self.default.needs_rehash(password_hash)
+
+
+def measure_hash_ms(hasher: PasswordHasher, samples: int = 2) -> float:
+    """Return the fastest observed time for one hash, in milliseconds."""
+    best = float("inf")
+    for _ in range(samples):
+        started = time.perf_counter()
+        hasher.hash(CALIBRATION_PASSWORD)
+        best = min(best, (time.perf_counter() - started) * 1000)
+    return best
+
+
+def calibrate_hasher(
+    hasher: PasswordHasher, target_ms: float, max_cost: int
+) -> PasswordHasher:
+    """Raise the hasher's cost until one hash takes about ``target_ms``.
+
+    The configured cost is treated as a floor; calibration never lowers it.
+    Costs are tried in increasing order and the one whose measured time is
+    closest to the target wins.
+    """
+    best, best_ms = hasher, measure_hash_ms(hasher)
+    candidate, elapsed = best, best_ms
+    while elapsed < target_ms and candidate.cost < max_cost:
+        candidate = candidate.with_cost(candidate.cost + 1)
+        elapsed = measure_hash_ms(candidate)
+        if abs(elapsed - target_ms) <= abs(best_ms - target_ms):
+            best, best_ms = candidate, elapsed
+
+    logger.info(
+        f"Calibrated {best.name} cost to {best.cost} "
+        f"({best_ms:.1f}ms per hash, target {target_ms:.0f}ms)"
+    )
+    return best
+
+
+def create_hasher_registry(
+    algorithm: str = "bcrypt",
+    bcrypt_rounds: int = 12,
+    argon2_time_cost: int = 3,
+    argon2_memory_cost: int = 65536,
+    argon2_parallelism: int = 4,
+    target_ms: float = 0,
+) -> HasherRegistry:
+    """Build a registry whose default hasher follows the configured policy."""
+    if algorithm not in HASHER_NAMES:
+        raise ValueError(f"Password hasher must be one of {', '.join(HASHER_NAMES)}")
+
+    bcrypt_hasher = BcryptHasher(rounds=bcrypt_rounds)
+    argon2_hasher = Argon2idHasher(
+        time_cost=argon2_time_cost,
+        memory_cost=argon2_memory_cost,
+        parallelism=argon2_parallelism,
+    )
+
+    default: PasswordHasher = (
+        argon2_hasher if algorithm == "argon2id" else bcrypt_hasher
+    )
+    if target_ms > 0:
+        max_cost = 16 if algorithm == "bcrypt" else 20
+        default = calibrate_hasher(default, target_ms, max_cost)
+
+    return HasherRegistry(default, [bcrypt_hasher, argon2_hasher])
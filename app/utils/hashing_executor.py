@@ -0,0 +1,163 @@
+"""Bounded worker pool for CPU-bound password hashing."""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+)
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from app.utils.errors import ServiceUnavailableError
+from app.utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+T = TypeVar("T")
+
+POOL_TYPES = ("thread", "process")
+
+
+class HashingExecutor:
+    """Run hashing calls on a bounded thread or process pool.
+
+    At most ``max_workers + max_queue_size`` calls may be in flight at once.
+    Further calls are rejected immediately with ``ServiceUnavailableError``
+    instead of piling up behind the pool and holding request workers.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        pool_type: str = "thread",
+        max_queue_size: int = 32,
+        timeout: float = 5.0,
+    ):
+        if pool_type not in POOL_TYPES:
+            raise ValueError(f"pool_type must be one of {', '.join(POOL_TYPES)}")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.max_workers = max_workers
+        self.pool_type = pool_type
+        self.max_queue_size = max(max_queue_size, 0)
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._pool: Optional[Executor] = None
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        self._pid = os.getpid()
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queue_size)
+        self._in_flight = 0
+        self._peak_queue_depth = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._timed_out = 0
+
+    def _get_pool(self) -> Executor:
+        with self._lock:
+            if self._pid != os.getpid():
+                # Pool threads and processes do not survive a fork; start over.
+                self._pool = None
+                self._reset_state()
+            if self._pool is None:
+                if self.pool_type == "process":
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                else:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="hashing",
+                    )
+            return self._pool
+
+    def submit(self, fn: Callable[..., T], *args: Any) -> "Future[T]":
+        """Schedule a call on the pool, rejecting it if the queue is full."""
+        pool = self._get_pool()
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            logger.warning("Hashing queue is full, rejecting request")
+            raise ServiceUnavailableError(
+                "Authentication service is busy, please retry shortly"
+            )
+
+        with self._lock:
+            self._submitted += 1
+            self._in_flight += 1
+            self._peak_queue_depth = max(self._peak_queue_depth, self._queue_depth())
+
+        try:
+            future = pool.submit(fn, *args)
+        except Exception:
+            self._release(failed=True)
+            raise
+
+        future.add_done_callback(
+            lambda f: self._release(failed=f.cancelled() or f.exception() is not None)
+        )
+        return future
+
+    def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a call on the pool and wait for its result."""
+        future = self.submit(fn, *args)
+        return self.result(future)
+
+    def result(self, future: "Future[T]") -> T:
+        """Wait for a submitted call, enforcing the per-call timeout."""
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            with self._lock:
+                self._timed_out += 1
+            logger.warning(f"Hashing call timed out after {self.timeout}s")
+            raise ServiceUnavailableError(
+                "Authentication service is busy, please retry shortly"
+            )
+
+    def _release(self, failed: bool) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if failed:
+                self._failed += 1
+            else:
+                self._completed += 1
+        self._slots.release()
+
+    def _queue_depth(self) -> int:
+        return max(self._in_flight - self.max_workers, 0)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return a snapshot of pool utilisation counters."""
+        with self._lock:
+            return {
+                "pool_type": self.pool_type,
+                "max_workers": self.max_workers,
+                "max_queue_size": self.max_queue_size,
+                "in_flight": self._in_flight,
+                "queue_depth": self._queue_depth(),
+                "peak_queue_depth": self._peak_queue_depth,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "timed_out": self._timed_out,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the underlying pool."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,31 @@
+"""Identifier utilities."""
+
+import os
+import time
+import uuid
+
+_VERSION_MASK = 0xF << 76
+_VARIANT_MASK = 0x3 << 62
+
+
+def uuid7() -> str:
+    """Return a new UUIDv7: a 48-bit millisecond timestamp then random bits.
+
+    IDs created later sort after earlier ones, so inserts append to the end
+    of a clustered primary key instead of splitting pages at random.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= int.from_bytes(os.urandom(10), "big")
+    value = (value & ~_VERSION_MASK) | (0x7 << 76)
+    value = (value & ~_VARIANT_MASK) | (0x2 << 62)
+    return str(uuid.UUID(int=value))
+
+
+def is_uuid(value: str) -> bool:
+    """Check whether a string is a UUID in any accepted form."""
+    try:
+        uuid.UUID(value)
+    except (ValueError, TypeError, AttributeError):
+        return False
+    return True
@@ -0,0 +1,83 @@
+"""JSON encoding and decoding for requests and responses."""
+
+from typing import Any, Union
+
+from flask import Flask, Response, current_app
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+from pydantic import BaseModel
+
+from app.utils.logging import setup_logger
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - only without the orjson wheel
+    orjson = None  # type: ignore[assignment]
+
+logger = setup_logger(__name__)
+
+JSON_PROVIDERS = ("orjson", "stdlib")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson.
+
+    Datetimes and types orjson does not know go through Flask's ``default``
+    hook, so output matches the stdlib provider. Values orjson rejects
+    outright, such as integers wider than 64 bits, fall back to the stdlib
+    encoder. Keys keep their insertion order unless ``sort_keys`` is set.
+    """
+
+    sort_keys = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return self._encode(obj).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        response: Response = self._app.response_class(
+            self._encode(obj, indent), mimetype=self.mimetype
+        )
+        return response
+
+    def _encode(self, obj: Any, indent: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=self.default, option=option)
+        except orjson.JSONEncodeError:
+            return super().dumps(obj).encode()
+
+
+def create_json_provider(app: Flask, name: str) -> JSONProvider:
+    """Create a JSON provider by name: ``orjson`` or ``stdlib``.
+
+    Falls back to the stdlib provider when orjson is not installed.
+    """
+    if name not in JSON_PROVIDERS:
+        raise ValueError("JSON provider must be one of " + ", ".join(JSON_PROVIDERS))
+    if name == "orjson" and orjson is not None:
+        return OrjsonProvider(app)
+    if name == "orjson":
+        logger.warning("orjson is not installed, using the stdlib JSON provider")
+    return DefaultJSONProvider(app)
+
+
+def contract_response(contract: BaseModel, status: int = 200) -> Response:
+    """Serialize a response contract straight to a JSON response.
+
+    Pydantic writes the bytes itself, skipping the intermediate dict that
+    ``jsonify(contract.model_dump())`` builds and re-encodes.
+    """
+    body = contract.__pydantic_serializer__.to_json(contract)
+    return current_app.response_class(body, status=status, mimetype="application/json")
@@ -0,0 +1,125 @@
+"""Connection pool instrumentation."""
+
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
+
+
+class PoolMetrics:
+    """Per-process counters for one engine's connection pool."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._checkouts = 0
+        self._checkout_timeouts = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+        self._connects = 0
+        self._invalidations = 0
+        self._soft_invalidations = 0
+
+    def _check_pid(self) -> None:
+        # Counters copied into a forked worker belong to the parent.
+        if self._pid != os.getpid():
+            self._reset()
+
+    def record_checkout(self, wait_seconds: float) -> None:
+        with self._lock:
+            self._check_pid()
+            self._checkouts += 1
+            self._wait_seconds_total += wait_seconds
+            self._wait_seconds_max = max(self._wait_seconds_max, wait_seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self._check_pid()
+            self._checkout_timeouts += 1
+
+    def _increment(self, counter: str) -> None:
+        with self._lock:
+            self._check_pid()
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def instrument(self, engine: Engine) -> None:
+        """Attach to the engine's pool and its connection lifecycle events."""
+        if isinstance(engine.pool, InstrumentedQueuePool):
+            engine.pool.metrics = self
+
+        @event.listens_for(engine, "connect")
+        def on_connect(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+            self._increment("_connects")
+
+        @event.listens_for(engine, "invalidate")
+        def on_invalidate(
+            dbapi_connection: Any, record: ConnectionPoolEntry, exception: Any
+        ) -> None:
+            self._increment("_invalidations")
+
+        @event.listens_for(engine, "soft_invalidate")
+        def on_soft_invalidate(
+            dbapi_connection: Any, record: ConnectionPoolEntry, exception: Any
+        ) -> None:
+            self._increment("_soft_invalidations")
+
+    def snapshot(self, engine: Engine) -> Dict[str, Any]:
+        """Return live pool occupancy and the counters of this worker."""
+        pool = engine.pool
+        with self._lock:
+            self._check_pid()
+            checkouts = self._checkouts
+            metrics: Dict[str, Any] = {
+                "pid": self._pid,
+                "checkouts": checkouts,
+                "checkout_timeouts": self._checkout_timeouts,
+                "checkout_wait_ms_avg": (
+                    self._wait_seconds_total / checkouts * 1000 if checkouts else 0.0
+                ),
+                "checkout_wait_ms_max": self._wait_seconds_max * 1000,
+                "connects": self._connects,
+                "invalidations": self._invalidations,
+                "soft_invalidations": self._soft_invalidations,
+            }
+        if isinstance(pool, QueuePool):
+            metrics.update(
+                {
+                    "size": pool.size(),
+                    "checked_out": pool.checkedout(),
+                    "checked_in": pool.checkedin(),
+                    "overflow": max(pool.overflow(), 0),
+                }
+            )
+        return metrics
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that reports how long each checkout waited for a connection."""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def recreate(self) -> QueuePool:
+        pool = super().recreate()
+        if isinstance(pool, InstrumentedQueuePool):
+            pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except PoolTimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_timeout()
+            raise
+        if self.metrics is not None:
+            self.metrics.record_checkout(time.perf_counter() - started)
+        return record
@@ -0,0 +1,209 @@
+"""Sliding-window rate limiting."""
+
+import hashlib
+import math
+import mmap
+import multiprocessing
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, List, Optional, Tuple
+
+from flask import g, request
+
+from app.utils.errors import TooManyRequestsError
+
+Decision = Callable[[int, int], bool]
+
+
+class RateLimitBackend(ABC):
+    """Storage for per-key counters of the current and previous window."""
+
+    @abstractmethod
+    def update(self, key: str, window: int, allow: Decision) -> Tuple[int, int]:
+        """Atomically read a key's counters and count a hit if allowed.
+
+        Counters are rolled forward to ``window`` first. ``allow`` receives
+        (current, previous) counts; when it returns True the current count
+        is incremented. Returns the counts as seen before the increment.
+        """
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Per-process counters, bounded to ``max_keys`` least recently used keys."""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._counters: "OrderedDict[str, List[int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def update(self, key: str, window: int, allow: Decision) -> Tuple[int, int]:
+        with self._lock:
+            entry = self._counters.get(key)
+            if entry is None:
+                entry = self._counters[key] = [window, 0, 0]
+            self._counters.move_to_end(key)
+            current, previous = _roll(entry[0], entry[1], entry[2], window)
+            if allow(current, previous):
+                entry[:] = [window, current + 1, previous]
+            else:
+                entry[:] = [window, current, previous]
+            while len(self._counters) > self.max_keys:
+                self._counters.popitem(last=False)
+            return current, previous
+
+
+class SharedMemoryRateLimitBackend(RateLimitBackend):
+    """Counters in an anonymous shared memory map, shared by forked workers.
+
+    The map and its lock must be created before the server forks (for
+    example with gunicorn's ``preload_app``) for workers to share them.
+    Keys are stored by 64-bit fingerprint in a fixed table of ``slots``
+    entries; when every probed slot is in use the least recently active one
+    is reused, which can only make the limiter more lenient.
+    """
+
+    _SLOT = struct.Struct("<QqII")
+    _PROBES = 4
+
+    def __init__(self, slots: int = 65536):
+        self.slots = slots
+        self._map = mmap.mmap(-1, slots * self._SLOT.size)
+        self._lock = multiprocessing.Lock()
+
+    def _slot_for(self, fingerprint: int, window: int) -> Tuple[int, int, int, int]:
+        """Return (offset, window, current, previous) of the key's slot."""
+        first = fingerprint % self.slots
+        candidates = []
+        for probe in range(self._PROBES):
+            offset = ((first + probe) % self.slots) * self._SLOT.size
+            stored, stored_window, current, previous = self._SLOT.unpack_from(
+                self._map, offset
+            )
+            if stored == fingerprint:
+                return offset, stored_window, current, previous
+            if stored == 0 or stored_window < window - 1:
+                return offset, window, 0, 0
+            candidates.append((stored_window, offset))
+        _, offset = min(candidates)
+        return offset, window, 0, 0
+
+    def update(self, key: str, window: int, allow: Decision) -> Tuple[int, int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+        fingerprint = int.from_bytes(digest, "little") or 1
+        with self._lock:
+            offset, stored_window, current, previous = self._slot_for(
+                fingerprint, window
+            )
+            current, previous = _roll(stored_window, current, previous, window)
+            counted = current + 1 if allow(current, previous) else current
+            self._SLOT.pack_into(
+                self._map, offset, fingerprint, window, counted, previous
+            )
+            return current, previous
+
+
+def _roll(
+    stored_window: int, current: int, previous: int, window: int
+) -> Tuple[int, int]:
+    if stored_window == window:
+        return current, previous
+    if stored_window == window - 1:
+        return 0, current
+    return 0, 0
+
+
+class SlidingWindowLimiter:
+    """Allow at most ``limit`` hits per key in any ``window_seconds`` span.
+
+    Uses the sliding-window counter approximation: the previous fixed
+    window's count is weighted by how much of it still overlaps the
+    sliding window.
+    """
+
+    def __init__(
+        self,
+        backend: RateLimitBackend,
+        limit: int,
+        window_seconds: float,
+        prefix: str = "",
+    ):
+        self.backend = backend
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.prefix = prefix
+
+    def _estimate(self, current: int, previous: int, elapsed: float) -> float:
+        return previous * (1 - elapsed) + current
+
+    def hit(self, key: str, now: Optional[float] = None) -> float:
+        """Count a hit for ``key``; return 0 if allowed, else seconds to wait."""
+        if now is None:
+            now = time.time()
+        window = int(now // self.window_seconds)
+        elapsed = (now % self.window_seconds) / self.window_seconds
+
+        current, previous = self.backend.update(
+            self.prefix + key,
+            window,
+            lambda c, p: self._estimate(c, p, elapsed) < self.limit,
+        )
+        if self._estimate(current, previous, elapsed) < self.limit:
+            return 0.0
+        # The estimate must drop strictly below the limit, so never report 0.
+        return max(self._retry_after(current, previous, elapsed), 0.001)
+
+    def _retry_after(self, current: int, previous: int, elapsed: float) -> float:
+        if current < self.limit:
+            # Wait until enough of the previous window has slid out.
+            needed = 1 - (self.limit - current) / previous
+            return (needed - elapsed) * self.window_seconds
+        # Wait for the next window, then for this one to slide out enough.
+        needed = 1 - self.limit / current
+        return (1 - elapsed + needed) * self.window_seconds
+
+
+def create_rate_limit_backend(backend: str, shared_slots: int) -> RateLimitBackend:
+    """Create a backend by name: ``memory`` or ``shared``."""
+    if backend == "memory":
+        return MemoryRateLimitBackend()
+    if backend == "shared":
+        return SharedMemoryRateLimitBackend(slots=shared_slots)
+    raise ValueError("Rate limit backend must be one of memory, shared")
+
+
+def client_ip() -> Optional[str]:
+    """Rate limit key for the requesting client address."""
+    return request.remote_addr
+
+
+def validated_email() -> Optional[str]:
+    """Rate limit key for the normalized email of a validated request body."""
+    email = getattr(g.validated_body, "email", None)
+    return email.strip().lower() if email else None
+
+
+def rate_limit(
+    limiter: Optional[SlidingWindowLimiter], key_func: Callable[[], Optional[str]]
+) -> Callable[..., Any]:
+    """Decorator rejecting requests over the limit with 429 and Retry-After."""
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if limiter is None:
+            return func
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = key_func()
+            if key:
+                retry_after = limiter.hit(key)
+                if retry_after > 0:
+                    raise TooManyRequestsError(retry_after=math.ceil(retry_after))
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
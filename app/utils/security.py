@@ -1,26 +1,105 @@
 """Security utilities for authentication."""
 
-import bcrypt
-import jwt
-from datetime import datetime, timedelta, timezone
-from typing import Dict, Any
+import secrets
+from concurrent.futures import Future
+from typing import Any, Callable, Optional, TypeVar
+
+from app.utils.hashing import BcryptHasher, HasherRegistry
+from app.utils.hashing_executor import HashingExecutor
+
+T = TypeVar("T")
+
+_hashing_executor: Optional[HashingExecutor] = None
+_hasher_registry = HasherRegistry(BcryptHasher())
+_dummy_hash: Optional[str] = None
+
+
+def configure_password_hashers(registry: HasherRegistry) -> None:
+    """Set the hasher registry used to hash and verify passwords."""
+    global _hasher_registry, _dummy_hash
+    _hasher_registry = registry
+    _dummy_hash = None
+
+
+def get_password_hashers() -> HasherRegistry:
+    """Return the hasher registry used to hash and verify passwords."""
+    return _hasher_registry
+
+
+def configure_hashing_executor(executor: Optional[HashingExecutor]) -> None:
+    """Route password hashing through the given executor (None runs inline)."""
+    global _hashing_executor
+    previous, _hashing_executor = _hashing_executor, executor
+    if previous is not None and previous is not executor:
+        previous.shutdown(wait=False)
+
+
+def get_hashing_executor() -> Optional[HashingExecutor]:
+    """Return the executor used for password hashing, if any."""
+    return _hashing_executor
+
+
+def _run_hashing(fn: Callable[..., T], *args: Any) -> T:
+    if _hashing_executor is None:
+        return fn(*args)
+    return _hashing_executor.run(fn, *args)
 
 
 def hash_password(password: str) -> str:
-    """Hash password using bcrypt."""
-    return str(bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode())
+    """Hash password using the current hashing policy."""
+    return _run_hashing(_hasher_registry.hash, password)
+
+
+class PendingHash:
+    """A password hash started before the caller needs it.
+
+    With a hashing executor configured the hash runs on the pool while the
+    caller does other work; without one it is computed on ``result()``.
+    """
+
+    def __init__(self, password: str):
+        self._password = password
+        self._executor = _hashing_executor
+        self._future: "Optional[Future[str]]" = None
+        if self._executor is not None:
+            self._future = self._executor.submit(_hasher_registry.hash, password)
+
+    def result(self) -> str:
+        """Wait for and return the hash."""
+        if self._executor is None or self._future is None:
+            return _hasher_registry.hash(self._password)
+        return self._executor.result(self._future)
+
+    def cancel(self) -> None:
+        """Drop the hash if it has not started yet."""
+        if self._future is not None:
+            self._future.cancel()
+
+
+def start_hash_password(password: str) -> PendingHash:
+    """Start hashing password so it overlaps with the caller's database work."""
+    return PendingHash(password)
 
 
 def verify_password(password: str, password_hash: str) -> bool:
     """Verify password against hash."""
-    return bool(bcrypt.checkpw(password.encode(), password_hash.encode()))
+    return _run_hashing(_hasher_registry.verify, password, password_hash)
+
+
+def verify_dummy_password(password: str) -> bool:
+    """Spend the same work as ``verify_password`` for an unknown account.
+
+    Checking the password against a throwaway hash of the current policy
+    keeps a sign-in for a missing email as slow as one with a wrong
+    password. Always returns False.
+    """
+    global _dummy_hash
+    if _dummy_hash is None:
+        _dummy_hash = _run_hashing(_hasher_registry.hash, secrets.token_hex(16))
+    _run_hashing(_hasher_registry.verify, password, _dummy_hash)
+    return False
 
 
-def generate_token(user_id: str, secret_key: str, expiration_hours: int) -> str:
-    """Generate JWT token."""
-    payload = {
-        "user_id": user_id,
-        "exp": datetime.now(timezone.utc) + timedelta(hours=expiration_hours),
-        "iat": datetime.now(timezone.utc),
-    }
-    return str(jwt.encode(payload, secret_key, algorithm="HS256"))
+def password_needs_rehash(password_hash: str) -> bool:
+    """Check whether a stored hash was produced under an older policy."""
+    return _hasher_registry.needs_rehash(password_hash)
@@ -0,0 +1,162 @@
+"""JWS signing keys, key rings and JWKS publication."""
+
+import hashlib
+import hmac
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
+from jwt.algorithms import get_default_algorithms
+
+
+class SigningKey(ABC):
+    """A key that signs JWTs, identified by an optional key id."""
+
+    algorithm: str
+
+    def __init__(self, kid: Optional[str] = None):
+        self.kid = kid
+
+    @property
+    def header(self) -> Dict[str, str]:
+        """JOSE header for tokens signed with this key."""
+        header = {"alg": self.algorithm, "typ": "JWT"}
+        if self.kid:
+            header["kid"] = self.kid
+        return header
+
+    @property
+    @abstractmethod
+    def verification_key(self) -> Any:
+        """Key material passed to ``jwt.decode`` for this key."""
+
+    @abstractmethod
+    def sign(self, signing_input: bytes) -> bytes:
+        """Return the raw signature over ``signing_input``."""
+
+    def to_jwk(self) -> Optional[Dict[str, Any]]:
+        """Public JWK for this key, or None if it cannot be published."""
+        return None
+
+
+class HmacSigningKey(SigningKey):
+    """HS256 shared-secret key with a precomputed HMAC state."""
+
+    algorithm = "HS256"
+
+    def __init__(self, secret_key: str, kid: Optional[str] = None):
+        super().__init__(kid)
+        self._secret_key = secret_key
+        self._hmac = hmac.new(secret_key.encode(), digestmod=hashlib.sha256)
+
+    @property
+    def verification_key(self) -> Any:
+        return self._secret_key
+
+    def sign(self, signing_input: bytes) -> bytes:
+        mac = self._hmac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+
+class AsymmetricSigningKey(SigningKey):
+    """Ed25519 (EdDSA) or RSA (RS256) private key."""
+
+    def __init__(self, private_key: Any, kid: str):
+        super().__init__(kid)
+        if isinstance(private_key, ed25519.Ed25519PrivateKey):
+            self.algorithm = "EdDSA"
+        elif isinstance(private_key, rsa.RSAPrivateKey):
+            self.algorithm = "RS256"
+        else:
+            raise ValueError("Signing keys must be Ed25519 or RSA private keys")
+        self._jws_algorithm = get_default_algorithms()[self.algorithm]
+        self._private_key = private_key
+        self._public_key = private_key.public_key()
+
+    @classmethod
+    def from_pem(cls, pem: bytes, kid: str) -> "AsymmetricSigningKey":
+        """Load a PEM-encoded, unencrypted private key."""
+        return cls(load_pem_private_key(pem, password=None), kid)
+
+    @property
+    def verification_key(self) -> Any:
+        return self._public_key
+
+    def sign(self, signing_input: bytes) -> bytes:
+        return bytes(self._jws_algorithm.sign(signing_input, self._private_key))
+
+    def to_jwk(self) -> Optional[Dict[str, Any]]:
+        jwk: Dict[str, Any] = self._jws_algorithm.to_jwk(self._public_key, as_dict=True)
+        jwk.update({"kid": self.kid, "alg": self.algorithm, "use": "sig"})
+        return jwk
+
+
+class KeyRing:
+    """The active signing key plus every key still accepted for verification.
+
+    Keeping the previous keys on the ring lets tokens they signed stay valid
+    until they expire, while new tokens are signed with the active key.
+    """
+
+    def __init__(self, active: SigningKey, others: Sequence[SigningKey] = ()):
+        self.active = active
+        self.keys = [active] + [key for key in others if key is not active]
+        self._by_kid = {key.kid: key for key in self.keys if key.kid}
+
+    def key_for(self, kid: Optional[str]) -> Optional[SigningKey]:
+        """Return the key that verifies tokens with the given ``kid`` header."""
+        if kid is None:
+            return next((key for key in self.keys if key.kid is None), None)
+        return self._by_kid.get(kid)
+
+    def jwks(self) -> Dict[str, List[Dict[str, Any]]]:
+        """JSON Web Key Set containing the public keys on the ring."""
+        keys = [jwk for jwk in (key.to_jwk() for key in self.keys) if jwk]
+        return {"keys": keys}
+
+
+def parse_key_spec(spec: str) -> List[Tuple[str, str]]:
+    """Parse ``kid=path,kid=path`` into (kid, path) pairs."""
+    pairs = []
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        kid, sep, path = entry.partition("=")
+        if not sep or not kid.strip() or not path.strip():
+            raise ValueError(f"Invalid signing key entry '{entry}', expected kid=path")
+        pairs.append((kid.strip(), path.strip()))
+    return pairs
+
+
+def load_key_ring(
+    secret_key: str,
+    private_keys: str = "",
+    active_kid: str = "",
+    accept_hmac: bool = True,
+) -> KeyRing:
+    """Build the key ring from configuration.
+
+    Without ``private_keys`` tokens are signed with HS256 and the shared
+    secret. Otherwise the key named by ``active_kid`` (or the first key)
+    signs, and the shared secret verifies older HS256 tokens while
+    ``accept_hmac`` is set. Turn it off once those tokens have expired.
+    """
+    hmac_key = HmacSigningKey(secret_key)
+    asymmetric_keys = [
+        AsymmetricSigningKey.from_pem(Path(path).read_bytes(), kid)
+        for kid, path in parse_key_spec(private_keys)
+    ]
+    if not asymmetric_keys:
+        return KeyRing(hmac_key)
+
+    active = asymmetric_keys[0]
+    if active_kid:
+        matches = [key for key in asymmetric_keys if key.kid == active_kid]
+        if not matches:
+            raise ValueError(f"Active signing key '{active_kid}' is not configured")
+        active = matches[0]
+
+    if not accept_hmac:
+        return KeyRing(active, asymmetric_keys)
+    return KeyRing(active, asymmetric_keys + [hmac_key])
@@ -7,3 +7,8 @@ from zoneinfo import ZoneInfo
 def now_ist() -> datetime:
     """Get current time in IST timezone."""
     return datetime.now(ZoneInfo("Asia/Kolkata"))
+
+
+def from_timestamp_ist(timestamp: float) -> datetime:
+    """Convert a Unix timestamp to an IST datetime."""
+    return datetime.fromtimestamp(timestamp, ZoneInfo("Asia/Kolkata"))
@@ -0,0 +1,200 @@
+"""JWT minting and verification for rental partner tokens."""
+
+import base64
+import hashlib
+import heapq
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import jwt
+
+from app.utils.errors import UnauthorizedError
+from app.utils.signing_keys import HmacSigningKey, KeyRing, SigningKey
+
+ACCESS_TOKEN = "access"
+REFRESH_TOKEN = "refresh"
+
+
+def b64url_encode(data: bytes) -> bytes:
+    """Base64url-encode without padding, as required by JWS."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _json_segment(data: Dict[str, Any], sort_keys: bool = False) -> bytes:
+    return b64url_encode(
+        json.dumps(data, separators=(",", ":"), sort_keys=sort_keys).encode()
+    )
+
+
+def _key_ring(key: Union[str, KeyRing]) -> KeyRing:
+    return KeyRing(HmacSigningKey(key)) if isinstance(key, str) else key
+
+
+class TokenMinter:
+    """Issue access and refresh tokens for rental partners.
+
+    The encoded header segment and the prepared signing key are built once,
+    so minting a token only serialises the payload and signs it. Tokens are
+    byte-for-byte compatible with ``jwt.encode`` for the same key and
+    headers. A plain secret string signs with HS256.
+    """
+
+    def __init__(self, signing_key: Union[str, KeyRing], refresh_expiration_hours: int):
+        self.refresh_expiration_hours = refresh_expiration_hours
+        self.signing_key: SigningKey = _key_ring(signing_key).active
+        self._header_segment = _json_segment(self.signing_key.header, sort_keys=True)
+
+    def mint(
+        self,
+        user_id: str,
+        expiration_hours: int,
+        issued_at: Optional[int] = None,
+        token_type: str = ACCESS_TOKEN,
+        family_id: Optional[str] = None,
+    ) -> str:
+        """Mint a single token that expires after ``expiration_hours``."""
+        if issued_at is None:
+            issued_at = int(time.time())
+        payload: Dict[str, Any] = {
+            "user_id": user_id,
+            "type": token_type,
+            "jti": uuid.uuid4().hex,
+            "exp": issued_at + expiration_hours * 3600,
+            "iat": issued_at,
+        }
+        if family_id is not None:
+            payload["fam"] = family_id
+        signing_input = self._header_segment + b"." + _json_segment(payload)
+        signature = b64url_encode(self.signing_key.sign(signing_input))
+        return (signing_input + b"." + signature).decode()
+
+    def mint_pair(
+        self,
+        user_id: str,
+        access_expiration_hours: int,
+        family_id: Optional[str] = None,
+    ) -> Tuple[str, str]:
+        """Mint an access token and a refresh token from one timestamp.
+
+        The refresh token joins ``family_id`` when rotating an existing
+        refresh token, or starts a new rotation family otherwise.
+        """
+        issued_at = int(time.time())
+        access_token = self.mint(user_id, access_expiration_hours, issued_at)
+        refresh_token = self.mint(
+            user_id,
+            self.refresh_expiration_hours,
+            issued_at,
+            REFRESH_TOKEN,
+            family_id or uuid.uuid4().hex,
+        )
+        return access_token, refresh_token
+
+
+class TokenVerifier:
+    """Verify partner JWTs, remembering tokens that already passed.
+
+    Verified claims are kept in a bounded LRU keyed by the SHA-256 digest of
+    the token and dropped once the token's ``exp`` passes, so a client that
+    reuses one token across many requests pays for signature and claim
+    checks only once.
+    """
+
+    def __init__(self, key_ring: Union[str, KeyRing], cache_size: int = 4096):
+        self.key_ring = _key_ring(key_ring)
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[bytes, Tuple[Dict[str, Any], int]]" = OrderedDict()
+        self._expiry_heap: List[Tuple[int, bytes]] = []
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def verify(self, token: str, token_type: str = ACCESS_TOKEN) -> Dict[str, Any]:
+        """Return the claims of a valid token or raise UnauthorizedError."""
+        key = hashlib.sha256(token.encode()).digest()
+        claims = self._cached_claims(key)
+        if claims is None:
+            claims = self._decode(token)
+            self._remember(key, claims)
+
+        if claims.get("type") != token_type:
+            raise UnauthorizedError("Invalid or expired token")
+        return dict(claims)
+
+    def verify_many(
+        self, tokens: List[str], token_type: str = ACCESS_TOKEN
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Verify a batch of tokens, with None in place of each invalid one."""
+        results: List[Optional[Dict[str, Any]]] = []
+        for token in tokens:
+            try:
+                results.append(self.verify(token, token_type))
+            except UnauthorizedError:
+                results.append(None)
+        return results
+
+    def _decode(self, token: str) -> Dict[str, Any]:
+        try:
+            key = self.key_ring.key_for(jwt.get_unverified_header(token).get("kid"))
+            if key is None:
+                raise UnauthorizedError("Invalid or expired token")
+            claims: Dict[str, Any] = jwt.decode(
+                token,
+                key.verification_key,
+                algorithms=[key.algorithm],
+                options={"require": ["exp", "iat", "user_id"]},
+            )
+        except jwt.PyJWTError:
+            raise UnauthorizedError("Invalid or expired token")
+        return claims
+
+    def _cached_claims(self, key: bytes) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None or entry[1] <= now:
+                self._cache.pop(key, None)
+                self._misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def _remember(self, key: bytes, claims: Dict[str, Any]) -> None:
+        if self.cache_size <= 0:
+            return
+        exp = int(claims["exp"])
+        with self._lock:
+            self._evict_expired(time.time())
+            self._cache[key] = (claims, exp)
+            self._cache.move_to_end(key)
+            heapq.heappush(self._expiry_heap, (exp, key))
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _evict_expired(self, now: float) -> None:
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            exp, key = heapq.heappop(self._expiry_heap)
+            entry = self._cache.get(key)
+            if entry is not None and entry[1] == exp:
+                del self._cache[key]
+        if len(self._expiry_heap) > 2 * self.cache_size:
+            # Drop heap entries for tokens the LRU has already evicted.
+            self._expiry_heap = [
+                (exp, key) for exp, key in self._expiry_heap if key in self._cache
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return cache size and hit/miss counters."""
+        with self._lock:
+            return {
+                "size": len(self._cache),
+                "capacity": self.cache_size,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
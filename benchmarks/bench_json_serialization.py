@@ -0,0 +1,130 @@
+"""Benchmark JSON serialization of response contracts.
+
+Compares ``jsonify(contract.model_dump())`` on the stdlib and orjson
+providers with ``contract_response``, which lets pydantic write the bytes
+directly, and decoding of a sign-up request body on both providers.
+
+Usage:
+    python -m benchmarks.bench_json_serialization [iterations]
+"""
+
+import json
+import sys
+import timeit
+from datetime import datetime, timezone
+from typing import Any, Callable, List, Tuple
+
+from flask import Flask, jsonify
+from flask.json.provider import DefaultJSONProvider
+from pydantic import BaseModel
+
+from app.contracts.admin_contracts import (
+    PartnerListResponse,
+    PartnerPage,
+    PartnerSummary,
+)
+from app.contracts.auth_contracts import AuthData, AuthResponse, UserData
+from app.utils.ids import uuid7
+from app.utils.json_provider import OrjsonProvider, contract_response
+
+SIGN_UP_BODY = json.dumps(
+    {
+        "email": "partner@example.com",
+        "password": "correct-horse-battery",
+        "confirmPassword": "correct-horse-battery",
+        "firstName": "Bench",
+        "lastName": "Mark",
+        "phone": "5550100",
+        "agreeToTerms": True,
+    }
+).encode()
+
+
+def auth_response() -> AuthResponse:
+    user = UserData(
+        id=uuid7(),
+        email="partner@example.com",
+        firstName="Bench",
+        lastName="Mark",
+        phone="5550100",
+    )
+    token = "e" * 300
+    return AuthResponse(
+        data=AuthData(user=user, token=token, refreshToken=token),
+        message="Sign in successful",
+    )
+
+
+def list_response(size: int) -> PartnerListResponse:
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    partners = [
+        PartnerSummary(
+            id=uuid7(),
+            email=f"user{i}@example.com",
+            firstName="Bench",
+            lastName="Mark",
+            phone="5550100",
+            createdAt=created_at,
+        )
+        for i in range(size)
+    ]
+    return PartnerListResponse(
+        data=PartnerPage(partners=partners, nextCursor="c" * 40),
+        message="Partners retrieved",
+    )
+
+
+def serializers(contract: BaseModel) -> List[Tuple[str, Callable[[], Any]]]:
+    stdlib_app, orjson_app = Flask("stdlib"), Flask("orjson")
+    stdlib_app.json = DefaultJSONProvider(stdlib_app)
+    orjson_app.json = OrjsonProvider(orjson_app)
+
+    def via(app: Flask, func: Callable[[], Any]) -> Callable[[], Any]:
+        def run() -> Any:
+            with app.app_context():
+                return func()
+
+        return run
+
+    return [
+        (
+            "stdlib jsonify(model_dump)",
+            via(stdlib_app, lambda: jsonify(contract.model_dump(mode="json"))),
+        ),
+        (
+            "orjson jsonify(model_dump)",
+            via(orjson_app, lambda: jsonify(contract.model_dump(mode="json"))),
+        ),
+        ("contract_response", via(orjson_app, lambda: contract_response(contract))),
+    ]
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+    for title, contract in [
+        ("AuthResponse", auth_response()),
+        ("PartnerListResponse, 100 partners", list_response(100)),
+    ]:
+        print(f"{title}, {iterations} responses")
+        for name, func in serializers(contract):
+            seconds = min(timeit.repeat(func, number=iterations, repeat=3))
+            print(f"  {name:<28} {seconds / iterations * 1_000_000:8.1f}us")
+        print()
+
+    app = Flask(__name__)
+    print(f"Sign-up body decoding, {iterations} requests")
+    for name, provider in [
+        ("stdlib", DefaultJSONProvider(app)),
+        ("orjson", OrjsonProvider(app)),
+    ]:
+        seconds = min(
+            timeit.repeat(
+                lambda: provider.loads(SIGN_UP_BODY), number=iterations, repeat=3
+            )
+        )
+        print(f"  {name:<28} {seconds / iterations * 1_000_000:8.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark insert throughput of random string IDs against UUIDv7 binary IDs.
+
+Inserts the same partner rows into two tables that differ only in their
+primary key: a uuid4 ``VARCHAR(36)`` and a UUIDv7 ``BINARY(16)``. Point it
+at a MySQL URL to see the effect on InnoDB; by default it uses a SQLite
+file, which shows the same trend less sharply.
+
+Usage:
+    python -m benchmarks.bench_partner_inserts [rows] [batch_size] [database_url]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import uuid
+from typing import Callable, List
+
+from sqlalchemy import Column, MetaData, String, Table, create_engine, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.types import TypeEngine
+
+from app.models.types import BinaryUUID
+from app.utils.ids import uuid7
+
+
+def create_table(metadata: MetaData, name: str, id_type: TypeEngine) -> Table:
+    return Table(
+        name,
+        metadata,
+        Column("id", id_type, primary_key=True),
+        Column("email", String(255), unique=True, nullable=False),
+        Column("password_hash", String(255), nullable=False),
+    )
+
+
+def run_case(
+    engine: Engine,
+    table: Table,
+    new_id: Callable[[], str],
+    rows: int,
+    batch_size: int,
+) -> float:
+    started = time.perf_counter()
+    for start in range(0, rows, batch_size):
+        batch: List[dict] = [
+            {
+                "id": new_id(),
+                "email": f"user{i}@example.com",
+                "password_hash": "$2b$12$" + "x" * 53,
+            }
+            for i in range(start, min(start + batch_size, rows))
+        ]
+        with engine.begin() as connection:
+            connection.execute(insert(table), batch)
+    return rows / (time.perf_counter() - started)
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    url = sys.argv[3] if len(sys.argv) > 3 else f"sqlite:///{path}"
+
+    engine = create_engine(url)
+    metadata = MetaData()
+    cases = [
+        (
+            "uuid4 VARCHAR(36)",
+            create_table(metadata, "bench_string_ids", String(36)),
+            lambda: str(uuid.uuid4()),
+        ),
+        (
+            "uuid7 BINARY(16)",
+            create_table(metadata, "bench_binary_ids", BinaryUUID()),
+            uuid7,
+        ),
+    ]
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+
+    print(f"{rows} rows in batches of {batch_size} on {engine.dialect.name}\n")
+    try:
+        for name, table, new_id in cases:
+            throughput = run_case(engine, table, new_id, rows, batch_size)
+            print(f"{name:<18} {throughput:10.0f} rows/s")
+    finally:
+        metadata.drop_all(engine)
+
+
+if __name__ == "__main__":
+    main()
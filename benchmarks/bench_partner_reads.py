@@ -0,0 +1,93 @@
+"""Benchmark partner lookups: ORM hydration against record projections.
+
+Each lookup runs like a request: one query by email, then the session is
+removed. Reports latency, and peak memory allocated per lookup measured
+with tracemalloc in a separate pass. Runs against in-memory SQLite.
+
+Usage:
+    python -m benchmarks.bench_partner_reads [partners] [lookups]
+"""
+
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, List
+
+from flask import Flask
+
+from app.models.base import db
+from app.models.rental_partner import RentalPartner, RentalPartnerRecord
+from app.repositories.rental_partner_repository import RentalPartnerRepository
+from app.utils.ids import uuid7
+
+
+def hydrate_orm(email: str) -> Any:
+    return db.session.query(RentalPartner).filter_by(email=email).first()
+
+
+def measure_latency(lookup: Callable[[str], Any], emails: List[str]) -> List[float]:
+    latencies = []
+    for email in emails:
+        started = time.perf_counter()
+        lookup(email)
+        db.session.remove()
+        latencies.append((time.perf_counter() - started) * 1_000_000)
+    return latencies
+
+
+def measure_allocations(lookup: Callable[[str], Any], emails: List[str]) -> float:
+    peaks = []
+    tracemalloc.start()
+    for email in emails:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        result = lookup(email)
+        peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+        del result
+        db.session.remove()
+    tracemalloc.stop()
+    return statistics.mean(peaks)
+
+
+def main() -> None:
+    partners = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    db.init_app(app)
+
+    with app.app_context():
+        db.create_all()
+        repository = RentalPartnerRepository()
+        repository.create_many(
+            [
+                RentalPartnerRecord(
+                    uuid7(), f"user{i}@example.com", "hash", "Bench", "Mark", "1"
+                )
+                for i in range(partners)
+            ]
+        )
+        emails = [f"user{i % partners}@example.com" for i in range(lookups)]
+        cases = [
+            ("ORM instance", hydrate_orm),
+            ("record projection", repository.find_by_email),
+        ]
+
+        for _, lookup in cases:
+            measure_latency(lookup, emails[:100])
+
+        print(f"{lookups} lookups over {partners} partners\n")
+        for name, lookup in cases:
+            latencies = measure_latency(lookup, emails)
+            allocated = measure_allocations(lookup, emails)
+            print(
+                f"{name:<18} p50 {statistics.median(latencies):7.1f}us  "
+                f"mean {statistics.mean(latencies):7.1f}us  "
+                f"{allocated / 1024:6.1f} KiB allocated/lookup"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark partner search latency on the in-memory n-gram index.
+
+Indexes synthetic partners without a database and times typeahead queries
+of increasing length, as a support agent would type them.
+
+Usage:
+    python -m benchmarks.bench_partner_search [partners] [rounds]
+"""
+
+import random
+import statistics
+import string
+import sys
+import time
+from typing import List
+
+from app.models.rental_partner import RentalPartnerRecord
+from app.services.partner_search_index import PartnerSearchIndex
+from app.utils.ids import uuid7
+
+
+def random_name(rng: random.Random) -> str:
+    return rng.choice(string.ascii_uppercase) + "".join(
+        rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))
+    )
+
+
+def main() -> None:
+    partners = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rng = random.Random(7)
+
+    records: List[RentalPartnerRecord] = []
+    for i in range(partners):
+        first_name, last_name = random_name(rng), random_name(rng)
+        email = f"{first_name.lower()}.{last_name.lower()}{i}@example.com"
+        records.append(
+            RentalPartnerRecord(uuid7(), email, "hash", first_name, last_name, "1")
+        )
+
+    # No repository: the index is filled directly and never syncs.
+    index = PartnerSearchIndex(
+        repository=None, sync_interval=float("inf")  # type: ignore[arg-type]
+    )
+    started = time.perf_counter()
+    index.add(records)
+    index._synced_at = time.monotonic()
+    print(f"Indexed {partners} partners in {time.perf_counter() - started:.1f}s")
+    print(f"Index memory: {index.memory_bytes() / 1024 / 1024:.1f} MiB\n")
+
+    targets = rng.sample(records, rounds)
+    for length in (1, 2, 3, 5, 8):
+        latencies = []
+        for record in targets:
+            query = record.last_name[:length]
+            started = time.perf_counter()
+            index.search(query)
+            latencies.append((time.perf_counter() - started) * 1_000_000)
+        latencies.sort()
+        print(
+            f"{length} chars  p50 {statistics.median(latencies):8.1f}us  "
+            f"p99 {latencies[int(len(latencies) * 0.99) - 1]:8.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
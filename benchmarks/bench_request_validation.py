@@ -0,0 +1,66 @@
+"""Benchmark per-request validation of auth request bodies.
+
+Compares the previous path, which decoded the body, built the model from
+keyword arguments and dumped it back to a dict, with validating the raw
+bytes through the schema's cached adapter. ``RefreshRequest`` has no
+email field, so it shows the cost without email address validation.
+
+Usage:
+    python -m benchmarks.bench_request_validation [iterations]
+"""
+
+import json
+import sys
+import timeit
+from typing import Any, Dict, Type
+
+from pydantic import BaseModel
+
+from app.contracts.auth_contracts import RefreshRequest, SignInRequest, SignUpRequest
+from app.utils.validators import body_adapter
+
+BODIES: Dict[Type[BaseModel], bytes] = {
+    SignInRequest: json.dumps(
+        {
+            "email": "partner@example.com",
+            "password": "correct-horse-battery",
+            "rememberMe": True,
+        }
+    ).encode(),
+    SignUpRequest: json.dumps(
+        {
+            "email": "partner@example.com",
+            "password": "correct-horse-battery",
+            "confirmPassword": "correct-horse-battery",
+            "firstName": "Bench",
+            "lastName": "Mark",
+            "phone": "5550100",
+            "agreeToTerms": True,
+        }
+    ).encode(),
+    RefreshRequest: json.dumps({"refreshToken": "r" * 300}).encode(),
+}
+
+
+def decode_build_dump(schema: Type[BaseModel], body: bytes) -> Any:
+    return schema(**json.loads(body)).model_dump()
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    for schema, body in BODIES.items():
+        adapter = body_adapter(schema)
+        cases = [
+            ("decode, build, dump", lambda: decode_build_dump(schema, body)),
+            ("adapter.validate_json", lambda: adapter.validate_json(body)),
+        ]
+        print(f"{schema.__name__}, {iterations} requests")
+        for name, func in cases:
+            seconds = min(timeit.repeat(func, number=iterations, repeat=3))
+            print(f"  {name:<24} {seconds / iterations * 1_000_000:6.2f}us")
+        print()
+
+
+if __name__ == "__main__":
+    main()
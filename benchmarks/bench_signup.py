@@ -0,0 +1,104 @@
+"""Benchmark sign-up latency and database round trips.
+
+Compares the duplicate-check sign-up, the same with the password hash
+overlapping the check on the hashing pool, and optimistic sign-up. Runs
+against in-memory SQLite; each statement sleeps for a simulated network
+round trip so the saving of one query is visible.
+
+Usage:
+    python -m benchmarks.bench_signup [sign_ups] [round_trip_ms]
+"""
+
+import statistics
+import sys
+import time
+from typing import Any, List, Optional, Tuple
+
+from flask import Flask
+from sqlalchemy import event
+
+from app.models.base import db
+from app.repositories.rental_partner_repository import RentalPartnerRepository
+from app.services.auth_service import AuthService
+from app.utils.hashing import BcryptHasher, HasherRegistry
+from app.utils.hashing_executor import HashingExecutor
+from app.utils.security import configure_hashing_executor, configure_password_hashers
+
+SECRET = "benchmark-secret-key-at-least-32-chars-long"  # nosec B105
+
+
+def create_service(optimistic: bool) -> AuthService:
+    return AuthService(
+        repository=RentalPartnerRepository(),
+        jwt_secret=SECRET,
+        jwt_expiration=24,
+        refresh_expiration=720,
+        min_password_length=8,
+        remember_me_multiplier=24,
+        optimistic_signup=optimistic,
+    )
+
+
+def run_case(
+    service: AuthService, prefix: str, sign_ups: int, statements: List[int]
+) -> List[float]:
+    latencies = []
+    for i in range(sign_ups):
+        before = statements[0]
+        started = time.perf_counter()
+        service.sign_up(
+            email=f"{prefix}-{i}@example.com",
+            password="benchmark-password",
+            confirm_password="benchmark-password",
+            first_name="Bench",
+            last_name="Mark",
+            phone="1234567890",
+            agree_to_terms=True,
+        )
+        latencies.append((time.perf_counter() - started) * 1000)
+        statements[1] += statements[0] - before
+    return latencies
+
+
+def main() -> None:
+    sign_ups = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    round_trip_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    db.init_app(app)
+    configure_password_hashers(HasherRegistry(BcryptHasher(rounds=8)))
+
+    with app.app_context():
+        db.create_all()
+        statements = [0, 0]
+
+        @event.listens_for(db.engine, "before_cursor_execute")
+        def simulate_round_trip(*args: Any) -> None:
+            statements[0] += 1
+            time.sleep(round_trip_ms / 1000)
+
+        pool = HashingExecutor(max_workers=2)
+        cases: List[Tuple[str, Optional[HashingExecutor], bool]] = [
+            ("duplicate check", None, False),
+            ("duplicate check + pool", pool, False),
+            ("optimistic + pool", pool, True),
+        ]
+
+        print(f"{sign_ups} sign-ups per case, {round_trip_ms}ms simulated round trip\n")
+        for index, (name, executor, optimistic) in enumerate(cases):
+            configure_hashing_executor(executor)
+            statements[1] = 0
+            latencies = run_case(
+                create_service(optimistic), f"case{index}", sign_ups, statements
+            )
+            print(
+                f"{name:<24} p50 {statistics.median(latencies):6.2f}ms  "
+                f"mean {statistics.mean(latencies):6.2f}ms  "
+                f"{statements[1] / sign_ups:.1f} statements/sign-up"
+            )
+        configure_hashing_executor(None)
+
+
+if __name__ == "__main__":
+    main()
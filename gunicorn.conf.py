@@ -0,0 +1,40 @@
+"""Gunicorn settings for production: ``gunicorn -c gunicorn.conf.py``.
+
+Values come from ``Config``. The app is loaded once in the master, which
+builds the in-memory indexes before forking; each worker then primes its
+database pool and hashing pool before accepting requests.
+"""
+
+from app.config import get_settings
+from app.serving import drain_worker, prepare_master, warm_worker
+from app.utils.cpu import cpu_allotment
+
+settings = get_settings()
+
+wsgi_app = "run:app"
+bind = f"0.0.0.0:{settings.PORT}"  # nosec B104
+workers = settings.WEB_CONCURRENCY or cpu_allotment()
+worker_class = settings.WEB_WORKER_CLASS
+threads = settings.WEB_THREADS
+preload_app = True
+
+max_requests = settings.WEB_MAX_REQUESTS
+max_requests_jitter = settings.WEB_MAX_REQUESTS_JITTER
+timeout = settings.WEB_TIMEOUT_SECONDS
+graceful_timeout = settings.WEB_GRACEFUL_TIMEOUT_SECONDS
+keepalive = settings.WEB_KEEPALIVE_SECONDS
+
+accesslog = "-"
+errorlog = "-"
+
+
+def when_ready(server):
+    prepare_master(server.app.wsgi())
+
+
+def post_fork(server, worker):
+    warm_worker(worker.app.wsgi(), min(threads, settings.DB_POOL_SIZE))
+
+
+def worker_exit(server, worker):
+    drain_worker(worker.app.wsgi())
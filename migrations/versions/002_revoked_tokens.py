@@ -0,0 +1,36 @@
+"""Create revoked_tokens table
+
+Revision ID: 002_revoked_tokens
+Revises: 001_rental_partners
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "002_revoked_tokens"
+down_revision = "001_rental_partners"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "revoked_tokens",
+        sa.Column("jti", sa.String(length=64), nullable=False),
+        sa.Column("kind", sa.String(length=16), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("jti"),
+    )
+    op.create_index("idx_revoked_tokens_expires_at", "revoked_tokens", ["expires_at"])
+    op.create_index("idx_revoked_tokens_created_at", "revoked_tokens", ["created_at"])
+
+
+def downgrade():
+    op.drop_index("idx_revoked_tokens_created_at", table_name="revoked_tokens")
+    op.drop_index("idx_revoked_tokens_expires_at", table_name="revoked_tokens")
+    op.drop_table("revoked_tokens")
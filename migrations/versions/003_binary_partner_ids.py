@@ -0,0 +1,48 @@
+"""Add a BINARY(16) copy of rental_partners.id
+
+Revision ID: 003_binary_partner_ids
+Revises: 002_revoked_tokens
+Create Date: 2026-10-17 00:00:00.000000
+
+Expand step of the switch to binary partner keys. ``binary_id`` is added
+as an instant, nullable column and existing rows are backfilled in small
+autocommitted batches, so nothing locks the table while the app serves
+traffic. The release that ships this migration writes ``binary_id`` with
+every new partner and keeps reading the string key. Rows written by the
+previous release while it rolls out are filled by the final backfill in
+``005_binary_partner_primary_key``, which makes ``binary_id`` the key.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "003_binary_partner_ids"
+down_revision = "002_revoked_tokens"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 5000
+
+
+def backfill_binary_ids(connection):
+    """Fill ``binary_id`` from the string id, one committed batch at a time."""
+    backfill = sa.text(
+        "UPDATE rental_partners SET binary_id = UNHEX(REPLACE(id, '-', '')) "
+        "WHERE binary_id IS NULL LIMIT :batch_size"
+    )
+    while connection.execute(backfill, {"batch_size": BATCH_SIZE}).rowcount:
+        pass
+
+
+def upgrade():
+    op.execute(
+        "ALTER TABLE rental_partners ADD COLUMN binary_id BINARY(16) NULL, "
+        "ALGORITHM=INSTANT"
+    )
+    with op.get_context().autocommit_block():
+        backfill_binary_ids(op.get_bind())
+
+
+def downgrade():
+    op.execute("ALTER TABLE rental_partners DROP COLUMN binary_id, ALGORITHM=INSTANT")
@@ -0,0 +1,35 @@
+"""Add keyset listing indexes to rental_partners
+
+Revision ID: 004_partner_listing_indexes
+Revises: 003_binary_partner_ids
+Create Date: 2026-10-17 00:00:00.000000
+
+Each index ends in (created_at, id) so the partner listing can seek to a
+cursor and read rows in order, with or without a name or phone filter.
+MySQL builds secondary indexes in place without blocking writes.
+"""
+
+from alembic import op
+
+
+revision = "004_partner_listing_indexes"
+down_revision = "003_binary_partner_ids"
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    "idx_rental_partners_created_at_id": ["created_at", "id"],
+    "idx_rental_partners_first_name": ["first_name", "created_at", "id"],
+    "idx_rental_partners_last_name": ["last_name", "created_at", "id"],
+    "idx_rental_partners_phone": ["phone", "created_at", "id"],
+}
+
+
+def upgrade():
+    for name, columns in INDEXES.items():
+        op.create_index(name, "rental_partners", columns)
+
+
+def downgrade():
+    for name in INDEXES:
+        op.drop_index(name, table_name="rental_partners")
@@ -0,0 +1,117 @@
+"""Make rental_partners.binary_id the primary key
+
+Revision ID: 005_binary_partner_primary_key
+Revises: 004_partner_listing_indexes
+Create Date: 2026-10-17 00:00:00.000000
+
+Contract step of the switch to binary partner keys. Run it only once every
+instance runs the release that writes ``binary_id``
+(``003_binary_partner_ids``); a final backfill then covers the rows that
+the release before it wrote.
+
+Changing the primary key rebuilds the table, so the swap runs as online
+DDL. Through vtgate it is submitted as a Vitess online DDL migration,
+which copies the table in the background while it keeps serving reads
+and writes, and this migration waits for it to complete. Against MySQL
+directly it runs in place with ``LOCK=NONE``.
+
+The string ``id`` column keeps a unique key: instances of the previous
+release still look partners up by it during the rollout, and Vitess
+needs a unique key shared by the old and new table. A later release
+drops it. The listing indexes are rebuilt to end in the new key.
+"""
+
+import time
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "005_binary_partner_primary_key"
+down_revision = "004_partner_listing_indexes"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 5000
+POLL_SECONDS = 5
+LISTING_INDEXES = {
+    "idx_rental_partners_created_at_id": ["created_at"],
+    "idx_rental_partners_first_name": ["first_name", "created_at"],
+    "idx_rental_partners_last_name": ["last_name", "created_at"],
+    "idx_rental_partners_phone": ["phone", "created_at"],
+}
+
+
+def _backfill(connection):
+    backfill = sa.text(
+        "UPDATE rental_partners SET binary_id = UNHEX(REPLACE(id, '-', '')) "
+        "WHERE binary_id IS NULL LIMIT :batch_size"
+    )
+    while connection.execute(backfill, {"batch_size": BATCH_SIZE}).rowcount:
+        pass
+
+
+def _rebuild_listing_indexes(key):
+    return ", ".join(
+        f"DROP INDEX {name}, ADD INDEX {name} ({', '.join(columns + [key])})"
+        for name, columns in LISTING_INDEXES.items()
+    )
+
+
+def _online_alter(connection, changes):
+    """Run ``ALTER TABLE rental_partners`` without blocking reads and writes."""
+    version = connection.execute(sa.text("SELECT @@version")).scalar()
+    if "vitess" not in str(version).lower():
+        connection.execute(
+            sa.text(
+                f"ALTER TABLE rental_partners {changes}, "
+                "ALGORITHM=INPLACE, LOCK=NONE"
+            )
+        )
+        return
+
+    connection.execute(sa.text("SET @@ddl_strategy = 'vitess'"))
+    try:
+        migration = connection.execute(
+            sa.text(f"ALTER TABLE rental_partners {changes}")
+        ).scalar()
+    finally:
+        connection.execute(sa.text("SET @@ddl_strategy = 'direct'"))
+    migration_uuid = str(uuid.UUID(str(migration)))
+
+    status = sa.text(f"SHOW VITESS_MIGRATIONS LIKE '{migration_uuid}'")
+    while True:
+        row = connection.execute(status).mappings().one()
+        if row["migration_status"] == "complete":
+            return
+        if row["migration_status"] in ("failed", "cancelled"):
+            raise RuntimeError(
+                f"Online DDL {migration_uuid} {row['migration_status']}: "
+                f"{row['message']}"
+            )
+        time.sleep(POLL_SECONDS)
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        _backfill(connection)
+        _online_alter(
+            connection,
+            "MODIFY COLUMN binary_id BINARY(16) NOT NULL FIRST, "
+            "DROP PRIMARY KEY, ADD PRIMARY KEY (binary_id), "
+            "ADD UNIQUE INDEX uq_rental_partners_id (id), "
+            + _rebuild_listing_indexes("binary_id"),
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        _online_alter(
+            op.get_bind(),
+            "DROP PRIMARY KEY, ADD PRIMARY KEY (id), "
+            "DROP INDEX uq_rental_partners_id, "
+            "MODIFY COLUMN binary_id BINARY(16) NULL AFTER id, "
+            + _rebuild_listing_indexes("id"),
+        )
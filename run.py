@@ -1,4 +1,3 @@
-import os
 from app import create_app
 from app.config import Config
 
@@ -6,5 +5,5 @@ config = Config()
 app = create_app(config)
 
 if __name__ == "__main__":
-    port = int(os.getenv("PORT", 5000))
-    app.run(host="0.0.0.0", port=port, debug=config.DEBUG)  # nosec B104
+    # Development server only; production runs gunicorn -c gunicorn.conf.py
+    app.run(host="0.0.0.0", port=config.PORT, debug=config.DEBUG)  # nosec B104
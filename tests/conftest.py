@@ -1,6 +1,10 @@
 import pytest
+from contextlib import contextmanager
+from flask import Flask
+from sqlalchemy import event
 from app import create_app
 from app.config import Config
+from app.models import db
 
 
 @pytest.fixture
@@ -30,3 +34,37 @@ def app(test_config):
 @pytest.fixture
 def client(app):
     return app.test_client()
+
+
+@pytest.fixture
+def db_app():
+    """Flask app bound to an in-memory SQLite database with all tables."""
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    db.init_app(app)
+    with app.app_context():
+        # Only the default bind: other tests register replica binds on ``db``.
+        db.create_all(bind_key=None)
+        yield app
+        db.session.remove()
+        db.drop_all(bind_key=None)
+
+
+@pytest.fixture
+def count_queries(db_app):
+    """Context manager collecting the SQL statements sent to the database."""
+
+    @contextmanager
+    def counter():
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+    return counter
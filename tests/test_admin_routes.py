@@ -0,0 +1,193 @@
+import pytest
+from datetime import datetime
+from unittest.mock import Mock
+from flask import Flask
+from app.routes.admin_routes import create_admin_routes
+from app.contracts.admin_contracts import PartnerPage, PartnerSummary
+from app.services.partner_import_service import ImportStats
+from app.services.partner_search_index import SearchHit
+from app.utils.errors import register_error_handlers
+
+PARTNER_ID = "0190a5c4-8e1d-7c3b-9a2f-1b2c3d4e5f60"
+API_KEY = "admin-key"
+
+
+@pytest.fixture
+def export_service():
+    return Mock()
+
+
+@pytest.fixture
+def listing_service():
+    return Mock()
+
+
+@pytest.fixture
+def admin_client(export_service, listing_service):
+    import_service = Mock()
+    app = Flask(__name__)
+    register_error_handlers(app)
+    app.register_blueprint(
+        create_admin_routes(import_service, export_service, listing_service, API_KEY),
+        url_prefix="/api/admin",
+    )
+    return app.test_client(), import_service
+
+
+def test_import_requires_api_key(admin_client):
+    client, import_service = admin_client
+    response = client.post(
+        "/api/admin/partners/import",
+        data="{}\n",
+        content_type="application/x-ndjson",
+        headers={"X-API-Key": "wrong"},
+    )
+    assert response.status_code == 401
+    import_service.import_rows.assert_not_called()
+
+
+def test_import_rejects_unknown_content_type(admin_client):
+    client, _ = admin_client
+    response = client.post(
+        "/api/admin/partners/import",
+        data="<xml/>",
+        content_type="application/xml",
+        headers={"X-API-Key": API_KEY},
+    )
+    assert response.status_code == 400
+
+
+def test_import_streams_body_and_reports_summary(admin_client):
+    client, import_service = admin_client
+
+    def import_rows(rows, reject):
+        assert list(rows) == [(1, {"email": "a@example.com"}), (2, None)]
+        reject(2, None, "Malformed record")
+        return ImportStats(processed=2, imported=1, rejected=1)
+
+    import_service.import_rows.side_effect = import_rows
+    response = client.post(
+        "/api/admin/partners/import",
+        data='{"email": "a@example.com"}\nnot json\n',
+        content_type="application/x-ndjson",
+        headers={"X-API-Key": API_KEY},
+    )
+
+    assert response.status_code == 200
+    data = response.get_json()["data"]
+    assert (data["processed"], data["imported"], data["rejected"]) == (2, 1, 1)
+    assert data["rejects"] == [{"line": 2, "email": None, "reason": "Malformed record"}]
+
+
+def test_export_streams_lines(admin_client, export_service):
+    client, _ = admin_client
+    export_service.iter_lines.return_value = iter(["a\n", "b\n"])
+
+    response = client.get(
+        f"/api/admin/partners/export?format=csv&after={PARTNER_ID}",
+        headers={"X-API-Key": API_KEY},
+    )
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/csv"
+    assert response.get_data(as_text=True) == "a\nb\n"
+    export_service.iter_lines.assert_called_once_with("csv", PARTNER_ID)
+
+
+def test_export_rejects_malformed_after(admin_client):
+    client, _ = admin_client
+    response = client.get(
+        "/api/admin/partners/export?after=id-1", headers={"X-API-Key": API_KEY}
+    )
+    assert response.status_code == 400
+
+
+def test_export_rejects_unknown_format(admin_client):
+    client, _ = admin_client
+    response = client.get(
+        "/api/admin/partners/export?format=xml", headers={"X-API-Key": API_KEY}
+    )
+    assert response.status_code == 400
+
+
+def test_list_partners_passes_filters_and_returns_page(admin_client, listing_service):
+    client, _ = admin_client
+    listing_service.list_partners.return_value = PartnerPage(
+        partners=[
+            PartnerSummary(
+                id=PARTNER_ID,
+                email="a@example.com",
+                firstName="A",
+                lastName="Doe",
+                phone="1",
+                createdAt=datetime(2026, 1, 2, 3, 4, 5),
+            )
+        ],
+        nextCursor="next",
+    )
+
+    response = client.get(
+        "/api/admin/partners?lastName=Doe&limit=10&createdFrom=2026-01-01T00:00:00",
+        headers={"X-API-Key": API_KEY},
+    )
+
+    assert response.status_code == 200
+    data = response.get_json()["data"]
+    assert data["nextCursor"] == "next"
+    assert data["partners"][0]["createdAt"] == "2026-01-02T03:04:05"
+    listing_service.list_partners.assert_called_once_with(
+        limit=10,
+        cursor=None,
+        created_from=datetime(2026, 1, 1),
+        created_to=None,
+        first_name=None,
+        last_name="Doe",
+        phone=None,
+    )
+
+
+def test_list_partners_caps_page_size(admin_client, listing_service):
+    client, _ = admin_client
+    response = client.get(
+        "/api/admin/partners?limit=1000", headers={"X-API-Key": API_KEY}
+    )
+    assert response.status_code == 400
+    listing_service.list_partners.assert_not_called()
+
+
+def test_search_partners(export_service, listing_service):
+    search_index = Mock()
+    search_index.search.return_value = [
+        SearchHit(PARTNER_ID, "ann@example.com", "Ann", "Lee")
+    ]
+    app = Flask(__name__)
+    register_error_handlers(app)
+    app.register_blueprint(
+        create_admin_routes(
+            Mock(), export_service, listing_service, API_KEY, search_index
+        ),
+        url_prefix="/api/admin",
+    )
+
+    response = app.test_client().get(
+        "/api/admin/partners/search?q=ann", headers={"X-API-Key": API_KEY}
+    )
+
+    assert response.status_code == 200
+    assert response.get_json()["data"] == [
+        {
+            "id": PARTNER_ID,
+            "email": "ann@example.com",
+            "firstName": "Ann",
+            "lastName": "Lee",
+        }
+    ]
+    search_index.search.assert_called_once_with("ann", 10)
+
+
+def test_search_is_not_routed_without_an_index(admin_client):
+    client, _ = admin_client
+    response = client.get(
+        "/api/admin/partners/search?q=ann", headers={"X-API-Key": API_KEY}
+    )
+    assert response.status_code == 404
@@ -28,3 +28,26 @@ def test_health_check_route(client):
     assert data["status"] == "healthy"
     assert data["environment"] == "test"
     assert data["database"] == "ceremo_db"
+
+
+def test_jwks_route(client):
+    response = client.get("/.well-known/jwks.json")
+    assert response.status_code == 200
+    assert response.get_json() == {"keys": []}
+
+
+def test_metrics_route_is_opt_in(test_config, client):
+    assert client.get("/internal/metrics").status_code == 404
+
+    test_config.METRICS_ENABLED = True
+    test_config.METRICS_API_KEY = "metrics-key"
+    metrics_client = create_app(test_config).test_client()
+    assert metrics_client.get("/internal/metrics").status_code == 401
+
+    response = metrics_client.get(
+        "/internal/metrics", headers={"X-API-Key": "metrics-key"}
+    )
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["database_pool"]["size"] == test_config.DB_POOL_SIZE
+    assert "hits" in data["token_cache"]
@@ -2,8 +2,19 @@ import pytest
 from unittest.mock import Mock
 from flask import Flask
 from app.routes.auth_routes import create_auth_routes
-from app.contracts.auth_contracts import AuthResponse, AuthData, UserData
+from app.contracts.auth_contracts import (
+    AuthResponse,
+    AuthData,
+    UserData,
+    ProfileResponse,
+    RefreshResponse,
+    TokenData,
+)
 from app.utils.errors import register_error_handlers
+from app.utils.tokens import TokenMinter, TokenVerifier
+from app.utils.rate_limit import MemoryRateLimitBackend, SlidingWindowLimiter
+
+SECRET = "test-secret-key-at-least-32-chars-long-for-security"
 
 
 @pytest.fixture
@@ -15,7 +26,7 @@ def mock_auth_service():
 def auth_client(mock_auth_service):
     app = Flask(__name__)
     register_error_handlers(app)
-    auth_bp = create_auth_routes(mock_auth_service)
+    auth_bp = create_auth_routes(mock_auth_service, TokenVerifier(SECRET))
     app.register_blueprint(auth_bp, url_prefix="/api/auth")
     return app.test_client(), mock_auth_service
 
@@ -125,3 +136,76 @@ def test_sign_up_invalid_email(auth_client):
         content_type="application/json",
     )
     assert response.status_code == 400
+
+
+def test_get_profile_success(auth_client):
+    client, mock_auth_service = auth_client
+    mock_auth_service.get_profile.return_value = ProfileResponse(
+        data=UserData(
+            id="test-id",
+            email="test@example.com",
+            firstName="John",
+            lastName="Doe",
+            phone="1234567890",
+        ),
+        message="Profile retrieved",
+    )
+    token = TokenMinter(SECRET, refresh_expiration_hours=720).mint("test-id", 1)
+
+    response = client.get(
+        "/api/auth/partner/me", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 200
+    assert response.get_json()["data"]["id"] == "test-id"
+    mock_auth_service.get_profile.assert_called_once_with("test-id")
+
+
+def test_get_profile_requires_token(auth_client):
+    client, mock_auth_service = auth_client
+    response = client.get("/api/auth/partner/me")
+    assert response.status_code == 401
+    mock_auth_service.get_profile.assert_not_called()
+
+
+def test_refresh_success(auth_client):
+    client, mock_auth_service = auth_client
+    mock_auth_service.refresh.return_value = RefreshResponse(
+        data=TokenData(token="token", refreshToken="refresh"),
+        message="Token refreshed",
+    )
+
+    response = client.post(
+        "/api/auth/partner/refresh", json={"refreshToken": "old-refresh"}
+    )
+
+    assert response.status_code == 200
+    assert response.get_json()["data"]["refreshToken"] == "refresh"
+    mock_auth_service.refresh.assert_called_once_with("old-refresh")
+
+
+def test_refresh_missing_token(auth_client):
+    client, mock_auth_service = auth_client
+    response = client.post("/api/auth/partner/refresh", json={})
+    assert response.status_code == 400
+    mock_auth_service.refresh.assert_not_called()
+
+
+def test_sign_in_rate_limited_per_email():
+    mock_auth_service = Mock()
+    limiter = SlidingWindowLimiter(MemoryRateLimitBackend(), 1, 60)
+    app = Flask(__name__)
+    register_error_handlers(app)
+    auth_bp = create_auth_routes(mock_auth_service, email_rate_limiter=limiter)
+    app.register_blueprint(auth_bp, url_prefix="/api/auth")
+    client = app.test_client()
+    body = {"email": "test@example.com", "password": "password123"}
+
+    client.post("/api/auth/partner/signin", json=body)
+    response = client.post(
+        "/api/auth/partner/signin", json={**body, "email": "TEST@example.com"}
+    )
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert mock_auth_service.sign_in.call_count == 1
@@ -1,8 +1,15 @@
+import jwt
 import pytest
 from unittest.mock import Mock
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from app.services.auth_service import AuthService
 from app.models.rental_partner import RentalPartner
-from app.utils.errors import ValidationError, UnauthorizedError, ConflictError
+from app.utils.errors import (
+    ValidationError,
+    UnauthorizedError,
+    ConflictError,
+    NotFoundError,
+)
 
 
 @pytest.fixture
@@ -11,7 +18,15 @@ def mock_repository():
 
 
 @pytest.fixture
-def auth_service(mock_repository):
+def mock_revocation_service():
+    revocation_service = Mock()
+    revocation_service.is_revoked.return_value = False
+    revocation_service.consume.return_value = True
+    return revocation_service
+
+
+@pytest.fixture
+def auth_service(mock_repository, mock_revocation_service):
     return AuthService(
         repository=mock_repository,
         jwt_secret="test-secret-key-at-least-32-chars-long-for-security",
@@ -19,6 +34,7 @@ def auth_service(mock_repository):
         refresh_expiration=720,
         min_password_length=8,
         remember_me_multiplier=24,
+        revocation_service=mock_revocation_service,
     )
 
 
@@ -108,6 +124,68 @@ def test_sign_up_email_exists(auth_service, mock_repository, mock_partner):
         )
 
 
+def test_optimistic_sign_up_skips_duplicate_check(
+    auth_service, mock_repository, mock_partner
+):
+    auth_service.optimistic_signup = True
+    mock_repository.create.return_value = mock_partner
+
+    response = auth_service.sign_up(
+        email="test@example.com",
+        password="password123",
+        confirm_password="password123",
+        first_name="John",
+        last_name="Doe",
+        phone="1234567890",
+        agree_to_terms=True,
+    )
+
+    assert response.success is True
+    mock_repository.find_by_email.assert_not_called()
+
+
+def test_optimistic_sign_up_maps_duplicate_key_to_conflict(
+    auth_service, mock_repository
+):
+    auth_service.optimistic_signup = True
+    mock_repository.create.side_effect = IntegrityError(
+        "INSERT",
+        {},
+        Exception(1062, "Duplicate entry 'a' for key 'rental_partners.email'"),
+    )
+
+    with pytest.raises(ConflictError, match="Email already exists"):
+        auth_service.sign_up(
+            email="test@example.com",
+            password="password123",
+            confirm_password="password123",
+            first_name="John",
+            last_name="Doe",
+            phone="1234567890",
+            agree_to_terms=True,
+        )
+
+
+def test_sign_up_reraises_other_integrity_errors(auth_service, mock_repository):
+    auth_service.optimistic_signup = True
+    mock_repository.create.side_effect = IntegrityError(
+        "INSERT",
+        {},
+        Exception(1062, "Duplicate entry 'x' for key 'rental_partners.PRIMARY'"),
+    )
+
+    with pytest.raises(IntegrityError):
+        auth_service.sign_up(
+            email="test@example.com",
+            password="password123",
+            confirm_password="password123",
+            first_name="John",
+            last_name="Doe",
+            phone="1234567890",
+            agree_to_terms=True,
+        )
+
+
 def test_sign_in_success(auth_service, mock_repository, mock_partner, mocker):
     mock_repository.find_by_email.return_value = mock_partner
     mocker.patch("app.services.auth_service.verify_password", return_value=True)
@@ -120,13 +198,99 @@ def test_sign_in_success(auth_service, mock_repository, mock_partner, mocker):
     assert response.data.user.email == "test@example.com"
 
 
-def test_sign_in_invalid_email(auth_service, mock_repository):
+def test_sign_in_rehashes_outdated_hash(
+    auth_service, mock_repository, mock_partner, mocker
+):
+    mock_repository.find_by_email.return_value = mock_partner
+    mocker.patch("app.services.auth_service.verify_password", return_value=True)
+    mocker.patch("app.services.auth_service.password_needs_rehash", return_value=True)
+    mocker.patch("app.services.auth_service.hash_password", return_value="new_hash")
+
+    auth_service.sign_in(
+        email="test@example.com", password="password123", remember_me=False
+    )
+
+    mock_repository.update_password_hash.assert_called_once_with(
+        "test-id", "test@example.com", "new_hash"
+    )
+
+
+def test_sign_in_skips_rehash_for_current_hash(
+    auth_service, mock_repository, mock_partner, mocker
+):
+    mock_repository.find_by_email.return_value = mock_partner
+    mocker.patch("app.services.auth_service.verify_password", return_value=True)
+    mocker.patch("app.services.auth_service.password_needs_rehash", return_value=False)
+
+    auth_service.sign_in(
+        email="test@example.com", password="password123", remember_me=False
+    )
+
+    mock_repository.update_password_hash.assert_not_called()
+
+
+def test_sign_in_succeeds_when_rehash_fails(
+    auth_service, mock_repository, mock_partner, mocker
+):
+    mock_repository.find_by_email.return_value = mock_partner
+    mock_repository.update_password_hash.side_effect = SQLAlchemyError("down")
+    mocker.patch("app.services.auth_service.verify_password", return_value=True)
+    mocker.patch("app.services.auth_service.password_needs_rehash", return_value=True)
+    mocker.patch("app.services.auth_service.hash_password", return_value="new_hash")
+
+    response = auth_service.sign_in(
+        email="test@example.com", password="password123", remember_me=False
+    )
+
+    assert response.success is True
+
+
+def test_sign_in_invalid_email(auth_service, mock_repository, mocker):
     mock_repository.find_by_email.return_value = None
+    dummy = mocker.patch("app.services.auth_service.verify_dummy_password")
 
     with pytest.raises(UnauthorizedError, match="Invalid email or password"):
         auth_service.sign_in(
             email="wrong@example.com", password="password123", remember_me=False
         )
+    dummy.assert_called_once_with("password123")
+
+
+def test_sign_in_does_not_trust_email_index_misses(
+    auth_service, mock_repository, mock_partner, mocker
+):
+    # Registered on another pod since this pod's filter last synced.
+    auth_service.email_index = Mock()
+    auth_service.email_index.might_exist.return_value = False
+    mock_repository.find_by_email.return_value = mock_partner
+    mocker.patch("app.services.auth_service.verify_password", return_value=True)
+    mocker.patch("app.services.auth_service.password_needs_rehash", return_value=False)
+
+    response = auth_service.sign_in(
+        email="test@example.com", password="password123", remember_me=False
+    )
+
+    assert response.message == "Sign in successful"
+    auth_service.email_index.might_exist.assert_not_called()
+
+
+def test_sign_up_records_email_in_index(auth_service, mock_repository, mock_partner):
+    auth_service.email_index = Mock()
+    auth_service.email_index.might_exist.return_value = False
+    mock_repository.create.return_value = mock_partner
+
+    auth_service.sign_up(
+        email="new@example.com",
+        password="password123",
+        confirm_password="password123",
+        first_name="John",
+        last_name="Doe",
+        phone="1234567890",
+        agree_to_terms=True,
+    )
+
+    mock_repository.find_by_email.assert_not_called()
+    auth_service.email_index.add.assert_called_once_with("new@example.com")
 
 
 def test_sign_in_invalid_password(auth_service, mock_repository, mock_partner, mocker):
@@ -142,12 +306,100 @@ def test_sign_in_invalid_password(auth_service, mock_repository, mock_partner, m
 def test_sign_in_remember_me(auth_service, mock_repository, mock_partner, mocker):
     mock_repository.find_by_email.return_value = mock_partner
     mocker.patch("app.services.auth_service.verify_password", return_value=True)
-    mock_generate = mocker.patch(
-        "app.services.auth_service.generate_token", return_value="token"
+    mock_mint = mocker.patch.object(
+        auth_service.token_minter, "mint_pair", return_value=("token", "refresh")
     )
 
     auth_service.sign_in(
         email="test@example.com", password="password123", remember_me=True
     )
 
-    assert mock_generate.call_args_list[0][0][2] == 24 * 24
+    assert mock_mint.call_args[0][1] == 24 * 24
+
+
+def test_auth_response_tokens_share_issued_at(
+    auth_service, mock_repository, mock_partner, mocker
+):
+    mock_repository.find_by_email.return_value = mock_partner
+    mocker.patch("app.services.auth_service.verify_password", return_value=True)
+
+    response = auth_service.sign_in(
+        email="test@example.com", password="password123", remember_me=False
+    )
+
+    secret = "test-secret-key-at-least-32-chars-long-for-security"
+    access = jwt.decode(response.data.token, secret, algorithms=["HS256"])
+    refresh = jwt.decode(response.data.refreshToken, secret, algorithms=["HS256"])
+    assert access["user_id"] == refresh["user_id"] == "test-id"
+    assert access["iat"] == refresh["iat"]
+    assert access["exp"] - access["iat"] == 24 * 3600
+    assert refresh["exp"] - refresh["iat"] == 720 * 3600
+
+
+def test_get_profile_success(auth_service, mock_repository, mock_partner):
+    mock_repository.find_by_id.return_value = mock_partner
+
+    response = auth_service.get_profile("test-id")
+
+    assert response.success is True
+    assert response.data.id == "test-id"
+    assert response.data.email == "test@example.com"
+    mock_repository.find_by_id.assert_called_once_with("test-id")
+
+
+def test_get_profile_not_found(auth_service, mock_repository):
+    mock_repository.find_by_id.return_value = None
+
+    with pytest.raises(NotFoundError):
+        auth_service.get_profile("missing-id")
+
+
+def test_refresh_rotates_tokens(auth_service, mock_revocation_service):
+    _, refresh_token = auth_service.token_minter.mint_pair("test-id", 24)
+    old_claims = auth_service.token_verifier.verify(refresh_token, "refresh")
+
+    response = auth_service.refresh(refresh_token)
+
+    new_claims = auth_service.token_verifier.verify(
+        response.data.refreshToken, "refresh"
+    )
+    assert response.success is True
+    assert new_claims["fam"] == old_claims["fam"]
+    assert new_claims["jti"] != old_claims["jti"]
+    assert auth_service.token_verifier.verify(response.data.token)["user_id"] == (
+        "test-id"
+    )
+    mock_revocation_service.consume.assert_called_once_with(
+        old_claims["jti"], old_claims["exp"]
+    )
+
+
+def test_refresh_rejects_access_token(auth_service):
+    access_token, _ = auth_service.token_minter.mint_pair("test-id", 24)
+    with pytest.raises(UnauthorizedError):
+        auth_service.refresh(access_token)
+
+
+def test_refresh_rejects_token_without_family(auth_service):
+    token = auth_service.token_minter.mint("test-id", 24, token_type="refresh")
+    with pytest.raises(UnauthorizedError):
+        auth_service.refresh(token)
+
+
+def test_refresh_rejects_revoked_family(auth_service, mock_revocation_service):
+    mock_revocation_service.is_revoked.return_value = True
+    _, refresh_token = auth_service.token_minter.mint_pair("test-id", 24)
+
+    with pytest.raises(UnauthorizedError, match="revoked"):
+        auth_service.refresh(refresh_token)
+    mock_revocation_service.consume.assert_not_called()
+
+
+def test_refresh_reuse_revokes_family(auth_service, mock_revocation_service):
+    mock_revocation_service.consume.return_value = False
+    _, refresh_token = auth_service.token_minter.mint_pair("test-id", 24)
+    family_id = auth_service.token_verifier.verify(refresh_token, "refresh")["fam"]
+
+    with pytest.raises(UnauthorizedError, match="revoked"):
+        auth_service.refresh(refresh_token)
+    assert mock_revocation_service.revoke_family.call_args[0][0] == family_id
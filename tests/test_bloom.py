@@ -0,0 +1,61 @@
+import pytest
+from app.utils.bloom import BloomFilter
+
+
+def test_added_items_are_members():
+    bloom = BloomFilter(capacity=1000)
+    items = [f"item-{i}" for i in range(1000)]
+    bloom.update(items)
+    assert all(item in bloom for item in items)
+    assert bloom.count == 1000
+
+
+def test_false_positive_rate_is_bounded():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    bloom.update(f"item-{i}" for i in range(1000))
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+def test_non_string_is_not_member():
+    bloom = BloomFilter(capacity=10)
+    assert 1 not in bloom
+
+
+def test_saturated():
+    bloom = BloomFilter(capacity=2)
+    bloom.update(["a", "b"])
+    assert bloom.saturated is False
+    bloom.add("c")
+    assert bloom.saturated is True
+
+
+def test_size_bytes():
+    bloom = BloomFilter(capacity=1000, error_rate=0.001)
+    assert 1700 <= bloom.size_bytes <= 1900
+
+
+@pytest.mark.parametrize("capacity,error_rate", [(0, 0.01), (10, 0), (10, 1)])
+def test_invalid_parameters(capacity, error_rate):
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=capacity, error_rate=error_rate)
+
+
+def test_readding_an_item_does_not_count_twice():
+    bloom = BloomFilter(capacity=10)
+    bloom.update(["a", "a", "b"])
+    assert bloom.count == 2
+
+
+def test_shared_filter_loads_rebuilt_contents():
+    bloom = BloomFilter(capacity=100, shared=True)
+    bloom.add("stale")
+    rebuilt = BloomFilter(capacity=100)
+    rebuilt.add("fresh")
+
+    bloom.load(rebuilt)
+
+    assert "fresh" in bloom and "stale" not in bloom
+    assert bloom.count == 1
+    with pytest.raises(ValueError):
+        bloom.load(BloomFilter(capacity=10))
@@ -0,0 +1,113 @@
+import pytest
+from app.models.rental_partner import RentalPartnerRecord
+from app.repositories.cached_rental_partner_repository import (
+    CachedRentalPartnerRepository,
+)
+from app.utils.ids import uuid7
+from app.utils.ttl_cache import TTLCache
+
+
+@pytest.fixture
+def repository():
+    return CachedRentalPartnerRepository(max_bytes=1024 * 1024, ttl_seconds=60)
+
+
+def test_lookups_are_served_from_cache(repository, count_queries):
+    partner = repository.create("a@example.com", "hash", "A", "B", "1")
+
+    with count_queries() as statements:
+        by_email = repository.find_by_email(" A@Example.com ")
+        by_id = repository.find_by_id(partner.id)
+
+    assert statements == []
+    assert by_email == by_id == partner
+    assert isinstance(by_email, RentalPartnerRecord)
+
+
+def test_miss_reads_through_and_caches_both_keys(repository, count_queries):
+    partner = repository.create("a@example.com", "hash", "A", "B", "1")
+    repository.cache.delete("id:" + partner.id, "email:a@example.com")
+
+    with count_queries() as statements:
+        assert repository.find_by_email("a@example.com") == partner
+        assert repository.find_by_id(partner.id) == partner
+    assert len(statements) == 1
+
+    metrics = repository.metrics()
+    assert metrics["hits"] == 1
+    assert metrics["misses"] == 1
+    assert metrics["entries"] == 2
+
+
+def test_unknown_partner_is_not_cached(db_app, repository):
+    assert repository.find_by_email("missing@example.com") is None
+    assert repository.metrics()["entries"] == 0
+
+
+def test_update_password_hash_invalidates_both_keys(repository, count_queries):
+    partner = repository.create("a@example.com", "hash", "A", "B", "1")
+
+    repository.update_password_hash(partner.id, partner.email, "new-hash")
+
+    assert repository.metrics()["entries"] == 0
+    assert repository.metrics()["hits"] == repository.metrics()["misses"] == 0
+    assert repository.find_by_email("a@example.com").password_hash == "new-hash"
+    assert repository.find_by_id(partner.id).password_hash == "new-hash"
+
+
+def test_update_password_hash_drops_email_key_after_id_eviction(db_app, repository):
+    partner = repository.create("a@example.com", "hash", "A", "B", "1")
+    repository.cache.delete("id:" + partner.id)
+
+    repository.update_password_hash(partner.id, partner.email, "new-hash")
+
+    assert repository.cache.get("email:a@example.com") is None
+    assert repository.find_by_email("a@example.com").password_hash == "new-hash"
+
+
+def test_create_many_invalidates_cached_emails(db_app, repository):
+    record = RentalPartnerRecord(uuid7(), "a@example.com", "hash", "A", "B", "1")
+    repository.cache.set("email:a@example.com", record)
+
+    repository.create_many(
+        [RentalPartnerRecord(uuid7(), "b@example.com", "hash", "B", "B", "2")]
+    )
+    assert repository.cache.get("email:a@example.com") == record
+
+    repository.cache.delete("email:a@example.com")
+    repository.create_many([record])
+    assert repository.cache.get("email:a@example.com") is None
+    assert repository.find_by_email("a@example.com").id == record.id
+
+
+def test_ttl_cache_expires_entries(mocker):
+    clock = mocker.patch("app.utils.ttl_cache.time.monotonic", return_value=100.0)
+    cache = TTLCache(max_bytes=1024, ttl_seconds=10)
+    cache.set("key", ("value",))
+
+    clock.return_value = 109.0
+    assert cache.get("key") == ("value",)
+    clock.return_value = 110.0
+    assert cache.get("key") is None
+    assert cache.metrics()["entries"] == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_bytes=30, ttl_seconds=60, sizeof=lambda value: 10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    cache.get("a")
+
+    cache.set("d", 4)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.metrics()["evictions"] == 1
+    assert cache.metrics()["size_bytes"] == 30
+
+
+def test_ttl_cache_skips_values_larger_than_budget():
+    cache = TTLCache(max_bytes=5, ttl_seconds=60, sizeof=lambda value: 10)
+    cache.set("a", 1)
+    assert cache.get("a") is None
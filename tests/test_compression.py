@@ -0,0 +1,153 @@
+import gzip
+import json
+
+import pytest
+from flask import Flask, Response, jsonify
+from werkzeug.datastructures import Accept
+from werkzeug.http import parse_accept_header
+
+from app.utils.compression import (
+    STREAM_FLUSH_BYTES,
+    negotiate_encoding,
+    register_compression,
+)
+
+brotli = pytest.importorskip("brotli")
+zstandard = pytest.importorskip("zstandard")
+
+LARGE = {"partners": [{"email": f"user{i}@example.com"} for i in range(200)]}
+DECOMPRESS = {
+    "gzip": gzip.decompress,
+    "br": brotli.decompress,
+    "zstd": lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data),
+}
+
+
+@pytest.fixture
+def compressed_app():
+    app = Flask(__name__)
+    register_compression(app, ["zstd", "br", "gzip"], min_size=1024)
+    closed = []
+
+    @app.route("/large")
+    def large():
+        return jsonify(LARGE)
+
+    @app.route("/small")
+    def small():
+        return jsonify({"token": "abc"})
+
+    @app.route("/csv")
+    def csv():
+        return Response("a,b\n" * 1000, mimetype="text/csv")
+
+    @app.route("/tagged")
+    def tagged():
+        response = jsonify(LARGE)
+        response.add_etag()
+        return response
+
+    @app.route("/raw")
+    def raw():
+        response = jsonify(LARGE)
+        response.cache_control.no_transform = True
+        return response
+
+    @app.route("/stream")
+    def stream():
+        class Lines:
+            def __iter__(self):
+                for i in range(5000):
+                    yield json.dumps({"line": i}) + "\n"
+
+            def close(self):
+                closed.append(True)
+
+        return Response(Lines(), mimetype="application/x-ndjson")
+
+    app.closed = closed
+    return app
+
+
+def get(app, path, accept_encoding=None, method="GET"):
+    headers = {"Accept-Encoding": accept_encoding} if accept_encoding else {}
+    return app.test_client().open(path, method=method, headers=headers)
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br", "zstd"])
+def test_compresses_json_with_the_requested_encoding(compressed_app, encoding):
+    response = get(compressed_app, "/large", encoding)
+
+    assert response.headers["Content-Encoding"] == encoding
+    assert "Accept-Encoding" in response.vary
+    body = response.get_data()
+    assert response.content_length == len(body)
+    assert json.loads(DECOMPRESS[encoding](body)) == LARGE
+
+
+def test_skips_small_bodies_but_still_varies(compressed_app):
+    response = get(compressed_app, "/small", "gzip")
+
+    assert "Content-Encoding" not in response.headers
+    assert "Accept-Encoding" in response.vary
+    assert response.get_json() == {"token": "abc"}
+
+
+def test_skips_other_content_types_and_uncompressing_clients(compressed_app):
+    response = get(compressed_app, "/csv", "gzip")
+    assert "Content-Encoding" not in response.headers
+    assert "Accept-Encoding" not in response.vary
+
+    assert "Content-Encoding" not in get(compressed_app, "/large").headers
+
+
+def test_respects_no_transform_and_head(compressed_app):
+    assert "Content-Encoding" not in get(compressed_app, "/raw", "gzip").headers
+    head = get(compressed_app, "/large", "gzip", method="HEAD")
+    assert "Content-Encoding" not in head.headers
+
+
+def test_weakens_etag_of_compressed_body(compressed_app):
+    response = get(compressed_app, "/tagged", "gzip")
+    etag, weak = response.get_etag()
+    assert etag and weak
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br", "zstd"])
+def test_compresses_streamed_ndjson(compressed_app, encoding):
+    response = get(compressed_app, "/stream", encoding)
+
+    assert response.headers["Content-Encoding"] == encoding
+    assert "Content-Length" not in response.headers
+    lines = DECOMPRESS[encoding](response.get_data()).decode().splitlines()
+    assert [json.loads(line)["line"] for line in lines] == list(range(5000))
+    assert compressed_app.closed == [True]
+
+
+def test_stream_flushes_in_blocks_not_per_chunk(compressed_app):
+    response = get(compressed_app, "/stream", "gzip")
+
+    chunks = [chunk for chunk in response.response if chunk]
+    raw_size = sum(len(json.dumps({"line": i})) + 1 for i in range(5000))
+    assert len(chunks) <= raw_size // STREAM_FLUSH_BYTES + 2
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip, br", "br"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("*", "zstd"),
+        ("identity", None),
+        ("gzip;q=0", None),
+        ("", None),
+    ],
+)
+def test_negotiate_encoding(header, expected):
+    accept = parse_accept_header(header, Accept)
+    assert negotiate_encoding(accept, ["zstd", "br", "gzip"]) == expected
+
+
+def test_rejects_unknown_encodings():
+    with pytest.raises(ValueError):
+        register_compression(Flask(__name__), ["gzip", "lzma"], min_size=1024)
@@ -1,6 +1,7 @@
 import pytest
 import os
-from app.config import Config, get_settings
+from app.config import Config, cpus_per_web_worker, get_settings
+from app.utils.cpu import cpu_allotment
 
 
 def test_config_defaults():
@@ -12,6 +13,50 @@ def test_config_defaults():
     assert config.REFRESH_TOKEN_EXPIRATION_HOURS == 720
     assert config.MIN_PASSWORD_LENGTH == 8
     assert config.REMEMBER_ME_MULTIPLIER == 24
+    assert config.PASSWORD_HASHER == "bcrypt"
+    assert config.BCRYPT_ROUNDS == 12
+    assert config.PASSWORD_HASH_TARGET_MS == 0
+    assert config.HASHING_POOL_TYPE == "thread"
+    assert config.HASHING_QUEUE_SIZE == 32
+    assert config.HASHING_TIMEOUT_SECONDS == 5
+    assert config.EMAIL_INDEX_ENABLED is True
+    assert config.PARTNER_CACHE_ENABLED is True
+    assert config.PARTNER_CACHE_TTL_SECONDS == 30
+    assert config.DB_POOL_SIZE == 10
+    assert config.DB_POOL_RECYCLE_SECONDS == 280
+    assert config.DB_POOL_PRE_PING is True
+    assert config.METRICS_ENABLED is False
+    assert config.METRICS_API_KEY == ""
+    assert config.ADMIN_API_KEY == ""
+    assert config.IMPORT_BATCH_SIZE == 500
+    assert config.IMPORT_HASHING_WORKERS == cpu_allotment()
+    assert config.EMAIL_INDEX_SYNC_SECONDS == 10
+    assert config.RATE_LIMIT_BACKEND == "memory"
+    assert config.SIGNIN_IP_LIMIT == 20
+    assert config.SIGNIN_EMAIL_LIMIT == 5
+    assert config.PROXY_FIX_X_FOR == 0
+
+
+def test_config_database_engine_options():
+    config = Config(DB_POOL_SIZE=4, DB_MAX_OVERFLOW=2, DB_POOL_TIMEOUT_SECONDS=1.5)
+    options = config.DATABASE_ENGINE_OPTIONS
+    assert options["pool_size"] == 4
+    assert options["max_overflow"] == 2
+    assert options["pool_timeout"] == 1.5
+    assert options["pool_pre_ping"] is True
+
+
+def test_config_database_binds():
+    assert Config(DATABASE_REPLICA_URLS="").DATABASE_BINDS == {}
+
+    config = Config(DATABASE_REPLICA_URLS="mysql://r1/db, mysql://r2/db")
+    binds = config.DATABASE_BINDS
+    assert [bind["url"] for bind in binds.values()] == [
+        "mysql://r1/db",
+        "mysql://r2/db",
+    ]
+    assert list(binds) == ["replica_0", "replica_1"]
+    assert binds["replica_0"]["pool_size"] == config.DB_POOL_SIZE
 
 
 def test_config_database_url():
@@ -51,3 +96,14 @@ def test_get_settings():
     reload(app.config)
     settings = app.config.get_settings()
     assert isinstance(settings, app.config.Config)
+
+
+@pytest.mark.parametrize(
+    "cpus, workers, expected",
+    [(8, "4", 2), (8, "0", 1), (2, "4", 1), (8, "", 1)],
+)
+def test_cpus_per_web_worker_splits_quota(monkeypatch, cpus, workers, expected):
+    monkeypatch.setattr("app.config.cpu_allotment", lambda: cpus)
+    monkeypatch.setenv("WEB_CONCURRENCY", workers or "0")
+
+    assert cpus_per_web_worker() == expected
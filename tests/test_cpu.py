@@ -0,0 +1,34 @@
+import os
+
+import pytest
+
+from app.utils.cpu import cpu_allotment
+
+CPUS = len(os.sched_getaffinity(0))
+
+
+def write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@pytest.mark.parametrize(
+    "files, expected",
+    [
+        ({"cpu.max": "200000 100000\n"}, min(CPUS, 2)),
+        ({"cpu.max": "150000 100000\n"}, 1),
+        ({"cpu.max": "50000 100000\n"}, 1),
+        ({"cpu.max": "max 100000\n"}, CPUS),
+        (
+            {"cpu/cpu.cfs_quota_us": "100000", "cpu/cpu.cfs_period_us": "100000"},
+            1,
+        ),
+        ({"cpu/cpu.cfs_quota_us": "-1", "cpu/cpu.cfs_period_us": "100000"}, CPUS),
+        ({}, CPUS),
+    ],
+)
+def test_cpu_allotment_honors_cgroup_quota(tmp_path, files, expected):
+    for name, content in files.items():
+        write(tmp_path / name, content)
+
+    assert cpu_allotment(str(tmp_path)) == expected
@@ -7,6 +7,8 @@ from app.utils.errors import (
     ConflictError,
     UnauthorizedError,
     ForbiddenError,
+    TooManyRequestsError,
+    ServiceUnavailableError,
     register_error_handlers,
 )
 
@@ -36,6 +38,14 @@ def error_app():
     def forbidden_error():
         raise ForbiddenError()
 
+    @app.route("/too-many")
+    def too_many_requests_error():
+        raise TooManyRequestsError(retry_after=7)
+
+    @app.route("/unavailable")
+    def unavailable_error():
+        raise ServiceUnavailableError()
+
     @app.route("/server-error")
     def server_error():
         raise Exception("Internal error")
@@ -85,6 +95,24 @@ def test_forbidden_error(error_app):
     assert data["success"] is False
 
 
+def test_too_many_requests_error(error_app):
+    client = error_app.test_client()
+    response = client.get("/too-many")
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "7"
+    data = response.get_json()
+    assert data["success"] is False
+    assert data["error"]["details"]["retryAfter"] == 7
+
+
+def test_service_unavailable_error(error_app):
+    client = error_app.test_client()
+    response = client.get("/unavailable")
+    assert response.status_code == 503
+    data = response.get_json()
+    assert data["success"] is False
+
+
 def test_404_handler(error_app):
     client = error_app.test_client()
     response = client.get("/nonexistent")
@@ -0,0 +1,118 @@
+import pytest
+from app.utils.hashing import (
+    BcryptHasher,
+    Argon2idHasher,
+    HasherRegistry,
+    calibrate_hasher,
+    create_hasher_registry,
+)
+
+
+@pytest.fixture
+def bcrypt_hasher():
+    return BcryptHasher(rounds=4)
+
+
+@pytest.fixture
+def argon2_hasher():
+    return Argon2idHasher(time_cost=1, memory_cost=1024, parallelism=1)
+
+
+def test_bcrypt_hash_and_verify(bcrypt_hasher):
+    hashed = bcrypt_hasher.hash("test_password")
+    assert hashed.startswith("$2b$04$")
+    assert bcrypt_hasher.verify("test_password", hashed) is True
+    assert bcrypt_hasher.verify("wrong_password", hashed) is False
+
+
+def test_bcrypt_rejects_invalid_rounds():
+    with pytest.raises(ValueError, match="rounds"):
+        BcryptHasher(rounds=3)
+
+
+def test_bcrypt_verify_malformed_hash(bcrypt_hasher):
+    assert bcrypt_hasher.verify("test_password", "$2b$not-a-hash") is False
+
+
+def test_bcrypt_needs_rehash(bcrypt_hasher):
+    hashed = bcrypt_hasher.hash("test_password")
+    assert bcrypt_hasher.needs_rehash(hashed) is False
+    assert BcryptHasher(rounds=5).needs_rehash(hashed) is True
+    assert bcrypt_hasher.needs_rehash(hashed.replace("$2b$", "$2a$", 1)) is True
+    assert bcrypt_hasher.needs_rehash("$2b$xx$abc") is True
+
+
+def test_argon2_hash_and_verify(argon2_hasher):
+    hashed = argon2_hasher.hash("test_password")
+    assert hashed.startswith("$argon2id$")
+    assert argon2_hasher.verify("test_password", hashed) is True
+    assert argon2_hasher.verify("wrong_password", hashed) is False
+    assert argon2_hasher.verify("test_password", "$argon2id$garbage") is False
+
+
+def test_argon2_needs_rehash(argon2_hasher):
+    hashed = argon2_hasher.hash("test_password")
+    assert argon2_hasher.needs_rehash(hashed) is False
+    assert argon2_hasher.with_cost(2).needs_rehash(hashed) is True
+    assert argon2_hasher.needs_rehash("$argon2id$garbage") is True
+
+
+def test_registry_dispatches_on_prefix(bcrypt_hasher, argon2_hasher):
+    registry = HasherRegistry(argon2_hasher, [bcrypt_hasher])
+    legacy = bcrypt_hasher.hash("test_password")
+    current = registry.hash("test_password")
+
+    assert current.startswith("$argon2id$")
+    assert registry.hasher_for(legacy) is bcrypt_hasher
+    assert registry.verify("test_password", legacy) is True
+    assert registry.verify("test_password", current) is True
+    assert registry.verify("test_password", "plaintext") is False
+
+
+def test_registry_needs_rehash(bcrypt_hasher, argon2_hasher):
+    registry = HasherRegistry(argon2_hasher, [bcrypt_hasher])
+    assert registry.needs_rehash(bcrypt_hasher.hash("test_password")) is True
+    assert registry.needs_rehash(registry.hash("test_password")) is False
+
+
+def test_calibrate_raises_cost_towards_target(bcrypt_hasher, mocker):
+    timings = {4: 1.0, 5: 2.0, 6: 4.0, 7: 8.0}
+    mocker.patch(
+        "app.utils.hashing.measure_hash_ms",
+        side_effect=lambda hasher: timings[hasher.cost],
+    )
+
+    calibrated = calibrate_hasher(bcrypt_hasher, target_ms=5, max_cost=16)
+    assert calibrated.cost == 6
+
+
+def test_calibrate_respects_max_cost(bcrypt_hasher, mocker):
+    mocker.patch("app.utils.hashing.measure_hash_ms", return_value=0.1)
+    calibrated = calibrate_hasher(bcrypt_hasher, target_ms=100, max_cost=6)
+    assert calibrated.cost == 6
+
+
+def test_calibrate_never_lowers_configured_cost(bcrypt_hasher, mocker):
+    mocker.patch("app.utils.hashing.measure_hash_ms", return_value=500)
+    calibrated = calibrate_hasher(bcrypt_hasher, target_ms=100, max_cost=16)
+    assert calibrated is bcrypt_hasher
+
+
+def test_create_hasher_registry_defaults():
+    registry = create_hasher_registry()
+    assert isinstance(registry.default, BcryptHasher)
+    assert registry.default.rounds == 12
+
+
+def test_create_hasher_registry_argon2_with_calibration(mocker):
+    mock_calibrate = mocker.patch(
+        "app.utils.hashing.calibrate_hasher", side_effect=lambda h, t, m: h
+    )
+    registry = create_hasher_registry(algorithm="argon2id", target_ms=250)
+    assert isinstance(registry.default, Argon2idHasher)
+    assert mock_calibrate.call_args[0][1] == 250
+
+
+def test_create_hasher_registry_unknown_algorithm():
+    with pytest.raises(ValueError, match="must be one of"):
+        create_hasher_registry(algorithm="md5")
@@ -0,0 +1,79 @@
+import threading
+import pytest
+from app.utils.hashing_executor import HashingExecutor
+from app.utils.errors import ServiceUnavailableError
+
+
+def _add(a, b):
+    return a + b
+
+
+@pytest.fixture
+def executor():
+    executor = HashingExecutor(max_workers=1, max_queue_size=1, timeout=2)
+    yield executor
+    executor.shutdown()
+
+
+def test_run_returns_result(executor):
+    assert executor.run(_add, 2, 3) == 5
+    metrics = executor.metrics()
+    assert metrics["submitted"] == 1
+    assert metrics["completed"] == 1
+    assert metrics["in_flight"] == 0
+
+
+def test_run_on_process_pool():
+    executor = HashingExecutor(max_workers=1, pool_type="process", timeout=30)
+    try:
+        assert executor.run(_add, 1, 1) == 2
+    finally:
+        executor.shutdown()
+
+
+def test_invalid_pool_type():
+    with pytest.raises(ValueError, match="pool_type"):
+        HashingExecutor(max_workers=1, pool_type="fiber")
+
+
+def test_invalid_max_workers():
+    with pytest.raises(ValueError, match="max_workers"):
+        HashingExecutor(max_workers=0)
+
+
+def test_rejects_when_queue_full(executor):
+    release = threading.Event()
+    running = executor.submit(release.wait)
+    queued = executor.submit(release.wait)
+
+    metrics = executor.metrics()
+    assert metrics["in_flight"] == 2
+    assert metrics["queue_depth"] == 1
+
+    with pytest.raises(ServiceUnavailableError, match="busy"):
+        executor.submit(release.wait)
+    assert executor.metrics()["rejected"] == 1
+
+    release.set()
+    running.result()
+    queued.result()
+    assert executor.metrics()["peak_queue_depth"] == 1
+
+
+def test_run_times_out():
+    executor = HashingExecutor(max_workers=1, max_queue_size=0, timeout=0.05)
+    release = threading.Event()
+    try:
+        with pytest.raises(ServiceUnavailableError):
+            executor.run(release.wait)
+        assert executor.metrics()["timed_out"] == 1
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+def test_failed_call_is_counted(executor):
+    with pytest.raises(ZeroDivisionError):
+        executor.run(divmod, 1, 0)
+    assert executor.metrics()["failed"] == 1
+    assert executor.metrics()["in_flight"] == 0
@@ -0,0 +1,29 @@
+import time
+import uuid
+from app.utils.ids import is_uuid, uuid7
+
+
+def test_uuid7_sets_version_and_variant():
+    value = uuid.UUID(uuid7())
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_embeds_the_current_millisecond():
+    before = time.time_ns() // 1_000_000
+    value = uuid.UUID(uuid7())
+    after = time.time_ns() // 1_000_000
+    assert before <= value.int >> 80 <= after
+
+
+def test_uuid7_sorts_by_creation_time():
+    first = uuid7()
+    time.sleep(0.002)
+    assert uuid7() > first
+
+
+def test_is_uuid():
+    assert is_uuid(uuid7())
+    assert is_uuid(str(uuid.uuid4()))
+    assert not is_uuid("id-1")
+    assert not is_uuid("")
@@ -0,0 +1,102 @@
+import pytest
+from flask import Flask
+from app.contracts.auth_contracts import MAX_INTROSPECTION_TOKENS
+from app.routes.introspection_routes import create_introspection_routes
+from app.utils.errors import register_error_handlers
+from app.utils.tokens import TokenMinter, TokenVerifier
+
+SECRET = "introspection-test-secret-at-least-32-chars"  # nosec B105
+API_KEY = "gateway-key"
+PARTNER_ID = "0190a5c4-8e1d-7c3b-9a2f-1b2c3d4e5f60"
+
+
+@pytest.fixture
+def verifier():
+    return TokenVerifier(SECRET)
+
+
+@pytest.fixture
+def introspection_client(verifier):
+    app = Flask(__name__)
+    register_error_handlers(app)
+    app.register_blueprint(
+        create_introspection_routes(verifier, API_KEY), url_prefix="/api/auth"
+    )
+    return app.test_client()
+
+
+def introspect(client, tokens, api_key=API_KEY):
+    return client.post(
+        "/api/auth/introspect", json={"tokens": tokens}, headers={"X-API-Key": api_key}
+    )
+
+
+def test_introspect_reports_each_token_in_order(introspection_client):
+    access_token, refresh_token = TokenMinter(SECRET, 720).mint_pair(PARTNER_ID, 24)
+
+    response = introspect(
+        introspection_client, [access_token, "not-a-token", refresh_token]
+    )
+
+    assert response.status_code == 200
+    active, invalid, refresh = response.get_json()["data"]
+    assert active["active"] is True
+    assert active["userId"] == PARTNER_ID
+    assert active["tokenType"] == "access"
+    assert active["expiresAt"] - active["issuedAt"] == 24 * 3600
+    assert invalid == {
+        "active": False,
+        "userId": None,
+        "tokenType": None,
+        "jti": None,
+        "issuedAt": None,
+        "expiresAt": None,
+    }
+    assert refresh["active"] is False
+
+
+def test_introspect_rejects_expired_and_foreign_tokens(introspection_client):
+    expired = TokenMinter(SECRET, 720).mint(PARTNER_ID, 1, issued_at=1_000_000)
+    foreign = TokenMinter("another-secret-at-least-32-characters!", 720).mint(
+        PARTNER_ID, 24
+    )
+
+    response = introspect(introspection_client, [expired, foreign])
+
+    assert [result["active"] for result in response.get_json()["data"]] == [
+        False,
+        False,
+    ]
+
+
+def test_introspect_answers_repeats_from_the_verifier_cache(
+    introspection_client, verifier
+):
+    token = TokenMinter(SECRET, 720).mint(PARTNER_ID, 24)
+
+    introspect(introspection_client, [token] * 5)
+
+    assert verifier.metrics()["misses"] == 1
+    assert verifier.metrics()["hits"] == 4
+
+
+def test_introspect_requires_api_key(introspection_client):
+    response = introspect(introspection_client, ["token"], api_key="wrong")
+    assert response.status_code == 401
+
+
+@pytest.mark.parametrize("count", [0, MAX_INTROSPECTION_TOKENS + 1])
+def test_introspect_bounds_batch_size(introspection_client, count):
+    response = introspect(introspection_client, ["token"] * count)
+    assert response.status_code == 400
+
+
+def test_introspection_is_opt_in(test_config):
+    from app import create_app
+
+    client = create_app(test_config).test_client()
+    assert introspect(client, ["token"]).status_code == 404
+
+    test_config.INTROSPECTION_API_KEY = API_KEY
+    client = create_app(test_config).test_client()
+    assert introspect(client, ["token"]).status_code == 200
@@ -0,0 +1,104 @@
+import json
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+
+from app.contracts.auth_contracts import AuthData, AuthResponse, UserData
+from app.utils.json_provider import (
+    OrjsonProvider,
+    contract_response,
+    create_json_provider,
+)
+
+
+@pytest.fixture
+def json_app():
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    return app
+
+
+def test_create_json_provider_by_name(json_app):
+    assert isinstance(create_json_provider(json_app, "orjson"), OrjsonProvider)
+    stdlib = create_json_provider(json_app, "stdlib")
+    assert type(stdlib) is DefaultJSONProvider
+
+    with pytest.raises(ValueError):
+        create_json_provider(json_app, "simplejson")
+
+
+def test_output_matches_stdlib_provider(json_app):
+    value = {
+        "id": uuid.UUID("0190a5c4-8a7b-7c3d-9e1f-2a3b4c5d6e7f"),
+        "at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "amount": Decimal("1.50"),
+        1: [True, None, 2.5],
+    }
+    stdlib = DefaultJSONProvider(json_app)
+    stdlib.sort_keys = False
+
+    assert json.loads(json_app.json.dumps(value)) == json.loads(stdlib.dumps(value))
+
+
+def test_falls_back_to_stdlib_for_values_orjson_rejects(json_app):
+    assert json_app.json.dumps({"big": 2**70}) == '{"big": 1180591620717411303424}'
+
+    with pytest.raises(TypeError):
+        json_app.json.dumps({"value": object()})
+
+
+def test_request_bodies_are_decoded_by_the_provider(json_app):
+    @json_app.route("/echo", methods=["POST"])
+    def echo():
+        return jsonify(request.get_json())
+
+    client = json_app.test_client()
+    response = client.post(
+        "/echo", data=b'{"name": "Jo\\u00eb"}', content_type="application/json"
+    )
+    assert response.get_json() == {"name": "Joë"}
+
+    response = client.post("/echo", data=b"{invalid", content_type="application/json")
+    assert response.status_code == 400
+
+
+def test_jsonify_honors_compact_setting(json_app):
+    json_app.json.compact = False
+    with json_app.app_context():
+        body = jsonify({"a": 1}).get_data(as_text=True)
+    assert body == '{\n  "a": 1\n}'
+
+
+def test_contract_response_writes_model_json(json_app):
+    contract = AuthResponse(
+        data=AuthData(
+            user=UserData(
+                id="partner-1",
+                email="a@example.com",
+                firstName="A",
+                lastName="B",
+                phone="1",
+            ),
+            token="token",
+            refreshToken="refresh",
+        ),
+        message="Sign in successful",
+    )
+
+    with json_app.app_context():
+        response = contract_response(contract, 201)
+
+    assert response.status_code == 201
+    assert response.mimetype == "application/json"
+    assert response.get_json() == contract.model_dump()
+
+
+def test_app_uses_configured_provider(test_config):
+    from app import create_app
+
+    test_config.JSON_PROVIDER = "stdlib"
+    assert type(create_app(test_config).json) is DefaultJSONProvider
@@ -0,0 +1,36 @@
+import pytest
+from flask import Flask
+from cryptography.hazmat.primitives.asymmetric import ed25519
+from app.routes.jwks_routes import create_jwks_routes
+from app.utils.signing_keys import AsymmetricSigningKey, KeyRing
+
+
+@pytest.fixture
+def jwks_client():
+    app = Flask(__name__)
+    key = AsymmetricSigningKey(ed25519.Ed25519PrivateKey.generate(), "ed-1")
+    app.register_blueprint(create_jwks_routes(KeyRing(key), max_age=86400))
+    return app.test_client()
+
+
+def test_jwks_publishes_public_keys(jwks_client):
+    response = jwks_client.get("/.well-known/jwks.json")
+    assert response.status_code == 200
+    keys = response.get_json()["keys"]
+    assert [key["kid"] for key in keys] == ["ed-1"]
+    assert "d" not in keys[0]
+
+
+def test_jwks_is_cacheable(jwks_client):
+    response = jwks_client.get("/.well-known/jwks.json")
+    assert response.cache_control.public is True
+    assert response.cache_control.max_age == 86400
+    assert response.headers["ETag"]
+
+
+def test_jwks_conditional_request(jwks_client):
+    etag = jwks_client.get("/.well-known/jwks.json").headers["ETag"]
+    response = jwks_client.get(
+        "/.well-known/jwks.json", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
@@ -0,0 +1,33 @@
+import pytest
+from flask import Flask
+from app.routes.metrics_routes import create_metrics_routes
+from app.utils.errors import register_error_handlers
+
+API_KEY = "metrics-key"
+
+
+@pytest.fixture
+def metrics_client():
+    app = Flask(__name__)
+    register_error_handlers(app)
+    app.register_blueprint(
+        create_metrics_routes({"token_cache": lambda: {"hits": 3}}, API_KEY)
+    )
+    return app.test_client()
+
+
+def test_metrics_route_reports_each_source(metrics_client):
+    response = metrics_client.get("/internal/metrics", headers={"X-API-Key": API_KEY})
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["token_cache"] == {"hits": 3}
+    assert data["pid"] > 0
+    assert response.cache_control.no_store is True
+
+
+@pytest.mark.parametrize("headers", [{}, {"X-API-Key": "wrong-key"}])
+def test_metrics_route_requires_api_key(metrics_client, headers):
+    response = metrics_client.get("/internal/metrics", headers=headers)
+
+    assert response.status_code == 401
@@ -0,0 +1,60 @@
+import json
+from unittest.mock import Mock
+from flask import Flask
+from app.commands.partner_commands import create_partner_commands
+from app.services.partner_import_service import ImportStats
+
+
+def test_import_command_reports_rejects_and_progress(tmp_path):
+    source = tmp_path / "partners.csv"
+    source.write_text("email,firstName\na@example.com,Ann\n")
+    rejects_path = tmp_path / "rejects.ndjson"
+
+    def import_rows(rows, reject, progress, batch_size):
+        assert list(rows) == [(2, {"email": "a@example.com", "firstName": "Ann"})]
+        reject(2, {"email": "a@example.com"}, "Email already exists")
+        stats = ImportStats(processed=1, rejected=1)
+        progress(stats)
+        return stats
+
+    import_service = Mock()
+    import_service.import_rows.side_effect = import_rows
+    app = Flask(__name__)
+    app.cli.add_command(create_partner_commands(import_service, Mock()))
+
+    result = app.test_cli_runner().invoke(
+        args=[
+            "partners",
+            "import",
+            str(source),
+            "--batch-size",
+            "100",
+            "--rejects",
+            str(rejects_path),
+        ]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Imported 0 of 1 rows, rejected 1" in result.output
+    assert json.loads(rejects_path.read_text()) == {
+        "line": 2,
+        "email": "a@example.com",
+        "reason": "Email already exists",
+    }
+
+
+def test_export_command_writes_lines(tmp_path):
+    output = tmp_path / "partners.ndjson"
+    export_service = Mock()
+    export_service.iter_lines.return_value = iter(['{"id": "a"}\n', '{"id": "b"}\n'])
+    app = Flask(__name__)
+    app.cli.add_command(create_partner_commands(Mock(), export_service))
+
+    result = app.test_cli_runner().invoke(
+        args=["partners", "export", "--output", str(output), "--after", "id-0"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Exported 2 lines" in result.output
+    assert output.read_text() == '{"id": "a"}\n{"id": "b"}\n'
+    export_service.iter_lines.assert_called_once_with("ndjson", "id-0", None)
@@ -0,0 +1,61 @@
+import csv
+import io
+import json
+import pytest
+from app.repositories.rental_partner_repository import RentalPartnerRepository
+from app.services.partner_export_service import PartnerExportService
+
+
+@pytest.fixture
+def repository(db_app):
+    repository = RentalPartnerRepository()
+    for name in ("ann", "bob", "cat"):
+        repository.create(f"{name}@example.com", "secret-hash", name, "Doe", "1")
+    return repository
+
+
+@pytest.fixture
+def export_service(repository):
+    return PartnerExportService(repository, batch_size=2)
+
+
+def test_ndjson_export_omits_password_hash(export_service):
+    records = [json.loads(line) for line in export_service.iter_lines("ndjson")]
+
+    assert len(records) == 3
+    assert all("password_hash" not in record for record in records)
+    assert [r["id"] for r in records] == sorted(r["id"] for r in records)
+    assert "T" in records[0]["created_at"]
+
+
+def test_csv_export_has_header_and_rows(export_service):
+    body = "".join(export_service.iter_lines("csv"))
+
+    rows = list(csv.DictReader(io.StringIO(body)))
+    assert len(rows) == 3
+    assert "password_hash" not in rows[0]
+    assert {row["email"] for row in rows} == {
+        "ann@example.com",
+        "bob@example.com",
+        "cat@example.com",
+    }
+
+
+def test_csv_export_of_empty_table_is_just_the_header(db_app):
+    service = PartnerExportService(RentalPartnerRepository())
+    assert list(service.iter_lines("csv")) == [
+        "id,email,first_name,last_name,phone,created_at,updated_at\r\n"
+    ]
+
+
+def test_export_resumes_after_id(export_service):
+    ids = [record["id"] for record in export_service.iter_records()]
+
+    resumed = [record["id"] for record in export_service.iter_records(ids[0])]
+
+    assert resumed == ids[1:]
+
+
+def test_export_rejects_unknown_format(export_service):
+    with pytest.raises(ValueError):
+        list(export_service.iter_lines("xml"))
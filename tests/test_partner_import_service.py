@@ -0,0 +1,136 @@
+import uuid
+import pytest
+from app.repositories.rental_partner_repository import RentalPartnerRepository
+from app.services.partner_import_service import (
+    PartnerImportService,
+    read_csv_rows,
+    read_ndjson_rows,
+    read_rows,
+)
+from app.utils.hashing import BcryptHasher, HasherRegistry
+from app.utils.hashing_executor import HashingExecutor
+from app.utils.security import (
+    configure_password_hashers,
+    get_password_hashers,
+    verify_password,
+)
+
+
+def make_row(email, **overrides):
+    row = {
+        "firstName": "John",
+        "lastName": "Doe",
+        "email": email,
+        "phone": "1234567890",
+        "password": "password123",
+        "confirmPassword": "password123",
+        "agreeToTerms": "true",
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def fast_hashers():
+    previous = get_password_hashers()
+    configure_password_hashers(HasherRegistry(BcryptHasher(rounds=4)))
+    yield
+    configure_password_hashers(previous)
+
+
+@pytest.fixture
+def repository(db_app):
+    return RentalPartnerRepository()
+
+
+@pytest.fixture
+def import_service(repository, fast_hashers):
+    executor = HashingExecutor(max_workers=2, max_queue_size=1)
+    yield PartnerImportService(
+        repository, executor, min_password_length=8, batch_size=2
+    )
+    executor.shutdown()
+
+
+def run_import(import_service, rows):
+    rejects = []
+    progress = []
+    stats = import_service.import_rows(
+        list(enumerate(rows, start=1)),
+        lambda line, row, reason: rejects.append((line, reason)),
+        progress.append,
+    )
+    return stats, rejects, progress
+
+
+def test_imports_valid_rows_in_batches(import_service, repository):
+    rows = [make_row(f"user{i}@example.com") for i in range(5)]
+
+    stats, rejects, progress = run_import(import_service, rows)
+
+    assert (stats.processed, stats.imported, stats.rejected) == (5, 5, 0)
+    assert rejects == []
+    assert len(progress) == 3
+    partner = repository.find_by_email("user4@example.com")
+    assert verify_password("password123", partner.password_hash) is True
+    assert uuid.UUID(partner.id).version == 7
+
+
+def test_rejects_invalid_and_duplicate_rows(import_service, repository):
+    repository.create("taken@example.com", "hash", "A", "B", "1")
+    rows = [
+        make_row("not-an-email"),
+        make_row("short@example.com", password="short", confirmPassword="short"),
+        make_row("terms@example.com", agreeToTerms="false"),
+        None,
+        make_row("ok@example.com"),
+        make_row("OK@example.com"),
+        make_row("taken@example.com"),
+    ]
+
+    stats, rejects, _ = run_import(import_service, rows)
+
+    assert stats.imported == 1
+    reasons = dict(rejects)
+    assert set(reasons) == {1, 2, 3, 4, 6, 7}
+    assert "email" in reasons[1]
+    assert "at least 8" in reasons[2]
+    assert reasons[4] == "Malformed record"
+    assert reasons[6] == "Duplicate email in input"
+    assert reasons[7] == "Email already exists"
+
+
+def test_concurrent_registration_falls_back_to_row_inserts(
+    import_service, repository, mocker
+):
+    repository.create("taken@example.com", "hash", "A", "B", "1")
+    mocker.patch.object(repository, "find_existing_emails", return_value=set())
+    rows = [make_row("taken@example.com"), make_row("new@example.com")]
+
+    stats, rejects, _ = run_import(import_service, rows)
+
+    assert stats.imported == 1
+    assert rejects == [(1, "Email already exists")]
+    assert repository.find_by_email("new@example.com") is not None
+
+
+def test_read_csv_rows():
+    lines = ["email,firstName\n", "a@example.com,Ann\n", "b@example.com,Bob\n"]
+    assert list(read_csv_rows(lines)) == [
+        (2, {"email": "a@example.com", "firstName": "Ann"}),
+        (3, {"email": "b@example.com", "firstName": "Bob"}),
+    ]
+
+
+def test_read_ndjson_rows_flags_malformed_lines():
+    lines = ['{"email": "a@example.com"}\n', "\n", "not json\n", "[1]\n"]
+    assert list(read_ndjson_rows(lines)) == [
+        (1, {"email": "a@example.com"}),
+        (3, None),
+        (4, None),
+    ]
+
+
+def test_read_rows_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        read_rows([], "xml")
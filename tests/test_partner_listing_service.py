@@ -0,0 +1,135 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import event, insert
+from app.models import db
+from app.models.rental_partner import RentalPartner
+from app.repositories.rental_partner_repository import RentalPartnerRepository
+from app.services.partner_listing_service import (
+    PartnerListingService,
+    decode_cursor,
+    encode_cursor,
+)
+from app.utils.errors import ValidationError
+from app.utils.ids import uuid7
+
+START = datetime(2026, 1, 1)
+
+
+@pytest.fixture
+def service(db_app):
+    rows = [
+        {
+            "id": uuid7(),
+            "email": f"user{i}@example.com",
+            "password_hash": "hash",
+            "first_name": "First",
+            "last_name": "Doe" if i % 2 else "Roe",
+            "phone": str(i % 3),
+            # Pairs share a timestamp so ties are broken by id.
+            "created_at": START + timedelta(minutes=i // 2),
+            "updated_at": START,
+        }
+        for i in range(30)
+    ]
+    db.session.execute(insert(RentalPartner), rows)
+    db.session.commit()
+    return PartnerListingService(RentalPartnerRepository(), max_page_size=20)
+
+
+def _all_pages(service, **filters):
+    pages, cursor = [], None
+    while True:
+        page = service.list_partners(limit=7, cursor=cursor, **filters)
+        pages.append(page)
+        cursor = page.nextCursor
+        if cursor is None:
+            return pages
+
+
+def test_pages_cover_every_partner_once_newest_first(service):
+    pages = _all_pages(service)
+    partners = [partner for page in pages for partner in page.partners]
+
+    assert len(pages) == 5
+    assert len({partner.id for partner in partners}) == 30
+    keys = [(partner.createdAt, partner.id) for partner in partners]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_filters_apply_across_pages(service):
+    pages = _all_pages(service, last_name="Doe", created_from=START + timedelta(5))
+    partners = [partner for page in pages for partner in page.partners]
+    assert partners == []
+
+    pages = _all_pages(
+        service, last_name="Doe", created_to=START + timedelta(minutes=10)
+    )
+    partners = [partner for page in pages for partner in page.partners]
+    assert len(partners) == 10
+    assert {partner.lastName for partner in partners} == {"Doe"}
+
+
+def test_page_size_is_capped(service):
+    assert len(service.list_partners(limit=500).partners) == 20
+
+
+def test_invalid_cursor_is_rejected(service):
+    for cursor in ("not-a-cursor", encode_cursor(START, "id-1")):
+        with pytest.raises(ValidationError):
+            service.list_partners(limit=5, cursor=cursor)
+
+
+def test_cursor_round_trip():
+    partner_id = uuid7()
+    assert decode_cursor(encode_cursor(START, partner_id)) == (START, partner_id)
+
+
+def _record_queries(service, pages, **filters):
+    queries = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        queries.append((statement, parameters))
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        cursor = None
+        for _ in range(pages):
+            page = service.list_partners(limit=7, cursor=cursor, **filters)
+            cursor = page.nextCursor
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+    return queries
+
+
+def _query_plan(statement, parameters):
+    connection = db.engine.raw_connection()
+    try:
+        return " ".join(
+            str(row[-1])
+            for row in connection.cursor().execute(
+                "EXPLAIN QUERY PLAN " + statement, parameters
+            )
+        )
+    finally:
+        connection.close()
+
+
+def test_deep_page_seeks_through_the_index(service):
+    queries = _record_queries(service, pages=4)
+
+    deep_statement, deep_parameters = queries[-1]
+    # Same LIMIT as page one and no rows skipped: the cursor does the seeking.
+    assert deep_parameters[-2:] == queries[0][1][-2:] == (8, 0)
+
+    plan = _query_plan(deep_statement, deep_parameters)
+    assert "SEARCH" in plan
+    assert "idx_rental_partners_created_at_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_first_name_filter_seeks_through_its_index(service):
+    queries = _record_queries(service, pages=2, first_name="First")
+
+    plan = _query_plan(*queries[-1])
+    assert "idx_rental_partners_first_name" in plan
+    assert "TEMP B-TREE" not in plan
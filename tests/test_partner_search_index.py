@@ -0,0 +1,165 @@
+import threading
+from datetime import datetime
+from unittest.mock import Mock
+import pytest
+from app.models.rental_partner import RentalPartnerRecord
+from app.repositories.rental_partner_repository import RentalPartnerRepository
+from app.services.partner_search_index import PartnerSearchIndex
+from app.utils.ids import uuid7
+
+PARTNERS = [
+    ("ann@example.com", "Ann", "Lee"),
+    ("annabel@example.com", "Annabel", "Smith"),
+    ("joanna@example.com", "Joanna", "Banner"),
+    ("bob@sample.org", "Bob", "Stone"),
+]
+
+
+def _record(email, first_name, last_name):
+    return RentalPartnerRecord(uuid7(), email, "hash", first_name, last_name, "1")
+
+
+@pytest.fixture
+def repository(db_app):
+    repository = RentalPartnerRepository()
+    repository.create_many([_record(*partner) for partner in PARTNERS])
+    return repository
+
+
+@pytest.fixture
+def index(repository):
+    index = PartnerSearchIndex(repository, sync_interval=60)
+    index.sync()
+    return index
+
+
+def _first_names(hits):
+    return [hit.first_name for hit in hits]
+
+
+def test_ranks_exact_then_prefix_then_substring(index):
+    assert _first_names(index.search("ann")) == ["Ann", "Annabel", "Joanna"]
+
+
+def test_short_queries_match_prefixes(index):
+    assert _first_names(index.search("an")) == ["Ann", "Annabel"]
+    assert _first_names(index.search("b")) == ["Joanna", "Bob"]
+
+
+def test_substring_matches_emails_case_insensitively(index):
+    assert _first_names(index.search("SAMPLE.O")) == ["Bob"]
+    assert index.search("zzz") == []
+    assert index.search("  ") == []
+
+
+def test_limit(index):
+    assert len(index.search("a", limit=2)) == 2
+
+
+def test_add_indexes_new_partners_and_replaces_changed_ones(index):
+    record = _record("carol@example.com", "Carol", "King")
+    index.add([record])
+    assert _first_names(index.search("carol")) == ["Carol"]
+
+    index.add([record._replace(first_name="Caroline")])
+    assert _first_names(index.search("carol")) == ["Caroline"]
+    assert index.metrics()["partners"] == 5
+
+
+def test_sync_picks_up_partners_created_elsewhere(index, repository):
+    repository.create("dave@example.com", "hash", "Dave", "Brown", "1")
+    assert index.search("dave") == []
+
+    index.sync()
+    assert _first_names(index.search("dave")) == ["Dave"]
+
+
+def test_sync_overlap_picks_up_rows_committed_out_of_order(db_app):
+    rows = [
+        [(uuid7(), "nina@example.com", "Nina", "Park", datetime(2030, 1, 1, 0, 0, 10))],
+        [
+            (
+                uuid7(),
+                "oscar@example.com",
+                "Oscar",
+                "Reed",
+                datetime(2030, 1, 1, 0, 0, 5),
+            )
+        ],
+    ]
+    repository = Mock()
+    repository.iter_search_fields.side_effect = lambda since, batch_size: iter(
+        rows.pop(0)
+    )
+    index = PartnerSearchIndex(repository, sync_interval=60, sync_overlap=30)
+
+    index.sync()
+    index.sync()
+
+    assert _first_names(index.search("oscar")) == ["Oscar"]
+    assert repository.iter_search_fields.call_args.kwargs["since"] == datetime(
+        2029, 12, 31, 23, 59, 40
+    )
+
+
+def test_unchanged_rows_reread_by_a_sync_are_skipped(index, mocker):
+    remove = mocker.spy(index._data, "_remove")
+
+    index.sync()
+
+    remove.assert_not_called()
+    assert index.metrics()["partners"] == len(PARTNERS)
+
+
+def test_falls_back_to_database_while_warming(db_app, repository):
+    index = PartnerSearchIndex(repository)
+
+    assert set(_first_names(index.search("ann"))) == {"Ann", "Annabel", "Joanna"}
+    index._warming.join(timeout=5)
+
+    assert index.ready
+    assert _first_names(index.search("ann")) == ["Ann", "Annabel", "Joanna"]
+    metrics = index.metrics()
+    assert metrics["database_searches"] == 1
+    assert metrics["index_searches"] == 1
+
+
+def test_metrics_publish_memory_footprint(index):
+    metrics = index.metrics()
+    assert metrics["ready"] is True
+    assert metrics["partners"] == 4
+    assert metrics["trigrams"] > 0
+    assert metrics["memory_bytes"] > 0
+
+
+def test_memory_footprint_is_tracked_as_partners_change(index):
+    before = index.memory_bytes()
+    record = _record("carol@example.com", "Carol", "King")
+
+    index.add([record])
+    grown = index.memory_bytes()
+    index.add([record])
+
+    assert grown > before
+    assert index.memory_bytes() == grown
+
+
+def test_sync_reads_rows_without_blocking_sign_ups(index):
+    fetching, release = threading.Event(), threading.Event()
+
+    def slow_rows(since, batch_size):
+        fetching.set()
+        release.wait(timeout=5)
+        yield (uuid7(), "erin@example.com", "Erin", "Hall", datetime(2030, 1, 1))
+
+    index.repository = Mock(iter_search_fields=slow_rows)
+    sync = threading.Thread(target=index.sync)
+    sync.start()
+    assert fetching.wait(timeout=5)
+
+    index.add([_record("frank@example.com", "Frank", "Moss")])
+    assert _first_names(index.search("frank")) == ["Frank"]
+
+    release.set()
+    sync.join(timeout=5)
+    assert _first_names(index.search("erin")) == ["Erin"]
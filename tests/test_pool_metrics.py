@@ -0,0 +1,72 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from app.utils.pool_metrics import InstrumentedQueuePool, PoolMetrics
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite://",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.01,
+    )
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def metrics(engine):
+    metrics = PoolMetrics()
+    metrics.instrument(engine)
+    return metrics
+
+
+def test_checkouts_and_occupancy(engine, metrics):
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        snapshot = metrics.snapshot(engine)
+        assert snapshot["checked_out"] == 1
+        assert snapshot["overflow"] == 0
+
+    snapshot = metrics.snapshot(engine)
+    assert snapshot["checkouts"] == 1
+    assert snapshot["connects"] == 1
+    assert snapshot["checked_out"] == 0
+    assert snapshot["checkout_wait_ms_max"] >= 0
+
+
+def test_checkout_timeouts_are_counted(engine, metrics):
+    with engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+    assert metrics.snapshot(engine)["checkout_timeouts"] == 1
+
+
+def test_invalidations_are_counted(engine, metrics):
+    with engine.connect() as connection:
+        connection.invalidate()
+
+    assert metrics.snapshot(engine)["invalidations"] == 1
+
+
+def test_metrics_survive_pool_recreation(engine, metrics):
+    engine.dispose()
+    with engine.connect():
+        pass
+
+    assert engine.pool.metrics is metrics
+    assert metrics.snapshot(engine)["checkouts"] == 1
+
+
+def test_counters_reset_in_forked_worker(engine, metrics, mocker):
+    with engine.connect():
+        pass
+    mocker.patch("app.utils.pool_metrics.os.getpid", return_value=-1)
+
+    snapshot = metrics.snapshot(engine)
+    assert snapshot["checkouts"] == 0
+    assert snapshot["pid"] == -1
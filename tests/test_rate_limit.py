@@ -0,0 +1,103 @@
+import pytest
+from flask import Flask, g
+
+from app.utils.errors import register_error_handlers
+from app.utils.rate_limit import (
+    MemoryRateLimitBackend,
+    SharedMemoryRateLimitBackend,
+    SlidingWindowLimiter,
+    create_rate_limit_backend,
+    client_ip,
+    rate_limit,
+)
+
+
+@pytest.fixture(params=["memory", "shared"])
+def backend(request):
+    return create_rate_limit_backend(request.param, shared_slots=64)
+
+
+def test_limiter_allows_up_to_limit(backend):
+    limiter = SlidingWindowLimiter(backend, limit=3, window_seconds=60)
+    assert [limiter.hit("a", now=600.0) for _ in range(3)] == [0, 0, 0]
+    assert limiter.hit("a", now=600.0) > 0
+    assert limiter.hit("b", now=600.0) == 0
+
+
+def test_limiter_weights_previous_window(backend):
+    limiter = SlidingWindowLimiter(backend, limit=4, window_seconds=60)
+    for _ in range(4):
+        limiter.hit("a", now=600.0)
+
+    # Half of the previous window still overlaps: 4 * 0.5 = 2 counted.
+    assert limiter.hit("a", now=690.0) == 0
+    assert limiter.hit("a", now=690.0) == 0
+    assert limiter.hit("a", now=690.0) > 0
+    # Two windows later nothing is left.
+    assert limiter.hit("a", now=780.0) == 0
+
+
+def test_limiter_retry_after_is_accurate(backend):
+    limiter = SlidingWindowLimiter(backend, limit=2, window_seconds=60)
+    limiter.hit("a", now=600.0)
+    limiter.hit("a", now=600.0)
+
+    retry_after = limiter.hit("a", now=630.0)
+    assert retry_after == pytest.approx(30.0)
+    assert limiter.hit("a", now=630.0 + retry_after + 0.01) == 0
+
+
+def test_rejected_hits_are_not_counted(backend):
+    limiter = SlidingWindowLimiter(backend, limit=1, window_seconds=60)
+    limiter.hit("a", now=600.0)
+    for _ in range(5):
+        limiter.hit("a", now=610.0)
+    assert limiter.hit("a", now=660.0 + 60.0) == 0
+
+
+def test_memory_backend_evicts_least_recent_keys():
+    backend = MemoryRateLimitBackend(max_keys=2)
+    limiter = SlidingWindowLimiter(backend, limit=1, window_seconds=60)
+    limiter.hit("a", now=600.0)
+    limiter.hit("b", now=600.0)
+    limiter.hit("c", now=600.0)
+    assert limiter.hit("a", now=600.0) == 0
+
+
+def test_shared_backend_reuses_slots_when_full():
+    backend = SharedMemoryRateLimitBackend(slots=2)
+    limiter = SlidingWindowLimiter(backend, limit=1, window_seconds=60)
+    for key in ("a", "b", "c", "d"):
+        assert limiter.hit(key, now=600.0) == 0
+
+
+def test_create_backend_rejects_unknown_name():
+    with pytest.raises(ValueError):
+        create_rate_limit_backend("redis", shared_slots=64)
+
+
+def test_rate_limit_decorator_returns_429():
+    app = Flask(__name__)
+    register_error_handlers(app)
+    limiter = SlidingWindowLimiter(MemoryRateLimitBackend(), 1, 60)
+    calls = []
+
+    @app.route("/limited")
+    @rate_limit(limiter, client_ip)
+    def limited():
+        calls.append(1)
+        return "ok"
+
+    client = app.test_client()
+    assert client.get("/limited").status_code == 200
+    response = client.get("/limited")
+    assert response.status_code == 429
+    assert 1 <= int(response.headers["Retry-After"]) <= 120
+    assert len(calls) == 1
+
+
+def test_rate_limit_decorator_is_noop_without_limiter():
+    def view():
+        return "ok"
+
+    assert rate_limit(None, client_ip)(view) is view
@@ -0,0 +1,93 @@
+import os
+from datetime import datetime, timedelta
+import pytest
+from unittest.mock import Mock
+from app.services.registered_email_index import RegisteredEmailIndex
+
+
+@pytest.fixture
+def mock_repository():
+    repository = Mock()
+    repository.iter_emails.return_value = iter(
+        [("Known@Example.com", datetime(2026, 1, 1))]
+    )
+    return repository
+
+
+@pytest.fixture
+def index(mock_repository):
+    return RegisteredEmailIndex(mock_repository, capacity=100, sync_interval=60)
+
+
+def test_unknown_email_is_a_definite_miss(index):
+    assert index.might_exist("unknown@example.com") is False
+    assert index.metrics()["filter_skips"] == 1
+
+
+def test_registered_email_is_normalized(index):
+    assert index.might_exist(" known@example.COM ") is True
+    assert index.metrics()["database_checks"] == 1
+
+
+def test_add_makes_email_visible(index):
+    index.add("new@example.com")
+    assert index.might_exist("new@example.com") is True
+
+
+def test_initial_scan_happens_once(index, mock_repository):
+    index.might_exist("a@example.com")
+    index.might_exist("b@example.com")
+    assert mock_repository.iter_emails.call_count == 1
+
+
+def test_stale_index_syncs_from_watermark(mock_repository):
+    index = RegisteredEmailIndex(mock_repository, capacity=100, sync_interval=0)
+    mock_repository.iter_emails.side_effect = [
+        iter([("a@example.com", datetime(2026, 1, 1))]),
+        iter([("b@example.com", datetime(2026, 1, 2))]),
+    ]
+
+    index.might_exist("x@example.com")
+    assert index.might_exist("b@example.com") is True
+    since = mock_repository.iter_emails.call_args[1]["since"]
+    assert since == datetime(2026, 1, 1) - timedelta(seconds=60)
+
+
+def test_sync_overlap_picks_up_rows_committed_out_of_order(mock_repository):
+    index = RegisteredEmailIndex(
+        mock_repository, capacity=100, sync_interval=60, sync_overlap=30
+    )
+    mock_repository.iter_emails.side_effect = [
+        iter([("later@example.com", datetime(2026, 1, 1, 0, 0, 10))]),
+        iter([("earlier@example.com", datetime(2026, 1, 1, 0, 0, 5))]),
+    ]
+
+    index.sync()
+    index.sync()
+
+    assert index.might_exist("earlier@example.com") is True
+    assert index.metrics()["filter_items"] == 2
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_add_in_forked_worker_is_visible_to_others(index):
+    index.sync()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        index.add("forked@example.com")
+        os._exit(0)
+    os.waitpid(pid, 0)
+
+    assert index.might_exist("forked@example.com") is True
+
+
+def test_saturated_index_is_rebuilt(mock_repository):
+    index = RegisteredEmailIndex(mock_repository, capacity=1, sync_interval=60)
+    index.sync()
+    index.add("extra@example.com")
+    mock_repository.iter_emails.return_value = iter([])
+
+    index.sync()
+
+    assert mock_repository.iter_emails.call_args_list[1][1]["since"] is None
+    assert index.metrics()["filter_items"] == 0
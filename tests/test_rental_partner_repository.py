@@ -1,7 +1,15 @@
+import uuid
 import pytest
 from unittest.mock import Mock
-from app.repositories.rental_partner_repository import RentalPartnerRepository
-from app.models.rental_partner import RentalPartner
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from app.repositories.rental_partner_repository import (
+    RentalPartnerRepository,
+    is_duplicate_email,
+)
+from app.models.base import db
+from app.models.rental_partner import RentalPartner, RentalPartnerRecord
+from app.utils.ids import uuid7
 
 
 @pytest.fixture
@@ -42,22 +50,123 @@ def test_create_rental_partner(repository, mock_partner, mocker):
     mock_session.commit.assert_called_once()
 
 
-def test_find_by_email_exists(repository, mock_partner, mocker):
-    mock_query = mocker.patch(
-        "app.repositories.rental_partner_repository.db.session.query"
-    )
-    mock_query.return_value.filter_by.return_value.first.return_value = mock_partner
+def test_find_by_email_exists(db_app, repository):
+    created = repository.create("test@example.com", "hash", "John", "Doe", "1")
 
     partner = repository.find_by_email("test@example.com")
-    assert partner is not None
-    assert partner.email == "test@example.com"
-
+    assert partner == created
+    assert isinstance(partner, RentalPartnerRecord)
 
-def test_find_by_email_not_exists(repository, mocker):
-    mock_query = mocker.patch(
-        "app.repositories.rental_partner_repository.db.session.query"
-    )
-    mock_query.return_value.filter_by.return_value.first.return_value = None
 
+def test_find_by_email_not_exists(db_app, repository):
     partner = repository.find_by_email("nonexistent@example.com")
     assert partner is None
+
+
+def test_update_password_hash(repository, mocker):
+    mock_session = mocker.patch("app.repositories.rental_partner_repository.db.session")
+
+    repository.update_password_hash("test-id", "test@example.com", "new_hash")
+
+    mock_session.query.return_value.filter_by.assert_called_once_with(id="test-id")
+    mock_session.query.return_value.filter_by.return_value.update.assert_called_once_with(
+        {"password_hash": "new_hash"}
+    )
+    mock_session.commit.assert_called_once()
+
+
+def test_find_by_id(db_app, repository):
+    created = repository.create("test@example.com", "hash", "John", "Doe", "1")
+
+    partner = repository.find_by_id(created.id)
+
+    assert partner == created
+    assert repository.find_by_id("missing-id") is None
+
+
+def test_lookups_select_only_record_columns(repository, count_queries):
+    partner = repository.create("a@example.com", "hash", "A", "B", "1")
+
+    with count_queries() as statements:
+        repository.find_by_id(partner.id)
+
+    assert "created_at" not in statements[0]
+    assert len(db.session.identity_map) == 0
+
+
+def test_iter_emails_since_watermark(db_app, repository):
+    repository.create("a@example.com", "hash", "A", "A", "1")
+    [(email, watermark)] = list(repository.iter_emails())
+    assert email == "a@example.com"
+    repository.create("b@example.com", "hash", "B", "B", "2")
+
+    emails = {email for email, _ in repository.iter_emails(since=watermark)}
+    assert "b@example.com" in emails
+
+
+def test_create_duplicate_email_rolls_back(db_app, repository):
+    repository.create("a@example.com", "hash", "A", "A", "1")
+
+    with pytest.raises(IntegrityError) as error:
+        repository.create("a@example.com", "hash", "B", "B", "2")
+
+    assert is_duplicate_email(error.value)
+
+    assert repository.find_by_email("a@example.com").first_name == "A"
+
+
+@pytest.mark.parametrize(
+    "orig, expected",
+    [
+        ((1062, "Duplicate entry 'a' for key 'rental_partners.email'"), True),
+        ((1062, "Duplicate entry 'a' for key 'idx_rental_partners_email'"), True),
+        ((1062, "Duplicate entry 'x' for key 'rental_partners.PRIMARY'"), False),
+        ((1048, "Column 'email' cannot be null"), False),
+        (("UNIQUE constraint failed: rental_partners.email",), True),
+        (("UNIQUE constraint failed: rental_partners.id",), False),
+    ],
+)
+def test_is_duplicate_email(orig, expected):
+    error = IntegrityError("INSERT", {}, Exception(*orig))
+    assert is_duplicate_email(error) is expected
+
+
+def test_create_issues_only_the_insert(repository, count_queries):
+    with count_queries() as statements:
+        partner = repository.create("a@example.com", "hash", "A", "B", "1")
+        assert partner.email == "a@example.com"
+        assert partner.first_name == "A"
+        assert partner.id
+
+    assert len(statements) == 1
+    assert statements[0].startswith("INSERT INTO rental_partners")
+
+
+def test_reads_and_updates_are_single_statements(repository, count_queries):
+    partner = repository.create("a@example.com", "hash", "A", "B", "1")
+
+    with count_queries() as statements:
+        repository.find_by_email("a@example.com")
+    assert len(statements) == 1
+
+    with count_queries() as statements:
+        repository.update_password_hash(partner.id, partner.email, "new-hash")
+    assert len(statements) == 1
+
+
+def test_ids_are_stored_as_sixteen_bytes(db_app, repository):
+    partner = repository.create("a@example.com", "hash", "A", "B", "1")
+    repository.create_many(
+        [RentalPartnerRecord(uuid7(), "b@example.com", "hash", "B", "B", "2")]
+    )
+
+    rows = db.session.execute(
+        text("SELECT binary_id, id FROM rental_partners ORDER BY email")
+    ).all()
+
+    # The string column is still written for the previous release.
+    assert [bytes(binary_id) for binary_id, _ in rows] == [
+        uuid.UUID(legacy_id).bytes for _, legacy_id in rows
+    ]
+    assert bytes(rows[0].binary_id) == uuid.UUID(partner.id).bytes
+    assert uuid.UUID(partner.id).version == 7
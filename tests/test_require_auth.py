@@ -0,0 +1,73 @@
+import pytest
+from flask import Flask, g
+from app.utils.errors import register_error_handlers
+from app.utils.tokens import TokenMinter, TokenVerifier
+from app.utils.validators import require_auth
+
+SECRET = "test-secret-key-at-least-32-chars-long-for-security"
+
+
+@pytest.fixture
+def minter():
+    return TokenMinter(SECRET, refresh_expiration_hours=720)
+
+
+@pytest.fixture
+def auth_app():
+    app = Flask(__name__)
+    register_error_handlers(app)
+    app.extensions["token_verifier"] = TokenVerifier(SECRET)
+
+    @app.route("/protected")
+    @require_auth()
+    def protected_route():
+        return {"user_id": g.user_id, "type": g.auth_claims["type"]}, 200
+
+    @app.route("/explicit")
+    @require_auth(TokenVerifier("another-secret-key-at-least-32-chars-long"))
+    def explicit_route():
+        return {"user_id": g.user_id}, 200
+
+    return app
+
+
+def test_require_auth_success(auth_app, minter):
+    client = auth_app.test_client()
+    token = minter.mint("test-user-id", 1)
+    response = client.get("/protected", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert response.get_json() == {"user_id": "test-user-id", "type": "access"}
+
+
+def test_require_auth_missing_header(auth_app):
+    client = auth_app.test_client()
+    response = client.get("/protected")
+    assert response.status_code == 401
+    assert "Authorization" in response.get_json()["error"]["message"]
+
+
+def test_require_auth_wrong_scheme(auth_app, minter):
+    client = auth_app.test_client()
+    token = minter.mint("test-user-id", 1)
+    response = client.get("/protected", headers={"Authorization": f"Basic {token}"})
+    assert response.status_code == 401
+
+
+def test_require_auth_invalid_token(auth_app):
+    client = auth_app.test_client()
+    response = client.get("/protected", headers={"Authorization": "Bearer invalid"})
+    assert response.status_code == 401
+
+
+def test_require_auth_rejects_refresh_token(auth_app, minter):
+    client = auth_app.test_client()
+    _, refresh = minter.mint_pair("test-user-id", 1)
+    response = client.get("/protected", headers={"Authorization": f"Bearer {refresh}"})
+    assert response.status_code == 401
+
+
+def test_require_auth_uses_explicit_verifier(auth_app, minter):
+    client = auth_app.test_client()
+    token = minter.mint("test-user-id", 1)
+    response = client.get("/explicit", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 401
@@ -0,0 +1,61 @@
+from datetime import timedelta
+import pytest
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+from app.utils.timezone import now_ist
+
+
+@pytest.fixture
+def repository(db_app):
+    return RevokedTokenRepository()
+
+
+def test_add_and_exists(repository):
+    assert repository.add("jti-1", "token", now_ist() + timedelta(hours=1)) is True
+    assert repository.exists("jti-1") is True
+    assert repository.exists("jti-2") is False
+
+
+def test_add_duplicate_returns_false(repository):
+    expires_at = now_ist() + timedelta(hours=1)
+    assert repository.add("jti-1", "token", expires_at) is True
+    assert repository.add("jti-1", "token", expires_at) is False
+    assert repository.exists("jti-1") is True
+
+
+def test_iter_active_skips_expired(repository):
+    now = now_ist()
+    repository.add("active", "token", now + timedelta(hours=1))
+    repository.add("expired", "token", now - timedelta(hours=1))
+
+    assert [jti for jti, _ in repository.iter_active(now)] == ["active"]
+
+
+def test_iter_active_filters_by_kind(repository):
+    now = now_ist()
+    repository.add("jti-1", "token", now + timedelta(hours=1))
+    repository.add("family-1", "family", now + timedelta(hours=1))
+
+    assert [jti for jti, _ in repository.iter_active(now, kind="family")] == [
+        "family-1"
+    ]
+
+
+def test_iter_active_since_watermark(repository):
+    now = now_ist()
+    repository.add("first", "token", now + timedelta(hours=1))
+    [(_, watermark)] = list(repository.iter_active(now))
+    repository.add("second", "family", now + timedelta(hours=1))
+
+    jtis = {jti for jti, _ in repository.iter_active(now, since=watermark)}
+    assert "second" in jtis
+
+
+def test_delete_expired_in_batches(repository):
+    now = now_ist()
+    for i in range(5):
+        repository.add(f"expired-{i}", "token", now - timedelta(minutes=1))
+    repository.add("active", "token", now + timedelta(hours=1))
+
+    assert repository.delete_expired(now, batch_size=2) == 5
+    assert repository.exists("active") is True
+    assert repository.exists("expired-0") is False
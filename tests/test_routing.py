@@ -0,0 +1,115 @@
+import pytest
+from flask import Flask
+from app.models import db, RentalPartner
+from app.models.routing import ReplicaRouter
+from app.repositories.rental_partner_repository import RentalPartnerRepository
+from app.utils.ids import uuid7
+
+
+def test_router_round_robins_healthy_replicas():
+    router = ReplicaRouter(["a", "b"])
+    assert {router.choose(), router.choose()} == {"a", "b"}
+
+    router.mark_unhealthy("a")
+    assert [router.choose(), router.choose()] == ["b", "b"]
+
+    router.mark_unhealthy("b")
+    assert router.choose() is None
+    assert router.metrics()["unhealthy"] == ["a", "b"]
+
+
+def test_router_unhealthy_replica_is_retried_later(mocker):
+    clock = mocker.patch("app.models.routing.time.monotonic", return_value=100.0)
+    router = ReplicaRouter(["a"], retry_seconds=30)
+    router.mark_unhealthy("a")
+    assert router.choose() is None
+
+    clock.return_value = 131.0
+    assert router.choose() == "a"
+
+
+def test_router_remembers_recent_writes(mocker):
+    clock = mocker.patch("app.models.routing.time.monotonic", return_value=100.0)
+    router = ReplicaRouter(["a"], stickiness_seconds=5)
+    router.record_write("New@Example.com")
+
+    assert router.recently_written("new@example.com") is True
+    clock.return_value = 106.0
+    assert router.recently_written("new@example.com") is False
+
+
+@pytest.fixture
+def replica_app():
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    app.config["SQLALCHEMY_BINDS"] = {"replica_0": "sqlite://"}
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        replica = db.engines["replica_0"]
+        RentalPartner.__table__.create(replica)
+        router = ReplicaRouter(["replica_0"])
+        router.watch("replica_0", replica)
+        app.extensions["replica_router"] = router
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+def _insert_on_replica(email, first_name):
+    with db.engines["replica_0"].begin() as connection:
+        connection.execute(
+            RentalPartner.__table__.insert().values(
+                id=uuid7(),
+                email=email,
+                password_hash="hash",
+                first_name=first_name,
+                last_name="Doe",
+                phone="1",
+                created_at=db.func.now(),
+                updated_at=db.func.now(),
+            )
+        )
+
+
+def test_reads_go_to_replica(replica_app):
+    _insert_on_replica("a@example.com", "Replica")
+
+    partner = RentalPartnerRepository().find_by_email("a@example.com")
+
+    assert partner.first_name == "Replica"
+    assert replica_app.extensions["replica_router"].metrics()["replica_reads"] == 1
+
+
+def test_reads_after_a_write_go_to_primary(replica_app):
+    repository = RentalPartnerRepository()
+    repository.create("a@example.com", "hash", "Primary", "Doe", "1")
+    _insert_on_replica("a@example.com", "Replica")
+
+    assert repository.find_by_email("a@example.com").first_name == "Primary"
+
+    db.session.remove()
+    assert repository.find_by_email("a@example.com").first_name == "Primary"
+
+
+def test_replica_miss_is_confirmed_on_primary(replica_app):
+    repository = RentalPartnerRepository()
+    created = repository.create("a@example.com", "hash", "Primary", "Doe", "1")
+    db.session.remove()
+    replica_app.extensions["replica_router"].stickiness_seconds = 0
+    replica_app.extensions["replica_router"].record_write(created.id)
+
+    assert repository.find_by_id(created.id).first_name == "Primary"
+
+
+def test_failing_replica_falls_back_and_is_skipped(replica_app):
+    RentalPartner.__table__.drop(db.engines["replica_0"])
+    repository = RentalPartnerRepository()
+    repository.create("a@example.com", "hash", "Primary", "Doe", "1")
+    db.session.remove()
+    router = replica_app.extensions["replica_router"]
+    router.stickiness_seconds = 0
+    router.record_write("a@example.com")
+
+    assert repository.find_by_email("b@example.com") is None
+    assert router.metrics()["unhealthy"] == ["replica_0"]
@@ -1,7 +1,18 @@
 import pytest
-import jwt
-from datetime import datetime, timedelta
-from app.utils.security import hash_password, verify_password, generate_token
+from unittest.mock import Mock
+from app.utils.hashing_executor import HashingExecutor
+from app.utils.security import (
+    hash_password,
+    verify_password,
+    configure_hashing_executor,
+    get_hashing_executor,
+    configure_password_hashers,
+    get_password_hashers,
+    password_needs_rehash,
+    verify_dummy_password,
+    start_hash_password,
+)
+from app.utils.hashing import BcryptHasher, HasherRegistry
 
 
 def test_hash_password():
@@ -23,31 +34,54 @@ def test_verify_password_incorrect():
     assert verify_password("wrong_password", hashed) is False
 
 
-def test_generate_token():
-    user_id = "test-user-id"
-    secret = "test-secret-key-at-least-32-chars-long-for-security"
-    expiration = 24
+def test_hashing_runs_on_configured_executor():
+    executor = HashingExecutor(max_workers=1)
+    configure_hashing_executor(executor)
+    try:
+        hashed = hash_password("test_password")
+        assert verify_password("test_password", hashed) is True
+        assert executor.metrics()["completed"] == 2
+        assert get_hashing_executor() is executor
+    finally:
+        configure_hashing_executor(None)
 
-    token = generate_token(user_id, secret, expiration)
-    assert token is not None
-    assert len(token) > 0
 
-    decoded = jwt.decode(token, secret, algorithms=["HS256"])
-    assert decoded["user_id"] == user_id
-    assert "exp" in decoded
-    assert "iat" in decoded
+def test_pending_hash_runs_on_executor():
+    executor = HashingExecutor(max_workers=1)
+    configure_hashing_executor(executor)
+    try:
+        pending = start_hash_password("test_password")
+        assert verify_password("test_password", pending.result()) is True
+    finally:
+        configure_hashing_executor(None)
 
 
-def test_generate_token_expiration():
-    user_id = "test-user-id"
-    secret = "test-secret-key-at-least-32-chars-long-for-security"
-    expiration = 1
+def test_pending_hash_without_executor_hashes_on_result():
+    pending = start_hash_password("test_password")
+    pending.cancel()
+    assert verify_password("test_password", pending.result()) is True
 
-    token = generate_token(user_id, secret, expiration)
-    decoded = jwt.decode(token, secret, algorithms=["HS256"])
 
-    exp_time = datetime.fromtimestamp(decoded["exp"])
-    iat_time = datetime.fromtimestamp(decoded["iat"])
-    diff = exp_time - iat_time
+def test_password_needs_rehash_follows_configured_policy():
+    previous = get_password_hashers()
+    legacy = BcryptHasher(rounds=4).hash("test_password")
+    configure_password_hashers(HasherRegistry(BcryptHasher(rounds=5)))
+    try:
+        assert password_needs_rehash(legacy) is True
+        assert verify_password("test_password", legacy) is True
+        assert password_needs_rehash(hash_password("test_password")) is False
+    finally:
+        configure_password_hashers(previous)
 
-    assert diff.total_seconds() == pytest.approx(3600, rel=1)
+
+def test_verify_dummy_password_does_the_work_and_fails():
+    previous = get_password_hashers()
+    hasher = BcryptHasher(rounds=4)
+    hasher.verify = Mock(wraps=hasher.verify)
+    configure_password_hashers(HasherRegistry(hasher))
+    try:
+        assert verify_dummy_password("test_password") is False
+        assert verify_dummy_password("test_password") is False
+        assert hasher.verify.call_count == 2
+    finally:
+        configure_password_hashers(previous)
@@ -0,0 +1,69 @@
+import runpy
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.serving import _prime_pool, drain_worker, prepare_master, warm_worker
+
+
+def test_prepare_master_preloads_indexes_and_freezes_heap(db_app, mocker):
+    freeze = mocker.patch("app.serving.gc.freeze")
+    revocation_service, search_index = Mock(), Mock()
+    revocation_service.sync.side_effect = OperationalError("SELECT", {}, Exception())
+    db_app.extensions.update(
+        revocation_service=revocation_service,
+        email_index=None,
+        search_index=search_index,
+    )
+
+    prepare_master(db_app)
+
+    revocation_service.sync.assert_called_once_with()
+    search_index.sync.assert_called_once_with()
+    freeze.assert_called_once_with()
+
+
+def test_warm_worker_primes_pool_and_hashing(db_app, mocker):
+    prime_pool = mocker.patch("app.serving._prime_pool")
+    verify = mocker.patch("app.serving.verify_dummy_password")
+
+    warm_worker(db_app, connections=4)
+
+    assert prime_pool.call_args.args[1] == 4
+    verify.assert_called_once()
+
+
+def test_prime_pool_returns_connections_and_stops_on_error():
+    engine = Mock()
+    connection = Mock()
+    engine.connect.side_effect = [
+        connection,
+        OperationalError("SELECT", {}, Exception()),
+    ]
+
+    _prime_pool(engine, 3)
+
+    assert engine.connect.call_count == 2
+    connection.close.assert_called_once_with()
+
+
+def test_drain_worker_shuts_down_hashing_pool(db_app):
+    hashing_executor = Mock()
+    db_app.extensions["hashing_executor"] = hashing_executor
+
+    drain_worker(db_app)
+
+    hashing_executor.shutdown.assert_called_once_with(wait=True)
+
+
+def test_gunicorn_settings_come_from_config(test_config, monkeypatch):
+    test_config.WEB_CONCURRENCY = 3
+    monkeypatch.setattr("app.config.get_settings", lambda: test_config)
+
+    settings = runpy.run_path("gunicorn.conf.py")
+
+    assert settings["workers"] == 3
+    assert settings["preload_app"] is True
+    assert settings["worker_class"] == "gthread"
+    assert settings["max_requests"] > 0
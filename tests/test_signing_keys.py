@@ -0,0 +1,128 @@
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from app.utils.signing_keys import (
+    AsymmetricSigningKey,
+    HmacSigningKey,
+    KeyRing,
+    load_key_ring,
+    parse_key_spec,
+)
+
+SECRET = "test-secret-key-at-least-32-chars-long-for-security"
+
+
+def _pem(private_key):
+    return private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+
+@pytest.fixture
+def ed25519_key():
+    return ed25519.Ed25519PrivateKey.generate()
+
+
+@pytest.fixture
+def rsa_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def test_hmac_key_signs_like_pyjwt():
+    key = HmacSigningKey(SECRET)
+    token = jwt.encode({"a": 1}, SECRET, algorithm="HS256")
+    signing_input, _, signature = token.rpartition(".")
+    assert jwt.utils.base64url_encode(key.sign(signing_input.encode())) == (
+        signature.encode()
+    )
+    assert key.header == {"alg": "HS256", "typ": "JWT"}
+    assert key.to_jwk() is None
+
+
+def test_ed25519_key(ed25519_key):
+    key = AsymmetricSigningKey(ed25519_key, "ed-1")
+    assert key.algorithm == "EdDSA"
+    assert key.header == {"alg": "EdDSA", "typ": "JWT", "kid": "ed-1"}
+
+    jwk = key.to_jwk()
+    assert jwk["kty"] == "OKP"
+    assert jwk["kid"] == "ed-1"
+    assert jwk["use"] == "sig"
+    assert "d" not in jwk
+
+
+def test_rsa_key_from_pem(rsa_key):
+    key = AsymmetricSigningKey.from_pem(_pem(rsa_key), "rsa-1")
+    assert key.algorithm == "RS256"
+    jwk = key.to_jwk()
+    assert jwk["kty"] == "RSA"
+    assert jwk["alg"] == "RS256"
+    assert "d" not in jwk
+
+
+def test_unsupported_key_type():
+    with pytest.raises(ValueError, match="Ed25519 or RSA"):
+        AsymmetricSigningKey(ec.generate_private_key(ec.SECP256R1()), "ec-1")
+
+
+def test_key_ring_lookup(ed25519_key):
+    hmac_key = HmacSigningKey(SECRET)
+    ed_key = AsymmetricSigningKey(ed25519_key, "ed-1")
+    ring = KeyRing(ed_key, [hmac_key])
+
+    assert ring.key_for("ed-1") is ed_key
+    assert ring.key_for(None) is hmac_key
+    assert ring.key_for("unknown") is None
+    assert [jwk["kid"] for jwk in ring.jwks()["keys"]] == ["ed-1"]
+
+
+def test_parse_key_spec():
+    assert parse_key_spec(" a=/keys/a.pem , b=/keys/b.pem,") == [
+        ("a", "/keys/a.pem"),
+        ("b", "/keys/b.pem"),
+    ]
+    assert parse_key_spec("") == []
+
+
+def test_parse_key_spec_invalid():
+    with pytest.raises(ValueError, match="expected kid=path"):
+        parse_key_spec("/keys/a.pem")
+
+
+def test_load_key_ring_hmac_only():
+    ring = load_key_ring(SECRET)
+    assert isinstance(ring.active, HmacSigningKey)
+    assert ring.jwks() == {"keys": []}
+
+
+def test_load_key_ring_with_rotation(tmp_path, ed25519_key, rsa_key):
+    (tmp_path / "new.pem").write_bytes(_pem(ed25519_key))
+    (tmp_path / "old.pem").write_bytes(_pem(rsa_key))
+    spec = f"new={tmp_path / 'new.pem'},old={tmp_path / 'old.pem'}"
+
+    ring = load_key_ring(SECRET, spec)
+    assert ring.active.kid == "new"
+    assert ring.key_for(None) is not None
+    assert {jwk["kid"] for jwk in ring.jwks()["keys"]} == {"new", "old"}
+
+    ring = load_key_ring(SECRET, spec, active_kid="old")
+    assert ring.active.kid == "old"
+
+
+def test_load_key_ring_can_stop_accepting_hmac(tmp_path, ed25519_key):
+    (tmp_path / "new.pem").write_bytes(_pem(ed25519_key))
+    spec = f"new={tmp_path / 'new.pem'}"
+
+    assert load_key_ring(SECRET, spec).key_for(None) is not None
+    ring = load_key_ring(SECRET, spec, accept_hmac=False)
+    assert ring.key_for(None) is None
+    assert [key.kid for key in ring.keys] == ["new"]
+
+
+def test_load_key_ring_unknown_active_kid(tmp_path, ed25519_key):
+    (tmp_path / "new.pem").write_bytes(_pem(ed25519_key))
+    with pytest.raises(ValueError, match="not configured"):
+        load_key_ring(SECRET, f"new={tmp_path / 'new.pem'}", active_kid="other")
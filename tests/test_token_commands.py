@@ -0,0 +1,18 @@
+from unittest.mock import Mock
+from flask import Flask
+from app.commands.token_commands import create_token_commands
+
+
+def test_sweep_command():
+    revocation_service = Mock()
+    revocation_service.sweep_expired.return_value = 7
+    app = Flask(__name__)
+    app.cli.add_command(create_token_commands(revocation_service))
+
+    result = app.test_cli_runner().invoke(
+        args=["tokens", "sweep", "--batch-size", "10"]
+    )
+
+    assert result.exit_code == 0
+    assert "Deleted 7 expired revocations" in result.output
+    revocation_service.sweep_expired.assert_called_once_with(10)
@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+import pytest
+from unittest.mock import Mock
+from app.services.token_revocation_service import TokenRevocationService
+
+
+@pytest.fixture
+def mock_repository():
+    repository = Mock()
+    repository.iter_active.return_value = iter([])
+    return repository
+
+
+@pytest.fixture
+def service(mock_repository):
+    return TokenRevocationService(mock_repository, capacity=100, sync_interval=60)
+
+
+def test_filter_miss_skips_database(service, mock_repository):
+    assert service.is_revoked("jti-1") is False
+    mock_repository.exists.assert_not_called()
+    assert service.metrics()["filter_skips"] == 1
+
+
+def test_filter_hit_is_confirmed_in_database(service, mock_repository):
+    mock_repository.iter_active.return_value = iter([("jti-1", datetime(2026, 1, 1))])
+    mock_repository.exists.return_value = True
+
+    assert service.is_revoked("jti-1") is True
+    mock_repository.exists.assert_called_once_with("jti-1")
+    assert service.metrics()["database_checks"] == 1
+
+
+def test_initial_sync_happens_once(service, mock_repository):
+    service.is_revoked("a")
+    service.is_revoked("b")
+    assert mock_repository.iter_active.call_count == 1
+
+
+def test_stale_filter_syncs_from_watermark(mock_repository, mocker):
+    service = TokenRevocationService(mock_repository, capacity=100, sync_interval=0)
+    watermark = datetime(2026, 1, 1)
+    mock_repository.iter_active.side_effect = [
+        iter([("jti-1", watermark)]),
+        iter([("jti-2", datetime(2026, 1, 2))]),
+        iter([]),
+    ]
+
+    service.is_revoked("x")
+    service.is_revoked("y")
+
+    sync_args = mock_repository.iter_active.call_args[1]
+    assert sync_args["since"] == watermark - timedelta(seconds=60)
+    assert sync_args["kind"] == "family"
+    mock_repository.exists.return_value = True
+    assert service.is_revoked("jti-2") is True
+
+
+def test_full_sync_rebuilds_filter(service, mock_repository):
+    service.revoke_family("family-1", 1700000000)
+    service.sync(full=True)
+    assert service.is_revoked("family-1") is False
+    assert mock_repository.iter_active.call_args_list[0][1]["since"] is None
+
+
+def test_sync_overlap_picks_up_revocations_committed_out_of_order(
+    service, mock_repository
+):
+    mock_repository.iter_active.side_effect = [
+        iter([("family-2", datetime(2026, 1, 1, 0, 0, 10))]),
+        iter([("family-1", datetime(2026, 1, 1, 0, 0, 5))]),
+    ]
+    mock_repository.exists.return_value = True
+
+    service.sync()
+    service.sync()
+
+    assert service.is_revoked("family-1") is True
+
+
+def test_consume_records_without_filling_filter(service, mock_repository):
+    mock_repository.add.return_value = True
+
+    assert service.consume("jti-1", 1700000000) is True
+    assert mock_repository.add.call_args[0][:2] == ("jti-1", "token")
+    assert service.metrics()["filter_items"] == 0
+
+
+def test_consume_reused_token(service, mock_repository):
+    mock_repository.add.return_value = False
+    assert service.consume("jti-1", 1700000000) is False
+
+
+def test_revoke_family(service, mock_repository):
+    mock_repository.exists.return_value = True
+    service.revoke_family("family-1", 1700000000)
+    assert mock_repository.add.call_args[0][:2] == ("family-1", "family")
+    assert service.is_revoked("family-1") is True
+
+
+def test_sweep_expired(service, mock_repository):
+    mock_repository.delete_expired.return_value = 3
+    assert service.sweep_expired(batch_size=50) == 3
+    assert mock_repository.delete_expired.call_args[0][1] == 50
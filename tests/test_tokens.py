@@ -0,0 +1,220 @@
+import uuid
+import jwt
+import pytest
+from app.utils.errors import UnauthorizedError
+from app.utils.signing_keys import AsymmetricSigningKey, HmacSigningKey, KeyRing
+from app.utils.tokens import TokenMinter, TokenVerifier
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+SECRET = "test-secret-key-at-least-32-chars-long-for-security"
+
+
+@pytest.fixture
+def minter():
+    return TokenMinter(SECRET, refresh_expiration_hours=720)
+
+
+def test_mint_matches_pyjwt_encoding(minter, mocker):
+    mocker.patch("app.utils.tokens.uuid.uuid4", return_value=uuid.UUID(int=1))
+    token = minter.mint("test-user-id", 24, issued_at=1700000000)
+    expected = jwt.encode(
+        {
+            "user_id": "test-user-id",
+            "type": "access",
+            "jti": uuid.UUID(int=1).hex,
+            "exp": 1700000000 + 24 * 3600,
+            "iat": 1700000000,
+        },
+        SECRET,
+        algorithm="HS256",
+    )
+    assert token == expected
+
+
+def test_mint_is_verifiable(minter):
+    decoded = jwt.decode(minter.mint("test-user-id", 1), SECRET, algorithms=["HS256"])
+    assert decoded["user_id"] == "test-user-id"
+    assert decoded["exp"] - decoded["iat"] == 3600
+
+
+def test_mint_pair_uses_one_timestamp(minter, mocker):
+    mocker.patch("app.utils.tokens.time.time", return_value=1700000000.5)
+
+    access, refresh = minter.mint_pair("test-user-id", 24)
+
+    access_claims = jwt.decode(
+        access, SECRET, algorithms=["HS256"], options={"verify_exp": False}
+    )
+    refresh_claims = jwt.decode(
+        refresh, SECRET, algorithms=["HS256"], options={"verify_exp": False}
+    )
+    assert access_claims["type"] == "access"
+    assert refresh_claims["type"] == "refresh"
+    assert access_claims["jti"] != refresh_claims["jti"]
+    assert "fam" not in access_claims
+    assert refresh_claims["fam"]
+    assert access_claims["iat"] == refresh_claims["iat"] == 1700000000
+    assert access_claims["exp"] == 1700000000 + 24 * 3600
+    assert refresh_claims["exp"] == 1700000000 + 720 * 3600
+
+
+def test_mint_rejects_wrong_secret(minter):
+    with pytest.raises(jwt.InvalidSignatureError):
+        jwt.decode(minter.mint("test-user-id", 1), "other-secret", algorithms=["HS256"])
+
+
+@pytest.fixture
+def verifier():
+    return TokenVerifier(SECRET, cache_size=2)
+
+
+def test_verify_returns_claims(minter, verifier):
+    claims = verifier.verify(minter.mint("test-user-id", 1))
+    assert claims["user_id"] == "test-user-id"
+    assert claims["type"] == "access"
+
+
+def test_verify_caches_verified_tokens(minter, verifier, mocker):
+    token = minter.mint("test-user-id", 1)
+    decode = mocker.spy(jwt, "decode")
+
+    verifier.verify(token)
+    verifier.verify(token)
+
+    assert decode.call_count == 1
+    assert verifier.metrics()["hits"] == 1
+    assert verifier.metrics()["misses"] == 1
+
+
+def test_verify_returns_copy_of_cached_claims(minter, verifier):
+    token = minter.mint("test-user-id", 1)
+    verifier.verify(token)["user_id"] = "tampered"
+    assert verifier.verify(token)["user_id"] == "test-user-id"
+
+
+def test_verify_evicts_least_recently_used(minter, verifier):
+    for user_id in ("a", "b", "c"):
+        verifier.verify(minter.mint(user_id, 1))
+    assert verifier.metrics()["size"] == 2
+
+
+def test_verify_drops_cached_token_at_expiry(minter, verifier, mocker):
+    token = minter.mint("test-user-id", 1, issued_at=1700000000)
+    mocker.patch("app.utils.tokens.time.time", return_value=1700000000)
+    decode = mocker.patch(
+        "app.utils.tokens.jwt.decode",
+        return_value={
+            "user_id": "test-user-id",
+            "type": "access",
+            "jti": uuid.UUID(int=1).hex,
+            "exp": 1700003600,
+            "iat": 1700000000,
+        },
+    )
+    verifier.verify(token)
+
+    mocker.patch("app.utils.tokens.time.time", return_value=1700003600)
+    decode.side_effect = jwt.ExpiredSignatureError("expired")
+    with pytest.raises(UnauthorizedError):
+        verifier.verify(token)
+    assert decode.call_count == 2
+
+
+def test_verify_expired_entries_are_evicted_on_insert(minter, verifier, mocker):
+    mocker.patch("app.utils.tokens.time.time", return_value=1700000000)
+    verifier._remember(b"old", {"exp": 1699999999})
+    verifier._remember(b"new", {"exp": 1700003600})
+    assert verifier.metrics()["size"] == 1
+
+
+def test_verify_rejects_invalid_token(verifier):
+    with pytest.raises(UnauthorizedError, match="Invalid or expired token"):
+        verifier.verify("not-a-token")
+
+
+def test_verify_rejects_expired_token(minter, verifier):
+    token = minter.mint("test-user-id", 1, issued_at=1000000000)
+    with pytest.raises(UnauthorizedError):
+        verifier.verify(token)
+
+
+def test_verify_rejects_wrong_token_type(minter, verifier):
+    _, refresh = minter.mint_pair("test-user-id", 1)
+    with pytest.raises(UnauthorizedError):
+        verifier.verify(refresh)
+    assert verifier.verify(refresh, token_type="refresh")["type"] == "refresh"
+
+
+@pytest.fixture
+def ed25519_signing_key():
+    return AsymmetricSigningKey(ed25519.Ed25519PrivateKey.generate(), "ed-1")
+
+
+def test_mint_with_asymmetric_key_sets_kid(ed25519_signing_key):
+    minter = TokenMinter(KeyRing(ed25519_signing_key), refresh_expiration_hours=720)
+    token = minter.mint("test-user-id", 1)
+
+    assert jwt.get_unverified_header(token) == {
+        "alg": "EdDSA",
+        "kid": "ed-1",
+        "typ": "JWT",
+    }
+    decoded = jwt.decode(
+        token, ed25519_signing_key.verification_key, algorithms=["EdDSA"]
+    )
+    assert decoded["user_id"] == "test-user-id"
+
+
+def test_mint_with_rsa_key_matches_pyjwt(mocker):
+    mocker.patch("app.utils.tokens.uuid.uuid4", return_value=uuid.UUID(int=1))
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    minter = TokenMinter(
+        KeyRing(AsymmetricSigningKey(private_key, "rsa-1")),
+        refresh_expiration_hours=720,
+    )
+    token = minter.mint("test-user-id", 1, issued_at=1700000000)
+    expected = jwt.encode(
+        {
+            "user_id": "test-user-id",
+            "type": "access",
+            "jti": uuid.UUID(int=1).hex,
+            "exp": 1700003600,
+            "iat": 1700000000,
+        },
+        private_key,
+        algorithm="RS256",
+        headers={"kid": "rsa-1"},
+    )
+    assert token == expected
+
+
+def test_verify_selects_key_by_kid(ed25519_signing_key):
+    old_key = AsymmetricSigningKey(ed25519.Ed25519PrivateKey.generate(), "ed-0")
+    hmac_key = HmacSigningKey(SECRET)
+    ring = KeyRing(ed25519_signing_key, [old_key, hmac_key])
+    verifier = TokenVerifier(ring)
+
+    for key in (ed25519_signing_key, old_key, hmac_key):
+        token = TokenMinter(KeyRing(key), 720).mint("test-user-id", 1)
+        assert verifier.verify(token)["user_id"] == "test-user-id"
+
+
+def test_verify_rejects_unknown_kid(ed25519_signing_key):
+    verifier = TokenVerifier(KeyRing(ed25519_signing_key))
+    other = AsymmetricSigningKey(ed25519.Ed25519PrivateKey.generate(), "ed-x")
+    token = TokenMinter(KeyRing(other), 720).mint("test-user-id", 1)
+    with pytest.raises(UnauthorizedError):
+        verifier.verify(token)
+
+
+def test_verify_rejects_key_substitution(ed25519_signing_key):
+    other = AsymmetricSigningKey(ed25519.Ed25519PrivateKey.generate(), "ed-1")
+    token = TokenMinter(KeyRing(other), 720).mint("test-user-id", 1)
+    with pytest.raises(UnauthorizedError):
+        TokenVerifier(KeyRing(ed25519_signing_key)).verify(token)
+
+
+def test_mint_pair_keeps_rotation_family(minter):
+    _, refresh = minter.mint_pair("test-user-id", 1, family_id="family-1")
+    claims = jwt.decode(refresh, SECRET, algorithms=["HS256"])
+    assert claims["fam"] == "family-1"
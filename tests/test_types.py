@@ -0,0 +1,20 @@
+import uuid
+from sqlalchemy.dialects import mysql
+from app.models.types import BinaryUUID
+
+PARTNER_ID = "0190a000-0000-7000-8000-000000000001"
+
+
+def test_binds_packed_bytes():
+    binary_uuid = BinaryUUID()
+    assert binary_uuid.process_bind_param(PARTNER_ID, mysql.dialect()) == (
+        uuid.UUID(PARTNER_ID).bytes
+    )
+    assert binary_uuid.process_bind_param(None, mysql.dialect()) is None
+
+
+def test_reads_canonical_string():
+    binary_uuid = BinaryUUID()
+    packed = uuid.UUID(PARTNER_ID).bytes
+    assert binary_uuid.process_result_value(packed, mysql.dialect()) == PARTNER_ID
+    assert binary_uuid.process_result_value(None, mysql.dialect()) is None
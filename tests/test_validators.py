@@ -2,7 +2,7 @@ import pytest
 import json
 from flask import Flask, g
 from pydantic import BaseModel
-from app.utils.validators import validate_json
+from app.utils.validators import body_adapter, validate_json
 from app.utils.errors import ValidationError, register_error_handlers
 
 
@@ -19,7 +19,7 @@ def test_app():
     @app.route("/test", methods=["POST"])
     @validate_json(SampleSchema)
     def test_route():
-        return {"data": g.validated_json}, 200
+        return {"data": g.validated_body.model_dump()}, 200
 
     return app
 
@@ -71,3 +71,41 @@ def test_validate_json_malformed_json(test_app):
         "/test", data="{invalid json}", content_type="application/json"
     )
     assert response.status_code == 400
+    assert response.get_json()["error"]["message"] == "Invalid JSON format"
+
+
+@pytest.mark.parametrize("body", ["null", "[1, 2]", '"name"'])
+def test_validate_json_rejects_non_object_bodies(test_app, body):
+    client = test_app.test_client()
+    response = client.post("/test", data=body, content_type="application/json")
+    assert response.status_code == 400
+    message = response.get_json()["error"]["message"]
+    assert message == "Request body must contain valid JSON"
+
+
+def test_validate_json_reports_each_invalid_field(test_app):
+    client = test_app.test_client()
+    response = client.post("/test", json={"age": "old"})
+    message = response.get_json()["error"]["message"]
+    assert message == (
+        "name: Field required; "
+        "age: Input should be a valid integer, unable to parse string as an integer"
+    )
+
+
+def test_validate_json_stores_typed_model(test_app):
+    seen = []
+
+    @test_app.route("/typed", methods=["POST"])
+    @validate_json(SampleSchema)
+    def typed_route():
+        seen.append(g.validated_body)
+        return {}, 200
+
+    test_app.test_client().post("/typed", json={"name": "John", "age": "30"})
+
+    assert seen == [SampleSchema(name="John", age=30)]
+
+
+def test_body_adapter_is_built_once_per_schema():
+    assert body_adapter(SampleSchema) is body_adapter(SampleSchema)